@@ -0,0 +1,212 @@
+# automation_framework/src/ai_module/analyzers/analysis_cache.py
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Volatile parts of error messages, replaced before hashing (applied in order)
+VOLATILE_PATTERNS = [
+    # Native driver stack traces appended to Selenium messages differ per build
+    (re.compile(r"\n?Stacktrace:.*", re.DOTALL), ""),
+    (re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?"), "<timestamp>"),
+    (re.compile(r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b", re.IGNORECASE), "<uuid>"),
+    (re.compile(r"0x[0-9a-f]+", re.IGNORECASE), "<address>"),
+    # Session IDs and element references
+    (re.compile(r"\b(?=[0-9a-f.]*\d)[0-9a-f]{16,}(?:\.[0-9a-f]+)*\b", re.IGNORECASE), "<id>"),
+    (re.compile(r"\b(localhost|127\.0\.0\.1):\d+"), r"\1:<port>"),
+    (re.compile(r"\b\d+ polls\b"), "<n> polls"),
+    (re.compile(r"\b\d+\.\d+"), "<number>"),
+    (re.compile(r"\b\d{5,}\b"), "<number>"),
+]
+
+# Innermost stack frames included in the signature
+SIGNATURE_FRAMES = 5
+
+_FRAME_PATTERN = re.compile(r'File "([^"]+)", line \d+, in (\S+)')
+
+def normalize_message(message):
+    """
+    Strip volatile tokens (timestamps, IDs, addresses, ports, timings) from an error message
+
+    Args:
+        message (str): Error message
+
+    Returns:
+        str: Message that is stable across runs of the same failure
+    """
+    message = message or ""
+    for pattern, replacement in VOLATILE_PATTERNS:
+        message = pattern.sub(replacement, message)
+    return " ".join(message.split())
+
+def top_frames(stack_trace, limit=SIGNATURE_FRAMES):
+    """
+    Innermost frames of a Python traceback as 'file:function', without line numbers
+
+    Args:
+        stack_trace (str): Formatted traceback
+        limit (int): Number of frames
+
+    Returns:
+        list: Frames, innermost last
+    """
+    frames = [f"{Path(file).name}:{function}" for file, function in _FRAME_PATTERN.findall(stack_trace or "")]
+    return frames[-limit:]
+
+def failure_signature(failure_data, model, prompt_version):
+    """
+    Cache key of a failure: the same failure analyzed by the same model and prompt
+    gets the same signature in every run
+
+    Args:
+        failure_data (dict): Failure as recorded in failures.json
+        model (str): Model name
+        prompt_version (str): Version of the analysis prompt
+
+    Returns:
+        str: Hex digest
+    """
+    parts = [
+        failure_data.get("error_type") or "",
+        normalize_message(failure_data.get("error_message")),
+        *top_frames(failure_data.get("stack_trace")),
+        model,
+        str(prompt_version)
+    ]
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+class AnalysisCache:
+    """
+    On-disk cache of failure analyses keyed by failure signature, with a time to
+    live and least-recently-used eviction. Thread-safe; concurrent requests for the
+    same signature wait for the first one instead of calling the model again.
+    """
+
+    def __init__(self, path, ttl_hours=168, max_entries=1000):
+        """
+        Initialize the cache
+
+        Args:
+            path (str or Path): JSON file of the cache
+            ttl_hours (float): Age after which an analysis is requested again
+            max_entries (int): Entries kept; the least recently used are evicted
+        """
+        self.path = Path(path)
+        self.ttl = ttl_hours * 3600
+        self.max_entries = max_entries
+        self.stats = {"hits": 0, "misses": 0}
+        self._entries = self._load()
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._dirty = False
+
+    def get(self, key):
+        """
+        Return the cached analysis of a signature
+
+        Args:
+            key (str): Failure signature
+
+        Returns:
+            dict: Copy of the analysis, or None if missing or expired
+        """
+        with self._lock:
+            analysis = self._hit(key)
+            if analysis is None:
+                self.stats["misses"] += 1
+            return analysis
+
+    def put(self, key, analysis):
+        """Store an analysis; results with an 'error' key are not cached"""
+        if "error" in analysis:
+            return
+        with self._lock:
+            now = time.time()
+            self._entries[key] = {"analysis": dict(analysis), "created": now, "last_used": now}
+            self._dirty = True
+
+    def get_or_compute(self, key, compute):
+        """
+        Return the cached analysis of a signature, or compute and store it
+
+        Args:
+            key (str): Failure signature
+            compute (callable): Returns the analysis; results with an 'error' key are not cached
+
+        Returns:
+            tuple: (analysis, hit)
+        """
+        while True:
+            with self._lock:
+                analysis = self._hit(key)
+                if analysis is not None:
+                    return analysis, True
+
+                pending = self._pending.get(key)
+                if pending is None:
+                    self._pending[key] = threading.Event()
+                    self.stats["misses"] += 1
+                    break
+            # Another thread is analyzing the same failure
+            pending.wait()
+
+        try:
+            analysis = compute()
+            self.put(key, analysis)
+            return analysis, False
+        finally:
+            with self._lock:
+                self._pending.pop(key).set()
+
+    def _hit(self, key):
+        """Copy of a fresh entry's analysis, counted as a hit; call with the lock held"""
+        entry = self._entries.get(key)
+        if not entry or time.time() - entry["created"] >= self.ttl:
+            return None
+        entry["last_used"] = time.time()
+        self._dirty = True
+        self.stats["hits"] += 1
+        return dict(entry["analysis"])
+
+    @property
+    def hit_rate(self):
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / lookups if lookups else 0.0
+
+    def save(self):
+        """Drop expired entries, evict the least recently used ones and write the cache atomically"""
+        with self._lock:
+            if not self._dirty:
+                return
+            now = time.time()
+            entries = {key: entry for key, entry in self._entries.items() if now - entry["created"] < self.ttl}
+            if len(entries) > self.max_entries:
+                newest = sorted(entries.items(), key=lambda item: item[1]["last_used"], reverse=True)
+                entries = dict(newest[:self.max_entries])
+            self._entries = entries
+            self._dirty = False
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding='utf-8') as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write analysis cache {self.path}: {e}")
+
+    def _load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable analysis cache {self.path}: {e}")
+            return {}
@@ -1,11 +1,15 @@
 # automation_framework/src/ai_module/analyzers/failure_analyzer.py
 import json
-import httpx
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import logging
 from openai import OpenAI
 from ..config.ai_settings import ai_settings
+from .rate_limiter import get_rate_limiter
+from .http_transport import get_http_transport
+from .analysis_cache import failure_signature
+from .trace_compactor import compact_trace, estimate_tokens, fit_to_tokens
 
 # Set up logger
 logger = logging.getLogger(__name__)
@@ -15,14 +19,81 @@ class FailureAnalyzer:
     AI-powered test failure analyzer.
     Uses LLM models to analyze test failures and provide insights.
     """
-    
-    def __init__(self, config=None):
+
+    SYSTEM_PROMPT = """You are a test failure analysis expert. 
+                    Analyze the provided test failure and return a JSON response with exactly these fields:
+                    {
+                        "probability_true_bug": float,  // between 0 and 1
+                        "category": string,  // determine the most appropriate category based on the failure
+                        "subcategory": string,  // more specific classification
+                        "confidence": float,  // between 0 and 1
+                        "reasoning": string,  // brief explanation
+                        "suggested_fix": string  // brief suggestion for fixing the issue
+                    }"""
+
+    # Questions of the user prompts
+    ANALYSIS_QUESTIONS = """1. Is this likely a true bug or an environmental/timing issue?
+2. What specific category best describes this issue? Be descriptive and specific.
+3. Are there any patterns in the stack trace that indicate the root cause?
+4. What is a possible fix for this issue?"""
+
+    BATCH_SYSTEM_PROMPT = """You are a test failure analysis expert.
+Analyze each of the provided test failures independently and return a JSON object of this form:
+{
+    "verdicts": [
+        {
+            "failure_id": string,  // the ID given in the failure's heading, e.g. "F1"
+            "probability_true_bug": float,  // between 0 and 1
+            "category": string,  // determine the most appropriate category based on the failure
+            "subcategory": string,  // more specific classification
+            "confidence": float,  // between 0 and 1
+            "reasoning": string,  // brief explanation
+            "suggested_fix": string  // brief suggestion for fixing the issue
+        }
+    ]
+}
+Return exactly one verdict per failure."""
+
+    # Most failures packed into one batch request, whatever the token budget
+    MAX_BATCH_SIZE = 10
+
+    # Part of the analysis cache key; bump when the prompts change meaning
+    PROMPT_VERSION = "1"
+
+    # Tokens reserved for the completion when estimating a request's token usage
+    COMPLETION_TOKENS_ESTIMATE = 300
+
+    # Default budget of a single-failure prompt, including the system prompt
+    MAX_PROMPT_TOKENS = 2000
+    # Room left for the stack trace however tight the budget, and the cap on error messages
+    MIN_TRACE_TOKENS = 100
+    MAX_MESSAGE_CHARS = 2000
+
+    def __init__(self, config=None, max_concurrency=None, cache=None, pattern_detector=None,
+                 batch_token_budget=None, max_prompt_tokens=None, classifier=None, classifier_threshold=0.9,
+                 recommendation_engine=None, reuse_similarity=None):
         """
         Initialize the failure analyzer with the given configuration
         
         Args:
             config (dict, optional): Configuration dictionary with provider, api_key, model
                                      If None, uses default config from ai_settings
+            max_concurrency (int, optional): Number of failures analyzed in parallel.
+                                             Defaults to the provider's 'max_concurrency' setting
+            cache (AnalysisCache, optional): Cache of analyses by failure signature
+            pattern_detector (PatternDetector, optional): Clusters near-identical failures so
+                                                          only one failure per cluster is analyzed
+            batch_token_budget (int, optional): Pack several failures into one request of at most
+                                                this many prompt tokens. None sends one failure per request
+            max_prompt_tokens (int, optional): Token budget of a single-failure prompt; the stack
+                                               trace is shortened to fit. Defaults to MAX_PROMPT_TOKENS
+            classifier (FailureClassifier, optional): Trained local classifier; failures it classifies
+                                                      with enough confidence are not sent to the model
+            classifier_threshold (float): Confidence from which a local verdict is kept
+            recommendation_engine (RecommendationEngine, optional): Index of earlier failures; every
+                                                                    result lists its most similar ones
+            reuse_similarity (float, optional): Similarity from which the verdict of an earlier failure
+                                                is reused without a model call. None always asks the model
         """
         # Use provided config or get default from ai_settings
         if config is None:
@@ -30,13 +101,21 @@ class FailureAnalyzer:
         else:
             self.config = config
             
-        # Initialize OpenAI client
+        self.model = self.config["model"]
+        self.provider = self.config["provider"]
+        self.rate_limiter = get_rate_limiter(
+            self.provider,
+            self.config.get("requests_per_minute"),
+            self.config.get("tokens_per_minute")
+        )
+
+        # Initialize OpenAI client over the provider's shared transport, which retries 429s
+        # and transient errors and pauses the rate limiter so other threads slow down too
+        self.transport = get_http_transport(self.config, on_throttle=self.rate_limiter.pause)
         client_kwargs = {
             "api_key": self.config["api_key"],
-            "http_client": httpx.Client(
-                timeout=60.0,
-                follow_redirects=True
-            )
+            "max_retries": 0,
+            "http_client": self.transport.client
         }
         
         # Add base_url for non-OpenAI providers
@@ -44,8 +123,22 @@ class FailureAnalyzer:
             client_kwargs["base_url"] = self.config["base_url"]
             
         self.client = OpenAI(**client_kwargs)
-        self.model = self.config["model"]
-        self.provider = self.config["provider"]
+        self.max_concurrency = max(1, max_concurrency or self.config.get("max_concurrency") or 1)
+        self.cache = cache
+        self.pattern_detector = pattern_detector
+        self.batch_token_budget = batch_token_budget
+        self.batch_stats = []
+        self.max_prompt_tokens = max_prompt_tokens or self.MAX_PROMPT_TOKENS
+        # Analyses obtained ahead of analyze_failures(), e.g. by a StreamingAnalyzer, by analysis key
+        self.prefetched = {}
+        self.classifier = classifier
+        self.classifier_threshold = classifier_threshold
+        self.local_verdicts = 0
+        self.recommendation_engine = recommendation_engine
+        self.reuse_similarity = reuse_similarity
+        self.reused_verdicts = 0
+        # Failures of the last analyze_failures() call whose verdict was requested from the model
+        self.model_analyses = 0
         
         logger.info(f"Initialized FailureAnalyzer with provider: {self.provider}, model: {self.model}")
     
@@ -57,31 +150,76 @@ class FailureAnalyzer:
             failure_data (dict): Test failure data including test_name, error_message, etc.
             
         Returns:
-            dict: Analysis result with classification, confidence scores, and reasoning
+            dict: Analysis result with classification, confidence scores, and reasoning.
+                  Results served from the cache have 'cached' set to True
+        """
+        if self.cache is None:
+            return self._request_analysis(failure_data)
+
+        key = self.analysis_key(failure_data)
+        analysis, hit = self.cache.get_or_compute(key, lambda: self._request_analysis(failure_data))
+        if hit:
+            analysis["cached"] = True
+            logger.info(f"Analysis served from cache for test: {failure_data.get('test_name')}")
+        return analysis
+
+    def known_verdict(self, failure_data):
+        """
+        Verdict of an earlier failure similar enough to reuse
+
+        Args:
+            failure_data (dict): Test failure data
+
+        Returns:
+            dict: Analysis of the earlier failure, or None
         """
+        if self.recommendation_engine is None or not self.reuse_similarity:
+            return None
+        return self.recommendation_engine.known_analysis(failure_data, self.reuse_similarity)
+
+    def local_verdict(self, failure_data):
+        """
+        Classify a failure with the local classifier
+
+        Args:
+            failure_data (dict): Test failure data
+
+        Returns:
+            dict: Analysis if the classifier is confident enough, else None (the failure is escalated)
+        """
+        if self.classifier is None:
+            return None
+        from ..models.classifier import SOURCE
+        prediction = self.classifier.predict(failure_data)
+        if prediction["confidence"] < self.classifier_threshold:
+            return None
+        return dict(
+            prediction,
+            subcategory="",
+            reasoning=f"Classified locally from {self.classifier.trained_on} earlier verdicts "
+                      f"(confidence {prediction['confidence']:.2f})",
+            suggested_fix="",
+            source=SOURCE,
+            model=SOURCE,
+            provider="local",
+            timestamp=datetime.now().isoformat()
+        )
+
+    def analysis_key(self, failure_data):
+        """Signature under which the analysis of a failure is cached and prefetched"""
+        return failure_signature(failure_data, self.model, self.PROMPT_VERSION)
+
+    def _request_analysis(self, failure_data):
+        """Analyze a test failure with the model, without the cache"""
         try:
             prompt = self._build_prompt(failure_data)
             
             logger.debug(f"Sending analysis request to {self.provider} with model {self.model}")
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": """You are a test failure analysis expert. 
-                    Analyze the provided test failure and return a JSON response with exactly these fields:
-                    {
-                        "probability_true_bug": float,  // between 0 and 1
-                        "category": string,  // determine the most appropriate category based on the failure
-                        "subcategory": string,  // more specific classification
-                        "confidence": float,  // between 0 and 1
-                        "reasoning": string,  // brief explanation
-                        "suggested_fix": string  // brief suggestion for fixing the issue
-                    }"""},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                response_format={'type': 'json_object'}, 
-            )
+            response = self._complete([
+                {"role": "system", "content": self.SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ])
             
             analysis = json.loads(response.choices[0].message.content)
             
@@ -103,6 +241,29 @@ class FailureAnalyzer:
                 "provider": self.provider
             }
     
+    def _complete(self, messages):
+        """
+        Send a chat completion within the provider's rate limits. 429s and transient
+        errors are retried by the shared transport (see http_transport).
+
+        Args:
+            messages (list): Chat messages
+
+        Returns:
+            ChatCompletion: Provider response
+        """
+        estimated = sum(estimate_tokens(m["content"]) for m in messages) + self.COMPLETION_TOKENS_ESTIMATE
+        self.rate_limiter.acquire(estimated)
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=0.3,
+            response_format={'type': 'json_object'},
+        )
+        usage = getattr(response, "usage", None)
+        self.rate_limiter.adjust(estimated, getattr(usage, "total_tokens", None))
+        return response
+
     def _build_prompt(self, failure_data):
         """
         Build prompt for LLM analysis
@@ -115,21 +276,292 @@ class FailureAnalyzer:
         """
         return f"""Please analyze this test failure:
 
-Test Name: {failure_data.get('test_name', 'Unknown')}
-Error Message: {failure_data.get('error_message', 'Unknown')}
-Error Type: {failure_data.get('error_type', 'Unknown')}
-Stack Trace: {failure_data.get('stack_trace', 'Not available')}
-Environment: {failure_data.get('environment', 'Unknown')}
-Test Duration: {failure_data.get('test_duration', 0)}s
+{self._format_failure(failure_data)}
 
 Consider:
-1. Is this likely a true bug or an environmental/timing issue?
-2. What specific category best describes this issue? Be descriptive and specific.
-3. Are there any patterns in the stack trace that indicate the root cause?
-4. What is a possible fix for this issue?
+{self.ANALYSIS_QUESTIONS}
 
 Provide your analysis in JSON format with accurate probability and confidence scores."""
 
+    def _format_failure(self, failure_data):
+        """
+        Failure details as presented to the model. The stack trace is compacted (or taken
+        precompacted from 'stack_trace_compact') and shortened to fit the prompt budget.
+        """
+        message = compact_trace(failure_data.get('error_message') or 'Unknown', self.MAX_MESSAGE_CHARS)
+        head = f"""Test Name: {failure_data.get('test_name', 'Unknown')}
+Error Message: {message}
+Error Type: {failure_data.get('error_type', 'Unknown')}
+Stack Trace: """
+        tail = f"""
+Environment: {failure_data.get('environment', 'Unknown')}
+Test Duration: {failure_data.get('test_duration', 0)}s"""
+
+        trace = failure_data.get('stack_trace_compact') or compact_trace(failure_data.get('stack_trace'))
+        if trace:
+            budget = (self.max_prompt_tokens - self._prompt_overhead_tokens()
+                      - estimate_tokens(head) - estimate_tokens(tail))
+            trace = fit_to_tokens(trace, max(budget, self.MIN_TRACE_TOKENS))
+        return f"{head}{trace or 'Not available'}{tail}"
+
+    def _prompt_overhead_tokens(self):
+        """Tokens of the system prompt and the instructions around the failure details"""
+        return estimate_tokens(self.SYSTEM_PROMPT) + estimate_tokens(self.ANALYSIS_QUESTIONS) + 40
+
+    def _build_batch_prompt(self, failures):
+        """
+        Build one prompt for several failures, each headed by its failure ID (F1, F2, ...)
+
+        Args:
+            failures (list): Test failure data
+
+        Returns:
+            str: Formatted prompt for the LLM
+        """
+        blocks = "\n\n".join(f"### Failure F{number}\n{self._format_failure(failure)}"
+                              for number, failure in enumerate(failures, start=1))
+        return f"""Please analyze these {len(failures)} test failures:
+
+{blocks}
+
+For each failure consider:
+{self.ANALYSIS_QUESTIONS}
+
+Provide your verdicts in JSON format with accurate probability and confidence scores."""
+
+    def _analyze_all(self, failures):
+        """Analyze failures, batched if a token budget is set, in input order; prefetched analyses are reused"""
+        entries = [None] * len(failures)
+        pending = []
+        for index, failure in enumerate(failures):
+            analysis = self.prefetched.get(self.analysis_key(failure)) if self.prefetched else None
+            if analysis is None:
+                analysis = self.known_verdict(failure)
+                self.reused_verdicts += analysis is not None
+            if analysis is None:
+                analysis = self.local_verdict(failure)
+                self.local_verdicts += analysis is not None
+            if analysis is not None:
+                entries[index] = self._make_entry(failure, dict(analysis))
+            else:
+                pending.append(index)
+
+        remaining = [failures[index] for index in pending]
+        if self.batch_token_budget:
+            analyzed = self._analyze_batched(remaining)
+        else:
+            analyzed = self._map(self._analyze_entry, remaining)
+        for index, entry in zip(pending, analyzed):
+            entries[index] = entry
+        self.model_analyses += sum(1 for entry in analyzed if not entry["analysis"].get("cached"))
+        return entries
+
+    def _map(self, function, items):
+        """Apply a function concurrently; map() keeps the results in input order"""
+        if self.max_concurrency > 1 and len(items) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(items)),
+                                    thread_name_prefix="failure-analysis") as executor:
+                return list(executor.map(function, items))
+        return [function(item) for item in items]
+
+    def _analyze_batched(self, failures):
+        """
+        Analyze failures in batches packed up to the token budget. Failures a batch
+        response has no valid verdict for are analyzed individually.
+
+        Args:
+            failures (list): Test failure data
+
+        Returns:
+            list: Result entries in input order
+        """
+        analyses = [None] * len(failures)
+        pending = []
+        for index, failure in enumerate(failures):
+            cached = self.cache.get(self.analysis_key(failure)) if self.cache is not None else None
+            if cached is not None:
+                cached["cached"] = True
+                analyses[index] = cached
+            else:
+                pending.append(index)
+
+        batches = self._pack_batches([failures[index] for index in pending])
+        batch_results = self._map(
+            lambda batch: self._request_batch([failures[pending[i]] for i in batch]),
+            [batch for batch in batches if len(batch) > 1]
+        )
+        for batch, verdicts in zip([batch for batch in batches if len(batch) > 1], batch_results):
+            for position, analysis in zip(batch, verdicts):
+                analyses[pending[position]] = analysis
+
+        # Single-failure batches and failures without a valid batch verdict
+        remaining = [index for index in pending if analyses[index] is None]
+        for index, analysis in zip(remaining, self._map(self._request_analysis, [failures[i] for i in remaining])):
+            analyses[index] = analysis
+
+        if self.cache is not None:
+            for index in pending:
+                self.cache.put(self.analysis_key(failures[index]), analyses[index])
+
+        return [self._make_entry(failure, analysis) for failure, analysis in zip(failures, analyses)]
+
+    def _pack_batches(self, failures):
+        """
+        Group failures, in order, into batches whose prompt fits the token budget
+
+        Returns:
+            list: Batches as lists of indexes into failures
+        """
+        base = estimate_tokens(self.BATCH_SYSTEM_PROMPT) + estimate_tokens(self._build_batch_prompt([]))
+        batches, current, used = [], [], base
+        for index, failure in enumerate(failures):
+            cost = estimate_tokens(self._format_failure(failure)) + 10
+            if current and (used + cost > self.batch_token_budget or len(current) >= self.MAX_BATCH_SIZE):
+                batches.append(current)
+                current, used = [], base
+            current.append(index)
+            used += cost
+        if current:
+            batches.append(current)
+        return batches
+
+    def _request_batch(self, failures):
+        """
+        Analyze several failures in one request
+
+        Args:
+            failures (list): Test failure data
+
+        Returns:
+            list: One analysis per failure, None where the response had no valid verdict
+        """
+        stats = {"size": len(failures), "prompt_tokens": None, "completion_tokens": None,
+                 "total_tokens": None, "fallbacks": len(failures)}
+        self.batch_stats.append(stats)
+        try:
+            response = self._complete([
+                {"role": "system", "content": self.BATCH_SYSTEM_PROMPT},
+                {"role": "user", "content": self._build_batch_prompt(failures)}
+            ])
+        except Exception as e:
+            logger.warning(f"Batch analysis of {len(failures)} failures failed, analyzing individually: {e}")
+            return [None] * len(failures)
+
+        usage = getattr(response, "usage", None)
+        for field in ("prompt_tokens", "completion_tokens", "total_tokens"):
+            stats[field] = getattr(usage, field, None)
+
+        verdicts = self._parse_verdicts(response.choices[0].message.content, len(failures))
+        stats["fallbacks"] = verdicts.count(None)
+        if stats["fallbacks"]:
+            logger.warning(f"Batch response had no valid verdict for {stats['fallbacks']} of "
+                           f"{len(failures)} failures, analyzing them individually")
+
+        timestamp = datetime.now().isoformat()
+        for analysis in verdicts:
+            if analysis is not None:
+                analysis.update({"timestamp": timestamp, "model": self.model, "provider": self.provider})
+        logger.info(f"Batch of {len(failures)} failures analyzed, tokens used: {stats['total_tokens']}")
+        return verdicts
+
+    @staticmethod
+    def _parse_verdicts(content, count):
+        """
+        Validate a batch response
+
+        Args:
+            content (str): Model output, expected to be {"verdicts": [...]}
+            count (int): Number of failures in the batch
+
+        Returns:
+            list: Analysis per failure (F1..Fn order), None for missing or invalid verdicts
+        """
+        verdicts = [None] * count
+        try:
+            data = json.loads(content)
+        except (TypeError, ValueError):
+            return verdicts
+        items = data.get("verdicts") if isinstance(data, dict) else data
+        if not isinstance(items, list):
+            return verdicts
+
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            failure_id = str(item.pop("failure_id", ""))
+            if not failure_id.upper().startswith("F") or not failure_id[1:].isdigit():
+                continue
+            position = int(failure_id[1:]) - 1
+            probability, confidence = item.get("probability_true_bug"), item.get("confidence")
+            valid = (
+                0 <= position < count
+                and isinstance(probability, (int, float)) and 0 <= probability <= 1
+                and isinstance(confidence, (int, float)) and 0 <= confidence <= 1
+                and all(isinstance(item.get(field), str)
+                        for field in ("category", "subcategory", "reasoning", "suggested_fix"))
+            )
+            if valid and verdicts[position] is None:
+                verdicts[position] = item
+        return verdicts
+
+    @staticmethod
+    def _fan_out(failures, clusters, representative_results):
+        """
+        Give every failure the verdict of its cluster's representative
+
+        Args:
+            failures (list): All failures
+            clusters (list): Clusters from PatternDetector.detect()
+            representative_results (list): Result entries of the representatives, in cluster order
+
+        Returns:
+            list: One result entry per failure, in input order, with a 'cluster' field
+        """
+        results = [None] * len(failures)
+        for cluster, representative in zip(clusters, representative_results):
+            membership = {
+                "id": cluster["cluster_id"],
+                "size": len(cluster["members"]),
+                "representative": representative["test_name"]
+            }
+            for index in cluster["members"]:
+                if index == cluster["representative"]:
+                    entry = dict(representative)
+                else:
+                    entry = {
+                        "test_name": failures[index].get("test_name", "Unknown"),
+                        "failure_data": failures[index],
+                        "analysis": dict(representative["analysis"]),
+                        "timestamp": representative["timestamp"]
+                    }
+                entry["cluster"] = membership
+                results[index] = entry
+        return results
+
+    def _add_similar_failures(self, entries, limit=3):
+        """List the most similar earlier failures and their suggested fixes in every result entry"""
+        lookups = {}
+        for entry in entries:
+            failure = entry["failure_data"]
+            key = self.recommendation_engine.entry_id(failure)
+            if key not in lookups:
+                lookups[key] = self.recommendation_engine.similar(failure, limit=limit)
+            entry["similar_failures"] = lookups[key]
+
+    def _analyze_entry(self, failure):
+        """Analyze one failure and wrap it as an entry of the 'results' list"""
+        logger.info(f"Analyzing failure: {failure.get('test_name', 'Unknown')}")
+        return self._make_entry(failure, self.analyze_failure(failure))
+
+    @staticmethod
+    def _make_entry(failure, analysis):
+        return {
+            "test_name": failure.get("test_name", "Unknown"),
+            "failure_data": failure,
+            "analysis": analysis,
+            "timestamp": datetime.now().isoformat()
+        }
+
     def analyze_failures(self, failures):
         """
         Analyze multiple test failures
@@ -142,19 +574,24 @@ Provide your analysis in JSON format with accurate probability and confidence sc
         """
         try:
             analysis_start_time = datetime.now()
+            # Counters are reported per call; a streaming run calls this a second time for late analyses
+            self.batch_stats = []
+            self.local_verdicts = 0
+            self.reused_verdicts = 0
+            self.model_analyses = 0
             
-            # Analyze each failure
-            analysis_results = []
-            for failure in failures:
-                logger.info(f"Analyzing failure: {failure.get('test_name', 'Unknown')}")
-                analysis = self.analyze_failure(failure)
-                analysis_results.append({
-                    "test_name": failure.get("test_name", "Unknown"),
-                    "failure_data": failure,
-                    "analysis": analysis,
-                    "timestamp": datetime.now().isoformat()
-                })
+            # Analyze one representative per cluster of near-identical failures
+            clusters = self.pattern_detector.detect(failures) if self.pattern_detector else None
+            if clusters:
+                representatives = [failures[cluster["representative"]] for cluster in clusters]
+                logger.info(f"{len(failures)} failures grouped into {len(clusters)} clusters")
+                analysis_results = self._fan_out(failures, clusters, self._analyze_all(representatives))
+            else:
+                analysis_results = self._analyze_all(failures)
             
+            if self.recommendation_engine is not None:
+                self._add_similar_failures(analysis_results)
+
             # Calculate total analysis time
             analysis_end_time = datetime.now()
             analysis_duration = (analysis_end_time - analysis_start_time).total_seconds()
@@ -167,10 +604,20 @@ Provide your analysis in JSON format with accurate probability and confidence sc
                     "model": self.model,
                     "version": "1.0",
                     "analysis_duration_seconds": analysis_duration,
-                    "failures_analyzed": len(analysis_results)
+                    "failures_analyzed": len(analysis_results),
+                    "model_analyses": self.model_analyses
                 },
                 "results": analysis_results
             }
+            if clusters:
+                results["metadata"]["clusters"] = len(clusters)
+            if self.batch_stats:
+                results["metadata"]["batches"] = self.batch_stats
+            if self.classifier is not None:
+                results["metadata"]["local_verdicts"] = self.local_verdicts
+            if self.recommendation_engine is not None:
+                results["metadata"]["seen_before"] = sum(1 for r in analysis_results if r["similar_failures"])
+                results["metadata"]["reused_verdicts"] = self.reused_verdicts
             
             # Log summary
             true_bugs = sum(1 for r in analysis_results 
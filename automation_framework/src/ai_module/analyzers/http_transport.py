@@ -0,0 +1,226 @@
+# automation_framework/src/ai_module/analyzers/http_transport.py
+import atexit
+import importlib.util
+import logging
+import random
+import threading
+import time
+import weakref
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Rate limited and transient server errors
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Failures before a complete response; chat completions are safe to resend
+RETRY_ERRORS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+# Transport settings, overridable per provider in ai_settings.MODEL_CONFIGS
+DEFAULTS = {
+    "max_connections": 16,
+    "max_keepalive_connections": 16,
+    "keepalive_expiry": 60.0,
+    "http2": False,
+    "connect_timeout": 10.0,
+    "read_timeout": 60.0,
+    "max_retries": 4,
+    "backoff_initial": 1.0,
+    "backoff_max": 30.0
+}
+
+class RetryingTransport(httpx.HTTPTransport):
+    """
+    Keep-alive connection pool for LLM provider requests. Rate-limited (429) and
+    transient server errors (5xx) and connection failures are retried with jittered
+    exponential backoff, honouring Retry-After up to backoff_max; the last response
+    is returned as is.
+    The latency, retries and connection reuse of every request are logged and counted.
+
+    Owns the httpx.Client passed to the OpenAI SDK, whose own retries are disabled.
+    """
+
+    def __init__(self, settings, on_throttle=None):
+        """
+        Initialize the transport and its client
+
+        Args:
+            settings (dict): Values for the keys of DEFAULTS
+            on_throttle (callable, optional): Called with the wait in seconds after a 429,
+                                              e.g. RateLimiter.pause to hold back other threads
+        """
+        http2 = settings["http2"]
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but the 'h2' package is not installed, using HTTP/1.1")
+            http2 = False
+
+        super().__init__(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=settings["max_connections"],
+                max_keepalive_connections=settings["max_keepalive_connections"],
+                keepalive_expiry=settings["keepalive_expiry"]
+            )
+        )
+        self.http2 = http2
+        self.max_retries = settings["max_retries"]
+        self.backoff_initial = settings["backoff_initial"]
+        self.backoff_max = settings["backoff_max"]
+        self.on_throttle = on_throttle
+        self.stats = {
+            "requests": 0,
+            "attempts": 0,
+            "retries": 0,
+            "reused": 0,
+            "latency_seconds": 0.0
+        }
+        self._streams = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+        self.client = httpx.Client(
+            transport=self,
+            timeout=httpx.Timeout(
+                settings["read_timeout"],
+                connect=settings["connect_timeout"],
+                pool=settings["read_timeout"]
+            ),
+            follow_redirects=True
+        )
+
+    def handle_request(self, request):
+        start = time.perf_counter()
+        delay = self.backoff_initial
+        for attempt in range(self.max_retries + 1):
+            try:
+                response, reused = self._send(request)
+            except RETRY_ERRORS as e:
+                if attempt == self.max_retries:
+                    self._record(request, None, attempt, start, False)
+                    raise
+                wait = delay * (0.5 + random.random())
+                reason = type(e).__name__
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt == self.max_retries:
+                    self._record(request, response, attempt, start, reused)
+                    return response
+                wait = self._retry_after(response) or delay * (0.5 + random.random())
+                reason = f"HTTP {response.status_code}"
+                # Reading the error body keeps the connection reusable
+                response.read()
+                response.close()
+                if response.status_code == 429 and self.on_throttle is not None:
+                    # Hold back every thread using this provider, not only this one
+                    self.on_throttle(wait)
+
+            logger.debug(f"{reason} from {request.url.host}, retry {attempt + 1} in {wait:.1f}s")
+            time.sleep(wait)
+            delay = min(delay * 2, self.backoff_max)
+
+    def _send(self, request):
+        """One attempt; returns the response and whether it came over an already open connection"""
+        response = super().handle_request(request)
+        stream = response.extensions.get("network_stream")
+        with self._lock:
+            self.stats["attempts"] += 1
+            reused = stream is not None and stream in self._streams
+            if reused:
+                self.stats["reused"] += 1
+            elif stream is not None:
+                self._streams.add(stream)
+        return response, reused
+
+    def _record(self, request, response, retries, start, reused):
+        latency = time.perf_counter() - start
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["retries"] += retries
+            self.stats["latency_seconds"] += latency
+        status = response.status_code if response is not None else "failed"
+        logger.info(f"{request.method} {request.url.path}: {status} in {latency * 1e3:.0f} ms, "
+                    f"{retries} retries, {'reused' if reused else 'new'} connection")
+
+    @property
+    def reuse_rate(self):
+        """Share of attempts sent over a connection opened by an earlier request"""
+        return self.stats["reused"] / self.stats["attempts"] if self.stats["attempts"] else 0.0
+
+    def summary(self):
+        """
+        Build a one-line summary of the transport usage
+
+        Returns:
+            str: Request, retry and latency counts and the connection reuse rate
+        """
+        requests = self.stats["requests"]
+        mean_latency = self.stats["latency_seconds"] / requests if requests else 0.0
+        return (f"{requests} requests over {'HTTP/2' if self.http2 else 'HTTP/1.1'}, "
+                f"{self.stats['retries']} retries, {mean_latency * 1e3:.0f} ms mean latency, "
+                f"{self.reuse_rate:.0%} connection reuse")
+
+    def _retry_after(self, response):
+        """
+        Seconds to wait from the Retry-After header of a response
+
+        Args:
+            response (httpx.Response): Rate limited or failed response
+
+        Returns:
+            float: Delay in seconds or until an HTTP date, capped at backoff_max so one
+                   response cannot stall every analysis thread; None without a valid header
+        """
+        value = response.headers.get("retry-after")
+        if value is None:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError, IndexError):
+                return None
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+        if seconds > self.backoff_max:
+            logger.debug(f"Retry-After of {seconds:.0f}s capped at {self.backoff_max:.0f}s")
+        return min(max(seconds, 0.0), self.backoff_max)
+
+# One transport per provider and settings, shared by all analyzers in the process
+_transports = {}
+_transports_lock = threading.Lock()
+
+def get_http_transport(config, on_throttle=None):
+    """
+    Get the shared transport of a provider, creating it on first use
+
+    Args:
+        config (dict): Model configuration from ai_settings; keys of DEFAULTS override the defaults
+        on_throttle (callable, optional): Passed to the transport when creating it
+
+    Returns:
+        RetryingTransport: Transport shared by every analyzer with the same provider and settings;
+                           its 'client' is the httpx.Client to use
+    """
+    settings = {key: config.get(key, default) for key, default in DEFAULTS.items()}
+    key = (config.get("provider"), config.get("base_url"), tuple(sorted(settings.items())))
+
+    with _transports_lock:
+        transport = _transports.get(key)
+        if transport is None:
+            transport = RetryingTransport(settings, on_throttle)
+            _transports[key] = transport
+        return transport
+
+def close_http_transports():
+    """Close the clients and pooled connections of every shared transport"""
+    with _transports_lock:
+        transports = list(_transports.values())
+        _transports.clear()
+    for transport in transports:
+        if transport.stats["requests"]:
+            logger.info(f"Closing LLM transport: {transport.summary()}")
+        transport.client.close()
+
+atexit.register(close_http_transports)
@@ -0,0 +1,153 @@
+# automation_framework/src/ai_module/analyzers/pattern_detector.py
+import hashlib
+import logging
+import random
+import re
+from .analysis_cache import normalize_message, top_frames
+
+logger = logging.getLogger(__name__)
+
+# Mersenne prime used by the MinHash permutations
+_PRIME = (1 << 61) - 1
+
+_TOKEN_PATTERN = re.compile(r"[\w<>.:/-]+")
+
+def _hash64(text):
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "big")
+
+class PatternDetector:
+    """
+    Groups near-identical failures so that only one failure per group needs an LLM call.
+
+    Failures with the same error type, normalized message and innermost stack frames
+    are grouped exactly. The remaining groups are bucketed by MinHash signatures of
+    their message and frame shingles (locality-sensitive hashing) and only compared
+    within a bucket, so the cost grows linearly with the number of failures.
+    """
+
+    def __init__(self, threshold=0.8, num_perm=32, bands=8, shingle_size=3, seed=1):
+        """
+        Initialize the detector
+
+        Args:
+            threshold (float): Jaccard similarity of message and frame shingles from which two failures are clustered
+            num_perm (int): Number of MinHash permutations
+            bands (int): LSH bands; num_perm must be a multiple of it
+            shingle_size (int): Tokens per shingle
+            seed (int): Seed of the permutations, fixed so clustering is deterministic
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        rng = random.Random(seed)
+        self._permutations = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)]
+
+    def detect(self, failures):
+        """
+        Cluster failures
+
+        Args:
+            failures (list): Failure dictionaries as recorded in failures.json
+
+        Returns:
+            list: Clusters in order of first appearance, each a dict with 'cluster_id',
+                  'representative' (index of the first member) and 'members' (indexes)
+        """
+        # Exact grouping by fingerprint
+        groups = {}
+        for index, failure in enumerate(failures):
+            groups.setdefault(self.fingerprint(failure), []).append(index)
+        keys = list(groups)
+
+        # Near-duplicate grouping of the fingerprints with MinHash + LSH
+        parent = list(range(len(keys)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        shingles = [self.shingles(failures[groups[key][0]]) for key in keys]
+        signatures = [self.minhash(shingle_set) for shingle_set in shingles]
+        anchors = {}
+        for i, key in enumerate(keys):
+            error_type = failures[groups[key][0]].get("error_type")
+            for band in range(self.bands):
+                bucket = (error_type, band, tuple(signatures[i][band * self.rows:(band + 1) * self.rows]))
+                anchor = anchors.setdefault(bucket, i)
+                # Compare with the first member of the bucket only, keeping the stage linear
+                if anchor == i or find(anchor) == find(i):
+                    continue
+                # MinHash only proposes candidates; the exact similarity decides
+                if self.jaccard(shingles[anchor], shingles[i]) >= self.threshold:
+                    parent[find(i)] = find(anchor)
+
+        members = {}
+        for i, key in enumerate(keys):
+            members.setdefault(find(i), []).extend(groups[key])
+
+        clusters = sorted((sorted(indexes) for indexes in members.values()), key=lambda m: m[0])
+        return [{"cluster_id": f"cluster-{number + 1}", "representative": indexes[0], "members": indexes}
+                for number, indexes in enumerate(clusters)]
+
+    def similar(self, first, second):
+        """
+        Check whether two failures belong to the same cluster, for failures arriving one at a time
+
+        Args:
+            first (dict): Failure
+            second (dict): Failure
+
+        Returns:
+            bool: True for equal fingerprints, or the same error type and shingle similarity above the threshold
+        """
+        if self.fingerprint(first) == self.fingerprint(second):
+            return True
+        if first.get("error_type") != second.get("error_type"):
+            return False
+        return self.jaccard(self.shingles(first), self.shingles(second)) >= self.threshold
+
+    @staticmethod
+    def fingerprint(failure):
+        """Exact fingerprint: error type, normalized message and innermost stack frames"""
+        return (
+            failure.get("error_type") or "",
+            normalize_message(failure.get("error_message")),
+            tuple(top_frames(failure.get("stack_trace")))
+        )
+
+    def minhash(self, shingles):
+        """
+        MinHash signature of a set of shingles
+
+        Args:
+            shingles (set): Shingles
+
+        Returns:
+            list: num_perm minimum hash values
+        """
+        if not shingles:
+            return [0] * self.num_perm
+        hashes = [_hash64(shingle) for shingle in shingles]
+        return [min((a * h + b) % _PRIME for h in hashes) for a, b in self._permutations]
+
+    @staticmethod
+    def jaccard(first, second):
+        """Exact Jaccard similarity of two shingle sets"""
+        if not first and not second:
+            return 1.0
+        return len(first & second) / len(first | second)
+
+    def shingles(self, failure):
+        """Token shingles of the normalized message plus one token per innermost stack frame"""
+        tokens = _TOKEN_PATTERN.findall(normalize_message(failure.get("error_message")).lower())
+        size = self.shingle_size
+        shingles = {" ".join(tokens[i:i + size]) for i in range(max(1, len(tokens) - size + 1))}
+        shingles.update(f"frame:{frame}" for frame in top_frames(failure.get("stack_trace")))
+        shingles.discard("")
+        return shingles
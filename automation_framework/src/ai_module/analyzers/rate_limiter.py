@@ -0,0 +1,120 @@
+# automation_framework/src/ai_module/analyzers/rate_limiter.py
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+class RateLimiter:
+    """
+    Thread-safe limiter for requests per minute and tokens per minute.
+    Both limits are token buckets refilled continuously, so short bursts up to
+    the per-minute budget are allowed. A 429 from the provider pauses all callers.
+    """
+
+    def __init__(self, requests_per_minute=None, tokens_per_minute=None):
+        """
+        Initialize the limiter
+
+        Args:
+            requests_per_minute (int, optional): Request budget; None means unlimited
+            tokens_per_minute (int, optional): Token budget (prompt + completion); None means unlimited
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = float(requests_per_minute or 0)
+        self._tokens = float(tokens_per_minute or 0)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self.stats = {"waits": 0, "wait_seconds": 0.0, "throttled": 0}
+
+    def acquire(self, tokens=0):
+        """
+        Block until a request using the given number of tokens fits both budgets
+
+        Args:
+            tokens (int): Estimated tokens of the request
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                delay = self._paused_until - time.monotonic()
+                if delay <= 0:
+                    delay = self._shortfall(tokens)
+                if delay <= 0:
+                    if self.requests_per_minute:
+                        self._requests -= 1
+                    if self.tokens_per_minute:
+                        self._tokens -= tokens
+                    if waited:
+                        self.stats["waits"] += 1
+                        self.stats["wait_seconds"] += waited
+                    return
+            time.sleep(delay)
+            waited += delay
+
+    def adjust(self, estimated, actual):
+        """Correct the token budget once the actual usage of a request is known"""
+        if self.tokens_per_minute and actual is not None:
+            with self._lock:
+                self._tokens -= actual - estimated
+
+    def pause(self, seconds):
+        """
+        Stop handing out requests for a while, e.g. after a 429 response
+
+        Args:
+            seconds (float): Pause duration
+        """
+        with self._lock:
+            self.stats["throttled"] += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        logger.info(f"Rate limited by provider, pausing requests for {seconds:.1f}s")
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        if self.requests_per_minute:
+            self._requests = min(self.requests_per_minute,
+                                 self._requests + elapsed * self.requests_per_minute / 60)
+        if self.tokens_per_minute:
+            self._tokens = min(self.tokens_per_minute,
+                               self._tokens + elapsed * self.tokens_per_minute / 60)
+
+    def _shortfall(self, tokens):
+        """Seconds until the request fits both budgets (0 if it fits now)"""
+        delay = 0.0
+        if self.requests_per_minute and self._requests < 1:
+            delay = (1 - self._requests) * 60 / self.requests_per_minute
+        if self.tokens_per_minute:
+            # A request larger than the whole budget waits for a full bucket
+            needed = min(tokens, self.tokens_per_minute)
+            if self._tokens < needed:
+                delay = max(delay, (needed - self._tokens) * 60 / self.tokens_per_minute)
+        return delay
+
+# One limiter per provider, shared by all analyzers in the process
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+def get_rate_limiter(provider, requests_per_minute=None, tokens_per_minute=None):
+    """
+    Get the shared limiter of a provider, creating it on first use
+
+    Args:
+        provider (str): Provider name
+        requests_per_minute (int, optional): Request budget used when creating the limiter
+        tokens_per_minute (int, optional): Token budget used when creating the limiter
+
+    Returns:
+        RateLimiter: Limiter shared by every analyzer using the provider
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+            _limiters[provider] = limiter
+        return limiter
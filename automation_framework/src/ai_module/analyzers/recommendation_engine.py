@@ -0,0 +1,307 @@
+# automation_framework/src/ai_module/analyzers/recommendation_engine.py
+import hashlib
+import json
+import logging
+import os
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from .pattern_detector import PatternDetector
+
+logger = logging.getLogger(__name__)
+
+# Value of the 'source' field of analyses reused from an earlier, similar failure
+SOURCE = "failure-history"
+
+# Analysis fields kept per indexed failure
+ANALYSIS_FIELDS = ("probability_true_bug", "category", "subcategory", "confidence", "reasoning", "suggested_fix")
+
+# Distinct suggested fixes and test names kept per indexed failure, most recent first
+MAX_FIXES = 3
+MAX_TESTS = 5
+
+class RecommendationEngine:
+    """
+    Persistent nearest-neighbour index over the failures of earlier runs, returning the
+    most similar past failures and the fixes suggested for them.
+
+    Failures with the same fingerprint (error type, normalized message, innermost frames)
+    share one entry. Entries are found through MinHash LSH buckets of their shingles and
+    ranked by exact Jaccard similarity, so a lookup only touches a few buckets however
+    large the index grows. The index is an append-only JSON lines file: each save appends
+    the entries changed in the run, and the file is compacted once it holds mostly
+    superseded lines.
+    """
+
+    def __init__(self, path, detector=None, max_bucket=256, candidates=32):
+        """
+        Initialize the engine. The index is loaded on the first lookup or write, so runs
+        that never consult it do not pay for reading it.
+
+        Args:
+            path (str or Path): JSON lines file of the index
+            detector (PatternDetector, optional): Provides shingles and MinHash signatures. Defaults to
+                                                  16 bands of 2 rows, which finds nearly all matches
+                                                  down to a similarity of 0.5
+            max_bucket (int): Entries per LSH bucket; further near-duplicates are only found
+                              through their other bands
+            candidates (int): Candidates (most band collisions first) ranked by exact similarity
+        """
+        self.path = Path(path)
+        self.detector = detector or PatternDetector(num_perm=32, bands=16)
+        self.max_bucket = max_bucket
+        self.candidates = candidates
+        self._entries = None
+        self._buckets = {}
+        self._shingles = {}
+        self._changed = {}
+        self._lines = 0
+
+    @property
+    def entries(self):
+        """Index entries by id, loaded from the file on first access"""
+        if self._entries is None:
+            self._entries = {}
+            self._load()
+        return self._entries
+
+    def add(self, failure, analysis=None):
+        """
+        Record a failure and, if usable, its analysis
+
+        Args:
+            failure (dict): Failure as recorded in failures.json
+            analysis (dict, optional): Its analysis; errors and reused verdicts are not recorded
+
+        Returns:
+            dict: Index entry of the failure
+        """
+        key = self.entry_id(failure)
+        seen = failure.get("timestamp") or datetime.now().isoformat()
+        entry = self.entries.get(key)
+        if entry is None:
+            error_type, message, frames = self.detector.fingerprint(failure)
+            shingles = self.detector.shingles(failure)
+            entry = {
+                "id": key,
+                "error_type": error_type,
+                "message": message[:1000],
+                "frames": list(frames),
+                "bands": self._band_keys(error_type, shingles),
+                "tests": [],
+                "occurrences": 0,
+                "first_seen": seen,
+                "last_seen": seen,
+                "analysis": None,
+                "fixes": []
+            }
+            self.entries[key] = entry
+            self._shingles[key] = shingles
+            self._index(entry)
+
+        entry["occurrences"] += 1
+        entry["last_seen"] = max(entry["last_seen"], seen)
+        test_name = failure.get("test_name")
+        if test_name:
+            entry["tests"] = ([test_name] + [t for t in entry["tests"] if t != test_name])[:MAX_TESTS]
+
+        if analysis and "error" not in analysis and not analysis.get("source"):
+            entry["analysis"] = {field: analysis[field] for field in ANALYSIS_FIELDS if field in analysis}
+            fix = analysis.get("suggested_fix")
+            if fix:
+                entry["fixes"] = ([fix] + [f for f in entry["fixes"] if f != fix])[:MAX_FIXES]
+        self._changed[key] = entry
+        return entry
+
+    def add_results(self, results):
+        """
+        Record the failures and verdicts of a run
+
+        Args:
+            results (dict): Output of FailureAnalyzer.analyze_failures()
+        """
+        for result in results.get("results", []):
+            self.add(result.get("failure_data") or {}, result.get("analysis"))
+
+    def import_files(self, failures_files=(), analysis_files=()):
+        """
+        Index the records of earlier runs, e.g. archived CI artifacts
+
+        Args:
+            failures_files (list): failures.json files (JSON lines)
+            analysis_files (list): analysis.json files; failures also listed in a
+                                   failures.json file are only counted once
+
+        Returns:
+            int: Number of failures indexed
+        """
+        seen, count = set(), 0
+        for path in analysis_files:
+            try:
+                with open(path, encoding='utf-8') as f:
+                    results = json.load(f).get("results", [])
+            except (OSError, ValueError, AttributeError) as e:
+                logger.warning(f"Skipping unreadable analysis file {path}: {e}")
+                continue
+            for result in results:
+                failure = result.get("failure_data") or {}
+                seen.add((failure.get("test_name"), failure.get("timestamp")))
+                self.add(failure, result.get("analysis"))
+                count += 1
+
+        for path in failures_files:
+            try:
+                with open(path, encoding='utf-8') as f:
+                    failures = [json.loads(line) for line in f if line.strip()]
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable failures file {path}: {e}")
+                continue
+            for failure in failures:
+                if (failure.get("test_name"), failure.get("timestamp")) not in seen:
+                    self.add(failure)
+                    count += 1
+        return count
+
+    def similar(self, failure, limit=5, min_similarity=0.5):
+        """
+        Find the most similar past failures
+
+        Args:
+            failure (dict): Failure as recorded in failures.json
+            limit (int): Number of matches returned
+            min_similarity (float): Lowest Jaccard similarity of message and frame shingles
+
+        Returns:
+            list: Matches, most similar (then most recent) first, each with 'similarity',
+                  'test_name', 'occurrences', 'first_seen', 'last_seen', 'category',
+                  'probability_true_bug' and 'suggested_fixes'
+        """
+        if not self.entries:
+            return []
+        key = self.entry_id(failure)
+        shingles = self.detector.shingles(failure)
+        collisions = Counter()
+        for band in self._band_keys(failure.get("error_type") or "", shingles):
+            collisions.update(self._buckets.get(band, ()))
+        if key in self.entries:
+            collisions[key] = len(self.entries[key]["bands"]) + 1
+
+        scored = []
+        for candidate, _ in collisions.most_common(self.candidates):
+            similarity = 1.0 if candidate == key else self.detector.jaccard(shingles, self._entry_shingles(candidate))
+            if similarity >= min_similarity:
+                scored.append((similarity, self.entries[candidate]["last_seen"], candidate))
+        scored.sort(reverse=True)
+        return [self._describe(self.entries[candidate], similarity) for similarity, _, candidate in scored[:limit]]
+
+    def known_analysis(self, failure, min_similarity):
+        """
+        Analysis of the most similar past failure, for reusing it instead of a new model call
+
+        Args:
+            failure (dict): Failure as recorded in failures.json
+            min_similarity (float): Lowest similarity for the past verdict to apply
+
+        Returns:
+            dict: Copy of the past analysis with 'source', 'similar_failure' and 'similarity', or None
+        """
+        for match in self.similar(failure, limit=3, min_similarity=min_similarity):
+            analysis = self.entries[match["id"]]["analysis"]
+            if analysis:
+                return dict(
+                    analysis,
+                    source=SOURCE,
+                    similar_failure=match["test_name"],
+                    similarity=match["similarity"],
+                    timestamp=datetime.now().isoformat()
+                )
+        return None
+
+    def entry_id(self, failure):
+        """Id of the entry shared by all failures with the same fingerprint"""
+        error_type, message, frames = self.detector.fingerprint(failure)
+        text = "\n".join([error_type, message, *frames])
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+    def save(self):
+        """Append the entries changed since loading, or rewrite the index if it is mostly stale"""
+        if not self._changed:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self._lines + len(self._changed) > 2 * len(self.entries) + 1000:
+                tmp_path = self.path.with_suffix(".tmp")
+                with open(tmp_path, "w", encoding='utf-8') as f:
+                    for entry in self.entries.values():
+                        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                os.replace(tmp_path, self.path)
+                self._lines = len(self.entries)
+            else:
+                with open(self.path, "a", encoding='utf-8') as f:
+                    for entry in self._changed.values():
+                        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                self._lines += len(self._changed)
+            self._changed = {}
+        except OSError as e:
+            logger.warning(f"Could not write failure index {self.path}: {e}")
+
+    def _band_keys(self, error_type, shingles):
+        """LSH bucket keys of a shingle set, one per band"""
+        signature = self.detector.minhash(shingles)
+        rows = self.detector.rows
+        keys = []
+        for band in range(self.detector.bands):
+            text = f"{error_type}|{band}|{signature[band * rows:(band + 1) * rows]}"
+            keys.append(int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "big"))
+        return keys
+
+    def _index(self, entry):
+        for band in entry["bands"]:
+            bucket = self._buckets.setdefault(band, [])
+            if len(bucket) < self.max_bucket:
+                bucket.append(entry["id"])
+
+    def _entry_shingles(self, key):
+        shingles = self._shingles.get(key)
+        if shingles is None:
+            entry = self.entries[key]
+            shingles = self.detector.shingles({"error_message": entry["message"]})
+            shingles.update(f"frame:{frame}" for frame in entry["frames"])
+            self._shingles[key] = shingles
+        return shingles
+
+    @staticmethod
+    def _describe(entry, similarity):
+        analysis = entry["analysis"] or {}
+        return {
+            "id": entry["id"],
+            "similarity": round(similarity, 3),
+            "test_name": entry["tests"][0] if entry["tests"] else None,
+            "error_type": entry["error_type"],
+            "occurrences": entry["occurrences"],
+            "first_seen": entry["first_seen"],
+            "last_seen": entry["last_seen"],
+            "category": analysis.get("category"),
+            "probability_true_bug": analysis.get("probability_true_bug"),
+            "suggested_fixes": list(entry["fixes"])
+        }
+
+    def _load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                for line in f:
+                    self._lines += 1
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A run interrupted while appending
+                        continue
+                    if entry["id"] not in self._entries:
+                        self._entries[entry["id"]] = entry
+                        self._index(entry)
+                    else:
+                        self._entries[entry["id"]] = entry
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Ignoring unreadable failure index {self.path}: {e}")
@@ -0,0 +1,167 @@
+# automation_framework/src/ai_module/analyzers/streaming_analyzer.py
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+class StreamingAnalyzer:
+    """
+    Analyzes failures in the background while the remaining tests run.
+
+    Failures are submitted as they are recorded and analyzed by a thread pool of the
+    analyzer's max_concurrency, within the provider's rate limits. A failure similar to
+    one already submitted is not analyzed again (its cluster's verdict is reused when
+    the results are assembled), nor is one with a reusable earlier verdict or one the
+    local classifier is confident about.
+    With a batch token budget, failures recorded while every thread is busy queue up
+    and are sent together, packed into batches as by FailureAnalyzer; an idle thread
+    still sends a failure on its own right away.
+    The finished analyses are handed to the analyzer as prefetched results, so
+    FailureAnalyzer.analyze_failures() only requests the rest.
+    """
+
+    def __init__(self, analyzer):
+        """
+        Initialize the streaming analyzer
+
+        Args:
+            analyzer (FailureAnalyzer): Analyzer used for the background requests
+        """
+        self.analyzer = analyzer
+        self._executor = ThreadPoolExecutor(max_workers=analyzer.max_concurrency,
+                                            thread_name_prefix="streaming-analysis")
+        self._futures = {}
+        self._representatives = []
+        self._queue = []
+        self._draining = 0
+        self._lock = threading.Lock()
+        self.stats = {"submitted": 0, "analyzed": 0, "skipped": 0, "local": 0, "batches": 0, "errors": 0}
+
+    def submit(self, failure_data):
+        """
+        Start analyzing a failure unless an equal or similar failure was already submitted
+
+        Args:
+            failure_data (dict): Failure as recorded in failures.json
+        """
+        key = self.analyzer.analysis_key(failure_data)
+        if self.analyzer.known_verdict(failure_data) is not None or \
+                self.analyzer.local_verdict(failure_data) is not None:
+            # Answered without a model call when the results are assembled
+            with self._lock:
+                self.stats["submitted"] += 1
+                self.stats["local"] += 1
+            return
+        with self._lock:
+            self.stats["submitted"] += 1
+            detector = self.analyzer.pattern_detector
+            if key in self._futures or (detector and any(
+                    detector.similar(failure_data, representative) for representative in self._representatives)):
+                self.stats["skipped"] += 1
+                return
+            self._representatives.append(failure_data)
+            if not self.analyzer.batch_token_budget:
+                self._futures[key] = self._executor.submit(self._analyze, failure_data)
+            else:
+                self._futures[key] = Future()
+                self._queue.append((key, failure_data))
+                if self._draining < self.analyzer.max_concurrency:
+                    self._draining += 1
+                    self._executor.submit(self._drain)
+        logger.debug(f"Streaming analysis started for test: {failure_data.get('test_name')}")
+
+    def _analyze(self, failure_data):
+        analysis = self.analyzer.analyze_failure(failure_data)
+        with self._lock:
+            self.stats["analyzed"] += 1
+        return analysis
+
+    def _drain(self):
+        """Analyze the queued failures, one batch at a time, until the queue is empty"""
+        while True:
+            with self._lock:
+                if not self._queue:
+                    self._draining -= 1
+                    return
+                size = len(self.analyzer._pack_batches([failure for _, failure in self._queue])[0])
+                batch, self._queue = self._queue[:size], self._queue[size:]
+            # Skip the failures cancelled by shutdown()
+            batch = [(key, failure) for key, failure in batch
+                     if self._futures[key].set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            try:
+                entries = self.analyzer._analyze_batched([failure for _, failure in batch])
+            except Exception as e:
+                logger.warning(f"Streamed analysis of {len(batch)} failures failed: {e}")
+                with self._lock:
+                    self.stats["errors"] += len(batch)
+                for key, _ in batch:
+                    self._futures[key].set_exception(e)
+                continue
+            with self._lock:
+                self.stats["analyzed"] += len(batch)
+                self.stats["batches"] += len(batch) > 1
+            for (key, _), entry in zip(batch, entries):
+                self._futures[key].set_result(entry["analysis"])
+
+    def wait(self, timeout=None):
+        """
+        Wait for the submitted analyses
+
+        Args:
+            timeout (float, optional): Seconds to wait at most; None waits for all
+
+        Returns:
+            int: Number of analyses still running or queued
+        """
+        with self._lock:
+            futures = list(self._futures.values())
+        start = time.monotonic()
+        _, not_done = wait(futures, timeout=timeout)
+        if not_done:
+            logger.info(f"{len(not_done)} streamed analyses still running after {time.monotonic() - start:.1f}s")
+        return len(not_done)
+
+    def results(self):
+        """
+        Finished analyses, by analysis key
+
+        Returns:
+            dict: Analyses of the completed background requests; a request that raised
+                  gives an 'error' analysis, as FailureAnalyzer.analyze_failure() does
+        """
+        with self._lock:
+            futures = dict(self._futures)
+        results = {}
+        for key, future in futures.items():
+            if not future.done() or future.cancelled():
+                continue
+            error = future.exception()
+            results[key] = future.result() if error is None else {
+                "error": f"Analysis failed: {error}",
+                "timestamp": datetime.now().isoformat(),
+                "model": self.analyzer.model,
+                "provider": self.analyzer.provider
+            }
+        return results
+
+    @property
+    def pending_keys(self):
+        """Analysis keys of the requests that have not finished yet"""
+        with self._lock:
+            return {key for key, future in self._futures.items() if not future.done()}
+
+    def shutdown(self):
+        """Cancel the queued analyses and stop the worker threads once the running ones finish"""
+        with self._lock:
+            for future in self._futures.values():
+                future.cancel()
+            # No thread takes the queued failures any more; wake up whoever waits on them
+            for key, _ in self._queue:
+                self._futures[key].set_running_or_notify_cancel()
+            self._queue = []
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,193 @@
+# automation_framework/src/ai_module/analyzers/trace_compactor.py
+import re
+
+# Length caps of a compacted trace and of a single line in it
+MAX_TRACE_CHARS = 6000
+MAX_LINE_CHARS = 500
+
+# Path fragments of frames that are collapsed, with the label shown in their place
+INTERNAL_FRAMES = [
+    (re.compile(r"[/\\]selenium[/\\]"), "selenium"),
+    (re.compile(r"[/\\]_pytest[/\\]|[/\\]pytest[/\\]"), "pytest"),
+    (re.compile(r"[/\\]pluggy[/\\]"), "pluggy"),
+    (re.compile(r"[/\\]urllib3[/\\]|[/\\]http[/\\]client\.py"), "urllib3"),
+    (re.compile(r"[/\\](?:site|dist)-packages[/\\]"), "third-party"),
+    (re.compile(r"[/\\]lib[/\\]python\d+(?:\.\d+)?[/\\]|<frozen "), "stdlib"),
+]
+
+_FRAME_LINE = re.compile(r'^\s*File "([^"]+)", line (\d+), in (.+)$')
+# Native driver frames appended to Selenium messages, e.g. '#3 0x55d0c <unknown>' or '\tGetHandleVerifier [0x...]'
+_NATIVE_FRAME = re.compile(r"^(?:#\d+ |\t|\s*\S.*\[0x[0-9a-fA-F]+)")
+_TOKEN_PIECE = re.compile(r"[A-Za-z]+|\d+|\s+|[^\sA-Za-z\d]")
+
+def estimate_tokens(text):
+    """
+    Estimate the number of tokens of a text for BPE tokenizers of OpenAI-style models.
+    Letters count one token per four characters, digits one per three, punctuation one
+    each, and whitespace runs (except single spaces) one each, which tracks code and
+    stack traces much closer than a plain character count.
+
+    Args:
+        text (str): Text
+
+    Returns:
+        int: Estimated token count
+    """
+    count = 0
+    for piece in _TOKEN_PIECE.findall(text or ""):
+        first = piece[0]
+        if first.isalpha():
+            count += (len(piece) + 3) // 4
+        elif first.isdigit():
+            count += (len(piece) + 2) // 3
+        elif first.isspace():
+            count += piece != " "
+        else:
+            count += 1
+    return count
+
+def _internal_label(path):
+    for pattern, label in INTERNAL_FRAMES:
+        if pattern.search(path):
+            return label
+    return None
+
+def _parse(trace):
+    """Split a trace into ('frame', key, label, lines) and ('text', None, None, lines) blocks"""
+    blocks = []
+    lines = trace.splitlines()
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        match = _FRAME_LINE.match(line)
+        if match:
+            block = [line]
+            i += 1
+            # Source line and 3.11+ caret markers are indented deeper than the 'File' line
+            indent = len(line) - len(line.lstrip())
+            while i < len(lines) and lines[i].strip() and len(lines[i]) - len(lines[i].lstrip()) > indent \
+                    and not _FRAME_LINE.match(lines[i]):
+                block.append(lines[i])
+                i += 1
+            path, number, function = match.groups()
+            blocks.append(("frame", (path, number, function), _internal_label(path), block))
+            continue
+
+        if line.rstrip().endswith("Stacktrace:"):
+            native = 0
+            i += 1
+            while i < len(lines) and lines[i].strip() and _NATIVE_FRAME.match(lines[i]):
+                native += 1
+                i += 1
+            blocks.append(("text", None, None, [f"{line}  [{native} driver frames omitted]"] if native else [line]))
+            continue
+
+        blocks.append(("text", None, None, [line]))
+        i += 1
+    return blocks
+
+def _shorten_line(line, limit=MAX_LINE_CHARS):
+    if len(line) <= limit:
+        return line
+    return f"{line[:limit]}... [{len(line) - limit} more characters]"
+
+def truncate_middle(text, max_chars):
+    """
+    Cut a text to at most max_chars characters by dropping whole lines from the middle,
+    keeping the start and (with twice the room) the end, where the exception is
+
+    Args:
+        text (str): Text
+        max_chars (int): Maximum length
+
+    Returns:
+        str: Text of at most max_chars characters
+    """
+    if len(text) <= max_chars:
+        return text
+    lines = text.splitlines()
+    head, tail = [], []
+    head_room, tail_room = max_chars // 3, max_chars - max_chars // 3 - 40
+    while lines and len(lines[-1]) + 1 <= tail_room:
+        tail_room -= len(lines[-1]) + 1
+        tail.insert(0, lines.pop())
+    while lines and len(lines[0]) + 1 <= head_room + tail_room:
+        head_room -= len(lines[0]) + 1
+        head.append(lines.pop(0))
+    if not head and not tail:
+        # A single line longer than the whole budget
+        return text[:max_chars - 40] + f"... [{len(text) - max_chars + 40} more characters]"
+    return "\n".join(head + [f"... [{len(lines)} lines omitted] ..."] + tail)
+
+def fit_to_tokens(text, max_tokens):
+    """
+    Shorten a text until its estimated token count is within max_tokens
+
+    Args:
+        text (str): Text
+        max_tokens (int): Token budget
+
+    Returns:
+        str: Text, cut in the middle if needed
+    """
+    for _ in range(5):
+        tokens = estimate_tokens(text)
+        if tokens <= max_tokens:
+            return text
+        text = truncate_middle(text, max(80, int(len(text) * max_tokens / tokens * 0.95)))
+    return text
+
+def compact_trace(trace, max_chars=MAX_TRACE_CHARS):
+    """
+    Compact a formatted Python traceback for analysis. Test and page object frames are
+    kept; consecutive Selenium, pytest, pluggy, third-party and standard library frames
+    collapse into one line, except the frame that raised. Repeated frames (recursion)
+    are deduplicated, native driver stack traces in Selenium messages are dropped,
+    overlong lines are shortened and the result is capped at max_chars.
+
+    Args:
+        trace (str): Formatted traceback (or any pytest failure representation)
+        max_chars (int): Maximum length of the result
+
+    Returns:
+        str: Compacted trace
+    """
+    if not trace:
+        return ""
+    blocks = _parse(trace)
+    frame_positions = [i for i, block in enumerate(blocks) if block[0] == "frame"]
+    raising = frame_positions[-1] if frame_positions else None
+
+    output = []
+    collapsed = []          # labels of the internal frames being collapsed
+    previous_key, repeats = None, 0
+
+    def flush():
+        nonlocal repeats
+        if repeats:
+            output.append(f"  [Previous frame repeated {repeats} more times]")
+            repeats = 0
+        if collapsed:
+            labels = ", ".join(dict.fromkeys(collapsed))
+            output.append(f"  ... {len(collapsed)} {labels} frame{'s' if len(collapsed) > 1 else ''} hidden ...")
+            collapsed.clear()
+
+    for position, (kind, key, label, lines) in enumerate(blocks):
+        if kind == "frame" and key == previous_key:
+            if collapsed:
+                collapsed.append(label)
+            else:
+                repeats += 1
+            continue
+        if kind == "frame" and label and position != raising:
+            if repeats:
+                flush()
+            collapsed.append(label)
+            previous_key = key
+            continue
+        flush()
+        output.extend(_shorten_line(line) for line in lines)
+        previous_key = key if kind == "frame" else None
+    flush()
+
+    return truncate_middle("\n".join(output), max_chars)
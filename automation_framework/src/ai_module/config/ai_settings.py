@@ -13,15 +13,31 @@ class AISettings:
     """
     
     # Model configurations
+    # Rate limits are per provider and shared by all analyzers; None means unlimited.
+    # The HTTP transport settings are also shared per provider, see analyzers/http_transport.py
     MODEL_CONFIGS = {
         "openai": {
             "default_model": "gpt-3.5-turbo",
-            "env_key": "OPENAI_API_KEY"
+            "env_key": "OPENAI_API_KEY",
+            "requests_per_minute": 500,
+            "tokens_per_minute": 60000,
+            "max_concurrency": 4,
+            "http2": False,
+            "connect_timeout": 10.0,
+            "read_timeout": 60.0,
+            "max_retries": 4
         },
         "deepseek": {
             "base_url": "https://api.deepseek.com/",
             "default_model": "deepseek-chat",
-            "env_key": "DEEPSEEK_API_KEY"
+            "env_key": "DEEPSEEK_API_KEY",
+            "requests_per_minute": None,
+            "tokens_per_minute": None,
+            "max_concurrency": 4,
+            "http2": False,
+            "connect_timeout": 10.0,
+            "read_timeout": 60.0,
+            "max_retries": 4
         }
     }
     
@@ -106,7 +122,8 @@ class AISettings:
             model_name (str, optional): Specific model name to use
             
         Returns:
-            dict: Configuration dictionary with provider, api_key, model and optional base_url
+            dict: Configuration dictionary with provider, api_key, model, rate limits, HTTP transport
+                  settings and optional base_url
         """
         provider = provider.lower()
         if provider not in self.MODEL_CONFIGS:
@@ -117,8 +134,16 @@ class AISettings:
         config = {
             "provider": provider,
             "api_key": self.get_api_key(provider),
-            "model": model_name or provider_config["default_model"]
+            "model": model_name or provider_config["default_model"],
+            "requests_per_minute": provider_config.get("requests_per_minute"),
+            "tokens_per_minute": provider_config.get("tokens_per_minute"),
+            "max_concurrency": provider_config.get("max_concurrency", 1)
         }
+
+        # HTTP transport settings; the transport defaults apply to the others
+        for key in ("http2", "connect_timeout", "read_timeout", "max_retries", "max_connections"):
+            if key in provider_config:
+                config[key] = provider_config[key]
         
         # Only add base_url for providers that need it
         if "base_url" in provider_config:
@@ -0,0 +1,313 @@
+# automation_framework/src/ai_module/models/classifier.py
+import json
+import logging
+import math
+import os
+import random
+import re
+import time
+import zlib
+from datetime import datetime
+from pathlib import Path
+from ..analyzers.analysis_cache import normalize_message, top_frames
+
+logger = logging.getLogger(__name__)
+
+# Value of the 'source' field of verdicts made by the classifier; they are never trained on
+SOURCE = "local-classifier"
+
+# Probability from which a failure counts as a true bug
+TRUE_BUG_THRESHOLD = 0.5
+
+_WORD_PATTERN = re.compile(r"[a-z_][a-z0-9_]*|<[a-z]+>")
+
+def _normalize_category(category):
+    return " ".join(str(category or "").split()).title()
+
+def load_verdicts(analysis_files):
+    """
+    Read the LLM verdicts of past runs as training data
+
+    Args:
+        analysis_files (list): Paths of analysis.json files
+
+    Returns:
+        tuple: (failures, verdicts), two lists of dicts in the same order. Errors and
+               verdicts of the local classifier itself are skipped.
+    """
+    failures, verdicts = [], []
+    for path in analysis_files:
+        try:
+            with open(path, encoding='utf-8') as f:
+                results = json.load(f).get("results", [])
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Skipping unreadable analysis file {path}: {e}")
+            continue
+        for result in results:
+            analysis = result.get("analysis") or {}
+            if "error" in analysis or analysis.get("source") == SOURCE:
+                continue
+            if not isinstance(analysis.get("probability_true_bug"), (int, float)):
+                continue
+            failures.append(result.get("failure_data") or {})
+            verdicts.append(analysis)
+    return failures, verdicts
+
+class FailureClassifier:
+    """
+    Offline failure classifier: hashed word n-gram features of the error type, normalized
+    message and innermost stack frames, with a logistic regression for probability_true_bug
+    and a softmax regression for the category. Trained with SGD on past LLM verdicts,
+    CPU-only and dependency-free, and persisted as JSON.
+    """
+
+    def __init__(self, num_features=2 ** 18, ngrams=2, epochs=8, learning_rate=0.5,
+                 l2=1e-5, min_category_examples=2, seed=1):
+        """
+        Initialize an untrained classifier
+
+        Args:
+            num_features (int): Size of the hashed feature space
+            ngrams (int): Longest word n-gram used as a feature
+            epochs (int): Passes over the training data
+            learning_rate (float): Initial SGD step size
+            l2 (float): L2 regularization strength
+            min_category_examples (int): Categories with fewer verdicts are merged into 'Other'
+            seed (int): Seed of the training order, fixed so training is deterministic
+        """
+        self.num_features = num_features
+        self.ngrams = ngrams
+        self.epochs = epochs
+        self.learning_rate = learning_rate
+        self.l2 = l2
+        self.min_category_examples = min_category_examples
+        self.seed = seed
+
+        self.bias = 0.0
+        self.weights = {}
+        self.categories = []
+        self.category_bias = []
+        self.category_weights = {}
+        self.trained_on = 0
+        self.trained_at = None
+
+    @property
+    def trained(self):
+        return bool(self.trained_on)
+
+    def features(self, failure):
+        """
+        Hashed, L2-normalized sparse feature vector of a failure
+
+        Args:
+            failure (dict): Failure as recorded in failures.json
+
+        Returns:
+            dict: Feature index -> value
+        """
+        words = _WORD_PATTERN.findall(normalize_message(failure.get("error_message")).lower())
+        tokens = [f"type:{failure.get('error_type') or ''}"]
+        tokens += [f"frame:{frame}" for frame in top_frames(failure.get("stack_trace"))]
+        for n in range(1, self.ngrams + 1):
+            tokens += [" ".join(words[i:i + n]) for i in range(len(words) - n + 1)]
+
+        vector = {}
+        for token in tokens:
+            index = zlib.crc32(token.encode("utf-8")) % self.num_features
+            vector[index] = vector.get(index, 0.0) + 1.0
+        norm = math.sqrt(sum(value * value for value in vector.values())) or 1.0
+        return {index: value / norm for index, value in vector.items()}
+
+    def fit(self, failures, verdicts):
+        """
+        Train on LLM verdicts, replacing any previous training
+
+        Args:
+            failures (list): Failure dictionaries
+            verdicts (list): Analyses with 'probability_true_bug' and 'category', same order
+
+        Returns:
+            FailureClassifier: self
+        """
+        if not failures:
+            raise ValueError("No verdicts to train the failure classifier on")
+
+        counts = {}
+        for verdict in verdicts:
+            category = _normalize_category(verdict.get("category"))
+            counts[category] = counts.get(category, 0) + 1
+        self.categories = sorted(c for c, n in counts.items() if n >= self.min_category_examples and c)
+        if len(self.categories) < len(counts):
+            self.categories.append("Other")
+        category_index = {category: i for i, category in enumerate(self.categories)}
+
+        vectors = [self.features(failure) for failure in failures]
+        targets = [min(1.0, max(0.0, float(verdict["probability_true_bug"]))) for verdict in verdicts]
+        labels = [category_index.get(_normalize_category(v.get("category")), len(self.categories) - 1)
+                  for v in verdicts]
+
+        self.bias, self.weights = 0.0, {}
+        self.category_bias, self.category_weights = [0.0] * len(self.categories), {}
+        order = list(range(len(vectors)))
+        rng = random.Random(self.seed)
+        for epoch in range(self.epochs):
+            rng.shuffle(order)
+            rate = self.learning_rate / math.sqrt(epoch + 1)
+            for i in order:
+                self._step(vectors[i], targets[i], labels[i], rate)
+
+        self.trained_on = len(vectors)
+        self.trained_at = datetime.now().isoformat()
+        return self
+
+    def _step(self, vector, target, label, rate):
+        """One SGD step of both models on one example"""
+        error = self._probability(vector) - target
+        self.bias -= rate * error
+        for index, value in vector.items():
+            weight = self.weights.get(index, 0.0)
+            self.weights[index] = weight - rate * (error * value + self.l2 * weight)
+
+        probabilities = self._category_probabilities(vector)
+        gradients = [p - (k == label) for k, p in enumerate(probabilities)]
+        for k, gradient in enumerate(gradients):
+            self.category_bias[k] -= rate * gradient
+        for index, value in vector.items():
+            weights = self.category_weights.setdefault(index, [0.0] * len(self.categories))
+            for k, gradient in enumerate(gradients):
+                weights[k] -= rate * (gradient * value + self.l2 * weights[k])
+
+    def _probability(self, vector):
+        score = self.bias + sum(self.weights.get(index, 0.0) * value for index, value in vector.items())
+        if score < -30:
+            return 0.0
+        return 1.0 / (1.0 + math.exp(-score))
+
+    def _category_probabilities(self, vector):
+        scores = list(self.category_bias)
+        for index, value in vector.items():
+            weights = self.category_weights.get(index)
+            if weights:
+                scores = [score + weight * value for score, weight in zip(scores, weights)]
+        top = max(scores)
+        exps = [math.exp(score - top) for score in scores]
+        total = sum(exps)
+        return [e / total for e in exps]
+
+    def predict(self, failure):
+        """
+        Classify a failure
+
+        Args:
+            failure (dict): Failure as recorded in failures.json
+
+        Returns:
+            dict: Analysis with 'probability_true_bug', 'category', 'confidence' and the
+                  'coverage' of its features by the training data. The confidence is the
+                  lower of the true-bug and category certainties, scaled by the coverage,
+                  so unfamiliar failures are escalated.
+        """
+        if not self.trained:
+            raise ValueError("The failure classifier has not been trained")
+
+        vector = self.features(failure)
+        probability = self._probability(vector)
+        probabilities = self._category_probabilities(vector)
+        best = max(range(len(probabilities)), key=probabilities.__getitem__)
+        weight = sum(value * value for index, value in vector.items() if index in self.weights)
+        coverage = min(1.0, weight)
+
+        certainty = min(max(probability, 1.0 - probability), probabilities[best])
+        return {
+            "probability_true_bug": round(probability, 4),
+            "category": self.categories[best],
+            "confidence": round(certainty * coverage, 4),
+            "coverage": round(coverage, 4)
+        }
+
+    def evaluate(self, failures, verdicts, threshold=0.9):
+        """
+        Agreement of the classifier with LLM verdicts
+
+        Args:
+            failures (list): Failure dictionaries
+            verdicts (list): LLM analyses, same order
+            threshold (float): Confidence from which a verdict would be kept instead of escalated
+
+        Returns:
+            dict: Agreement on true bug vs not, mean absolute probability error, category
+                  agreement, the share of failures kept locally and the agreement on those,
+                  and the mean prediction time in microseconds
+        """
+        true_bug = category = kept = kept_agreement = 0
+        absolute_error = 0.0
+        start = time.perf_counter()
+        predictions = [self.predict(failure) for failure in failures]
+        elapsed = time.perf_counter() - start
+
+        for prediction, verdict in zip(predictions, verdicts):
+            expected = float(verdict["probability_true_bug"])
+            agrees = (prediction["probability_true_bug"] > TRUE_BUG_THRESHOLD) == (expected > TRUE_BUG_THRESHOLD)
+            true_bug += agrees
+            absolute_error += abs(prediction["probability_true_bug"] - expected)
+            category += prediction["category"] == _normalize_category(verdict.get("category"))
+            if prediction["confidence"] >= threshold:
+                kept += 1
+                kept_agreement += agrees
+
+        count = len(predictions) or 1
+        return {
+            "examples": len(predictions),
+            "true_bug_agreement": true_bug / count,
+            "probability_mae": absolute_error / count,
+            "category_agreement": category / count,
+            "threshold": threshold,
+            "kept_locally": kept / count,
+            "kept_agreement": kept_agreement / kept if kept else None,
+            "microseconds_per_prediction": elapsed / count * 1e6
+        }
+
+    def save(self, path):
+        """Write the model as JSON, atomically"""
+        path = Path(path)
+        state = {
+            "version": 1,
+            "num_features": self.num_features,
+            "ngrams": self.ngrams,
+            "trained_on": self.trained_on,
+            "trained_at": self.trained_at,
+            "bias": self.bias,
+            "weights": {str(index): round(weight, 6) for index, weight in self.weights.items()},
+            "categories": self.categories,
+            "category_bias": self.category_bias,
+            "category_weights": {str(index): [round(w, 6) for w in weights]
+                                 for index, weights in self.category_weights.items()}
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding='utf-8') as f:
+            json.dump(state, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a model written by save()
+
+        Args:
+            path (str or Path): Model file
+
+        Returns:
+            FailureClassifier: Trained classifier
+        """
+        with open(path, encoding='utf-8') as f:
+            state = json.load(f)
+        classifier = cls(num_features=state["num_features"], ngrams=state["ngrams"])
+        classifier.trained_on = state["trained_on"]
+        classifier.trained_at = state["trained_at"]
+        classifier.bias = state["bias"]
+        classifier.weights = {int(index): weight for index, weight in state["weights"].items()}
+        classifier.categories = state["categories"]
+        classifier.category_bias = state["category_bias"]
+        classifier.category_weights = {int(index): weights for index, weights in state["category_weights"].items()}
+        return classifier
@@ -27,6 +27,12 @@ def parse_args():
                       help='AI provider to use (openai/deepseek)')
     parser.add_argument('--model-name',
                       help='Specific model name to use (optional)')
+    parser.add_argument('--concurrency',
+                      type=int,
+                      help='Number of failures analyzed in parallel (optional)')
+    parser.add_argument('--max-prompt-tokens',
+                      type=int,
+                      help='Token budget of a single-failure prompt (optional)')
     parser.add_argument('--report-only',
                       action='store_true',
                       help='Generate reports from existing analysis without running new analysis')
@@ -69,7 +75,8 @@ def run_analysis():
     if not args.report_only:
         # Configure AI analyzer
         config = ai_settings.get_model_config(args.ai_provider, args.model_name)
-        analyzer = FailureAnalyzer(config)
+        analyzer = FailureAnalyzer(config, max_concurrency=args.concurrency,
+                                   max_prompt_tokens=args.max_prompt_tokens)
         
         # Run analysis
         logger.info(f"Analyzing {len(failures)} failures using {config['provider']}/{config['model']}...")
@@ -0,0 +1,77 @@
+# automation_framework/src/ai_module/train_classifier.py
+import argparse
+import logging
+import random
+from pathlib import Path
+
+from .models.classifier import FailureClassifier, load_verdicts
+
+logger = logging.getLogger(__name__)
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description='Train the local failure classifier on past LLM verdicts')
+    parser.add_argument('--analysis-files',
+                      nargs='+',
+                      default=["test_results/analysis.json"],
+                      help='analysis.json files of earlier runs')
+    parser.add_argument('--model-file',
+                      default="test_results/failure_classifier.json",
+                      help='Where the trained model is written')
+    parser.add_argument('--holdout',
+                      type=float,
+                      default=0.2,
+                      help='Share of the verdicts held back for the agreement report (0 trains on all)')
+    parser.add_argument('--threshold',
+                      type=float,
+                      default=0.9,
+                      help='Confidence from which a local verdict is kept instead of escalated')
+    return parser.parse_args()
+
+def format_report(report):
+    """Agreement report of FailureClassifier.evaluate() as text lines"""
+    kept_agreement = report["kept_agreement"]
+    return [
+        f"Evaluated on {report['examples']} held-out LLM verdicts",
+        f"True bug agreement: {report['true_bug_agreement']:.1%}",
+        f"Mean absolute probability error: {report['probability_mae']:.3f}",
+        f"Category agreement: {report['category_agreement']:.1%}",
+        f"Kept locally at confidence >= {report['threshold']}: {report['kept_locally']:.1%}"
+        + (f" ({kept_agreement:.1%} agreement)" if kept_agreement is not None else ""),
+        f"Prediction time: {report['microseconds_per_prediction']:.0f} us per failure"
+    ]
+
+def train_classifier():
+    """Train the classifier, report its agreement with held-out verdicts and save it"""
+    args = parse_args()
+
+    # Initialize logging
+    logging.basicConfig(level=logging.INFO,
+                       format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    failures, verdicts = load_verdicts(args.analysis_files)
+    if not failures:
+        logger.error(f"No usable verdicts found in: {', '.join(args.analysis_files)}")
+        return 1
+
+    order = list(range(len(failures)))
+    random.Random(1).shuffle(order)
+    held_out = int(len(order) * args.holdout) if len(order) >= 10 else 0
+    test, train = order[:held_out], order[held_out:]
+
+    classifier = FailureClassifier().fit([failures[i] for i in train], [verdicts[i] for i in train])
+    if test:
+        report = classifier.evaluate([failures[i] for i in test], [verdicts[i] for i in test], args.threshold)
+        for line in format_report(report):
+            logger.info(line)
+
+    # The saved model is trained on every verdict
+    if test:
+        classifier.fit(failures, verdicts)
+    classifier.save(Path(args.model_file))
+    logger.info(f"Classifier trained on {len(failures)} verdicts in {len(classifier.categories)} "
+                f"categories, saved to {args.model_file}")
+    return 0
+
+if __name__ == "__main__":
+    exit(train_classifier())
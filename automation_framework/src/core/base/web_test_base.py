@@ -1,29 +1,22 @@
 import pytest
-from ...web.drivers.browser_factory import BrowserFactory
 
 class WebTestBase:
     @pytest.fixture(scope="function")
-    def browser(self, request):
-        # Get browser type with a fallback
-        try:
-            browser_type = request.config.getoption("--browser")
-        except (ValueError, AttributeError):
-            browser_type = "chrome"
-            
-        # Get headless mode with a fallback
-        try:
-            headless = request.config.getoption("--headless")
-        except (ValueError, AttributeError):
-            headless = False
-            
-        # Initialize browser
-        driver = BrowserFactory.get_browser(browser_type, headless)
-        
-        # Set implicit wait
-        driver.implicitly_wait(10)
-        
+    def browser(self, request, browser_pool):
+        # Tests marked with fresh_browser get their own session, discarded afterwards
+        fresh = request.node.get_closest_marker("fresh_browser") is not None
+
+        # Get a browser from the worker pool; the rerun of a test gets its previous session
+        driver = browser_pool.acquire(fresh=fresh, held_for=request.node.nodeid)
+
+        # No implicit wait: page objects use explicit waits, and an implicit wait
+        # would stretch every poll of a missing element to its full duration
+        driver.implicitly_wait(0)
+
         # Return browser to test
         yield driver
-        
-        # Teardown
-        driver.quit()
\ No newline at end of file
+
+        # Teardown: reset state and hand the session back to the pool, or keep it
+        # for the in-process rerun of a failed quarantined test
+        rerun = getattr(request.node, "_asaltech_rerun_pending", False)
+        browser_pool.release(driver, discard=fresh, hold_for=request.node.nodeid if rerun else None)
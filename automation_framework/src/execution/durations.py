@@ -0,0 +1,171 @@
+# automation_framework/src/execution/durations.py
+import heapq
+import json
+import logging
+import os
+from pathlib import Path
+import pytest
+
+logger = logging.getLogger(__name__)
+
+def parse_shard(value):
+    """
+    Parse the --shard option
+
+    Args:
+        value (str): Shard as 'i/N', 1-based (e.g. '2/4')
+
+    Returns:
+        tuple: (index, count) with a 0-based index
+    """
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise pytest.UsageError(f"--shard must look like 'i/N', got: {value}")
+    if count < 1 or not 1 <= index <= count:
+        raise pytest.UsageError(f"--shard index must be between 1 and N, got: {value}")
+    return index - 1, count
+
+def balance(nodeids, bins, estimate):
+    """
+    Split tests into bins of similar total duration, longest processing time first:
+    tests are taken from longest to shortest and each goes to the bin with the
+    smallest total so far. The result only depends on the inputs, so every CI node
+    computes the same split from the same history.
+
+    Args:
+        nodeids (list): Test node IDs
+        bins (int): Number of bins (shards or workers)
+        estimate (callable): Node ID -> expected duration in seconds
+
+    Returns:
+        list: One list of node IDs per bin, each ordered longest first
+    """
+    ordered = sorted(nodeids, key=lambda nodeid: (-estimate(nodeid), nodeid))
+    assignments = [[] for _ in range(bins)]
+    totals = [(0.0, index) for index in range(bins)]
+    for nodeid in ordered:
+        total, index = heapq.heappop(totals)
+        assignments[index].append(nodeid)
+        heapq.heappush(totals, (total + estimate(nodeid), index))
+    return assignments
+
+def select_shard(config, items, shard, history):
+    """
+    Keep only the items of one shard, longest first
+
+    Args:
+        config: pytest config
+        items (list): Collected items, modified in place
+        shard (tuple): (index, count) as returned by parse_shard()
+        history (DurationHistory): Source of the duration estimates
+    """
+    index, count = shard
+    assigned = balance([item.nodeid for item in items], count, history.estimate)[index]
+
+    by_nodeid = {item.nodeid: item for item in items}
+    selected_ids = set(assigned)
+    deselected = [item for item in items if item.nodeid not in selected_ids]
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = [by_nodeid[nodeid] for nodeid in assigned]
+
+class DurationHistory:
+    """
+    Persisted per-test durations (setup + call + teardown), smoothed over runs.
+    Stored as JSON so it can be committed or shared as a CI artifact; all nodes
+    of a sharded run must use the same file to agree on the split.
+
+    Registered as a plugin in the controlling process, where it also sees the
+    reports replayed from parallel workers.
+    """
+
+    # Weight of the latest run in the smoothed duration
+    SMOOTHING = 0.3
+
+    # Duration assumed for tests without history when nothing is known at all
+    DEFAULT_DURATION = 1.0
+
+    def __init__(self, path):
+        """
+        Initialize the history
+
+        Args:
+            path (str or Path): JSON file holding {nodeid: seconds}
+        """
+        self.path = Path(path)
+        self.durations = self._load()
+        self._current = {}
+        self._default = self._typical()
+
+    def estimate(self, nodeid):
+        """
+        Expected duration of a test
+
+        Args:
+            nodeid (str): Test node ID
+
+        Returns:
+            float: Smoothed past duration, or the median of known tests if the test is new
+        """
+        return self.durations.get(nodeid, self._default)
+
+    def known(self, nodeids):
+        """Number of the given tests that have recorded durations"""
+        return sum(1 for nodeid in nodeids if nodeid in self.durations)
+
+    def add(self, nodeid, seconds):
+        """Add the duration of one phase of a test in the current run"""
+        self._current[nodeid] = self._current.get(nodeid, 0.0) + seconds
+
+    def save(self):
+        """Merge the current run into the history and write it atomically"""
+        if not self._current:
+            return
+
+        # Re-read so tests recorded by other runs since start-up are kept
+        durations = self._load()
+        for nodeid, seconds in self._current.items():
+            previous = durations.get(nodeid)
+            if previous is None:
+                durations[nodeid] = round(seconds, 3)
+            else:
+                durations[nodeid] = round(previous + self.SMOOTHING * (seconds - previous), 3)
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding='utf-8') as f:
+                json.dump(dict(sorted(durations.items())), f, indent=1)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write duration history {self.path}: {e}")
+            return
+
+        self.durations = durations
+        self._current = {}
+
+    @pytest.hookimpl
+    def pytest_runtest_logreport(self, report):
+        self.add(report.nodeid, report.duration)
+
+    @pytest.hookimpl
+    def pytest_sessionfinish(self, session):
+        self.save()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable duration history {self.path}: {e}")
+            return {}
+
+    def _typical(self):
+        if not self.durations:
+            return self.DEFAULT_DURATION
+        values = sorted(self.durations.values())
+        return values[len(values) // 2]
@@ -0,0 +1,279 @@
+# automation_framework/src/execution/flakiness.py
+import json
+import logging
+import os
+from pathlib import Path
+import pytest
+from _pytest.runner import call_and_report
+from .run_history import FAILED_OUTCOMES
+
+logger = logging.getLogger(__name__)
+
+class FlakinessTracker:
+    """
+    Rolling flakiness score per test, from its pass/fail history and the AI verdicts
+    of its failures. A test is flaky when its outcome keeps flipping between runs, or
+    it only passes on a rerun; the flip rate is discounted by the probability that
+    its failures are true bugs, so an intermittent product bug is not quarantined.
+
+    Scores are exponentially smoothed and only the tests executed in a run are
+    updated, so scoring costs nothing more than reading and writing one JSON file.
+
+    Registered as a plugin in the controlling process, where it also sees the
+    reports replayed from parallel workers.
+    """
+
+    # Weight of the latest run in the smoothed rates
+    SMOOTHING = 0.2
+
+    # Runs recorded before a test can be quarantined
+    MIN_RUNS = 3
+
+    def __init__(self, path, run_history=None):
+        """
+        Initialize the tracker
+
+        Args:
+            path (str or Path): JSON file of the scores
+            run_history (RunHistory, optional): Seeds the scores on first use
+        """
+        self.path = Path(path)
+        self.tests = self._load()
+        self._current = {}
+        self._verdicts = {}
+
+        if not self.tests and run_history is not None:
+            self._import_history(run_history)
+
+    def score(self, nodeid):
+        """
+        Flakiness score of a test
+
+        Args:
+            nodeid (str): Test node ID
+
+        Returns:
+            float: Smoothed flip rate, discounted by the last probability_true_bug; 0.0 for unknown tests
+        """
+        return self.tests.get(nodeid, {}).get("score", 0.0)
+
+    def quarantined(self, nodeids, threshold):
+        """
+        Tests flaky enough to be quarantined
+
+        Args:
+            nodeids (list): Test node IDs
+            threshold (float): Lowest flakiness score of a quarantined test
+
+        Returns:
+            dict: Node ID -> score of the quarantined tests
+        """
+        scores = {}
+        for nodeid in nodeids:
+            entry = self.tests.get(nodeid)
+            if entry and entry["runs"] >= self.MIN_RUNS and entry["score"] >= threshold:
+                scores[nodeid] = entry["score"]
+        return scores
+
+    def record_analysis(self, results):
+        """
+        Store the AI verdicts of this run's failures
+
+        Args:
+            results (dict): Output of FailureAnalyzer.analyze_failures()
+        """
+        for result in results.get("results", []):
+            probability = result.get("analysis", {}).get("probability_true_bug")
+            if result.get("test_name") and isinstance(probability, (int, float)):
+                self._verdicts[result["test_name"]] = probability
+
+    @pytest.hookimpl
+    def pytest_runtest_logreport(self, report):
+        test = self._current.setdefault(report.nodeid, {"failed": False, "skipped": False, "reruns": 0})
+        test["failed"] = test["failed"] or report.failed
+        test["skipped"] = test["skipped"] or report.skipped
+        test["reruns"] = max(test["reruns"], getattr(report, "reruns", 0))
+
+    @pytest.hookimpl
+    def pytest_unconfigure(self, config):
+        # After the terminal summary, so this run's AI verdicts are included
+        self.save()
+
+    def save(self):
+        """Update the scores of the tests executed in this run and write them atomically"""
+        if not self._current:
+            return
+
+        # Re-read so tests recorded by other runs since start-up are kept; on first use
+        # the scores seeded from the run history are the starting point
+        tests = self._load() or self.tests
+        for nodeid, observed in self._current.items():
+            if observed["skipped"] and not observed["failed"]:
+                continue
+            failed = observed["failed"]
+            entry = tests.setdefault(nodeid, {"runs": 0, "flip_rate": 0.0, "failure_rate": 0.0,
+                                              "last_outcome": None, "probability_true_bug": None})
+            # Passing only on a rerun is a flip within the run
+            flipped = observed["reruns"] > 0 and not failed
+            if entry["last_outcome"] is not None:
+                flipped = flipped or failed != (entry["last_outcome"] == "failed")
+
+            # The first run sets the failure rate; there is no earlier outcome to flip from
+            weight = self.SMOOTHING if entry["runs"] else 1.0
+            entry["runs"] += 1
+            entry["flip_rate"] = round(entry["flip_rate"] + self.SMOOTHING * (flipped - entry["flip_rate"]), 4)
+            entry["failure_rate"] = round(entry["failure_rate"] + weight * (failed - entry["failure_rate"]), 4)
+            entry["last_outcome"] = "failed" if failed else "passed"
+            if nodeid in self._verdicts:
+                entry["probability_true_bug"] = self._verdicts[nodeid]
+            entry["score"] = self._score(entry)
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding='utf-8') as f:
+                json.dump({"tests": dict(sorted(tests.items()))}, f, indent=1)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write flakiness scores {self.path}: {e}")
+            return
+
+        self.tests = tests
+        self._current = {}
+        self._verdicts = {}
+
+    @staticmethod
+    def _score(entry):
+        probability = entry.get("probability_true_bug")
+        return round(entry["flip_rate"] * (1.0 - (probability or 0.0)), 4)
+
+    def _load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f).get("tests", {})
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable flakiness scores {self.path}: {e}")
+            return {}
+
+    def _import_history(self, run_history):
+        """Start from the outcomes and verdicts of the runs in the run history"""
+        for nodeid, stats in run_history.test_stats(last_runs=10).items():
+            if stats["last_outcome"] == "skipped" and not stats["failures"]:
+                continue
+            verdict = stats["last_verdict"]
+            entry = {
+                "runs": stats["runs"],
+                "flip_rate": round(stats["flakiness_rate"], 4),
+                "failure_rate": round(stats["failure_rate"], 4),
+                "last_outcome": "failed" if stats["last_outcome"] in FAILED_OUTCOMES else "passed",
+                "probability_true_bug": verdict["probability_true_bug"] if verdict else None
+            }
+            entry["score"] = self._score(entry)
+            self.tests[nodeid] = entry
+
+class QuarantineLane:
+    """
+    Runs quarantined (known flaky) tests in a lane of their own at the end of the
+    session, reruns their failures in-process, and keeps their remaining failures
+    from failing the build. Failed attempts that are rerun are not reported; the
+    final report carries the number of reruns.
+
+    Registered in the controlling process, which orders the tests and reports the
+    lane, and in every worker, which runs them.
+    """
+
+    def __init__(self, tracker, threshold=0.3, reruns=2):
+        """
+        Initialize the lane
+
+        Args:
+            tracker (FlakinessTracker): Source of the flakiness scores
+            threshold (float): Lowest flakiness score of a quarantined test
+            reruns (int): Reruns of a failing quarantined test
+        """
+        self.tracker = tracker
+        self.threshold = threshold
+        self.reruns = max(0, reruns)
+        self.quarantined = {}
+        self.results = {}
+
+    def select(self, items):
+        """
+        Move the quarantined tests to the end, keeping the order within both lanes
+
+        Args:
+            items (list): Collected items, modified in place
+        """
+        self.quarantined = self.tracker.quarantined([item.nodeid for item in items], self.threshold)
+        if self.quarantined:
+            items[:] = ([item for item in items if item.nodeid not in self.quarantined]
+                        + [item for item in items if item.nodeid in self.quarantined])
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        score = self.quarantined.get(item.nodeid)
+        if score is None:
+            return None
+
+        item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+        for attempt in range(self.reruns + 1):
+            reports = self._run_attempt(item, nextitem, self.reruns - attempt)
+            if not item._asaltech_rerun_pending:
+                break
+
+        for report in reports:
+            report.quarantined = True
+            report.reruns = attempt
+            if report.failed:
+                # Like an expected failure, this keeps the session from failing
+                report.wasxfail = f"quarantined, flakiness {score:.2f}"
+            item.ihook.pytest_runtest_logreport(report=report)
+        item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+        return True
+
+    def _run_attempt(self, item, nextitem, reruns_left):
+        """One run of setup, call and teardown, as in pytest's runtestprotocol() but unlogged"""
+        item._asaltech_reruns_left = reruns_left
+        if hasattr(item, "_request") and not item._request:
+            item._initrequest()
+        reports = [call_and_report(item, "setup", log=False)]
+        if reports[0].passed and not item.config.getoption("setuponly", False):
+            reports.append(call_and_report(item, "call", log=False))
+
+        stopping = item.session.shouldfail or item.session.shouldstop
+        # Read by fixtures during teardown, e.g. to keep the browser session for the rerun
+        item._asaltech_rerun_pending = reruns_left > 0 and not stopping and any(r.failed for r in reports)
+        if stopping:
+            nextitem = None
+        elif item._asaltech_rerun_pending:
+            # Only the test's own fixtures are torn down; module, class and session fixtures are kept
+            nextitem = item.parent
+        reports.append(call_and_report(item, "teardown", log=False, nextitem=nextitem))
+
+        if hasattr(item, "_request"):
+            item._request = False
+            item.funcargs = None
+        return reports
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_report_teststatus(self, report):
+        if getattr(report, "quarantined", False) and report.failed:
+            return "quarantined", "Q", "QUARANTINED"
+        return None
+
+    @pytest.hookimpl
+    def pytest_runtest_logreport(self, report):
+        if not getattr(report, "quarantined", False):
+            return
+        if report.failed:
+            self.results[report.nodeid] = "failed"
+        elif report.when == "call" or report.skipped:
+            self.results.setdefault(report.nodeid, report.outcome)
+            if report.passed and report.reruns:
+                self.results[report.nodeid] = f"passed on attempt {report.reruns + 1}"
+
+def will_rerun(item, report):
+    """Check whether a failed report is from an attempt of a quarantined test that is rerun"""
+    return report.failed and getattr(item, "_asaltech_reruns_left", 0) > 0
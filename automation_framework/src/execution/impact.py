@@ -0,0 +1,334 @@
+# automation_framework/src/execution/impact.py
+import ast
+import hashlib
+import logging
+import subprocess
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Changes to these files never affect test behaviour
+IGNORED_SUFFIXES = (".md", ".rst")
+
+# Key of the parsed-file cache in the pytest cache
+CACHE_KEY = "asaltech/impact_index"
+
+def _git(cwd, *args):
+    return subprocess.run(
+        ["git", *args], cwd=str(cwd), capture_output=True, text=True, check=True
+    ).stdout.splitlines()
+
+def find_project_root(cwd, fallback):
+    """
+    Root of the tracked sources: the git work tree containing cwd, else the fallback
+
+    Args:
+        cwd (Path): Directory pytest was started in
+        fallback (Path): Directory used outside of a git work tree, e.g. the pytest rootdir
+    """
+    try:
+        return Path(_git(cwd, "rev-parse", "--show-toplevel")[0])
+    except (OSError, IndexError, subprocess.CalledProcessError):
+        return Path(fallback)
+
+def changed_files_since(ref, cwd):
+    """
+    List files changed relative to a git revision, including uncommitted and untracked files
+
+    Args:
+        ref (str): Git revision, e.g. 'origin/main'
+        cwd (Path): Directory inside the repository
+
+    Returns:
+        list: Absolute paths of the changed files
+    """
+    top = Path(_git(cwd, "rev-parse", "--show-toplevel")[0])
+    # From the top: ls-files lists paths relative to, and only below, its working directory
+    names = _git(top, "diff", "--name-only", ref) + _git(top, "ls-files", "--others", "--exclude-standard")
+    return [top / name for name in names if name]
+
+def _is_within(path, directory):
+    """Check whether a path is inside a directory (Path.is_relative_to is Python 3.9+)"""
+    try:
+        path.relative_to(directory)
+        return True
+    except ValueError:
+        return False
+
+class ImpactIndex:
+    """
+    File-level dependency index of a test suite: imports between project modules,
+    fixtures requested from conftest files and plugins, and conftest files that
+    apply to a directory. Used to select the tests a set of changed files can affect.
+
+    Parsed files are cached by content hash (checked only when mtime or size
+    changed), so an index update only re-parses files edited since the last run.
+    """
+
+    def __init__(self, project_root, cache=None):
+        """
+        Initialize the index
+
+        Args:
+            project_root (Path): Only modules below this directory are tracked
+            cache (dict, optional): Entries of a previous index, by relative path
+        """
+        self.project_root = Path(project_root).resolve()
+        self.search_paths = [self.project_root] + [
+            Path(p).resolve() for p in sys.path
+            if p and _is_within(Path(p).resolve(), self.project_root)
+        ]
+        self.entries = dict(cache or {})
+        self.stats = {"files": 0, "parsed": 0}
+
+    def update(self, roots):
+        """
+        Index the given files and every project module they depend on
+
+        Args:
+            roots (list): Test files, conftest files and plugin modules
+
+        Returns:
+            dict: Entries of all reachable files, by relative path (the new cache)
+        """
+        seen = {}
+        queue = deque(Path(root).resolve() for root in roots)
+        while queue:
+            path = queue.popleft()
+            key = self._key(path)
+            if key is None or key in seen or not path.is_file():
+                continue
+            entry = self._entry(path, key)
+            seen[key] = entry
+            queue.extend(self.project_root / dep for dep in entry["imports"])
+
+        self.entries = seen
+        self.stats["files"] = len(seen)
+        return seen
+
+    def affected(self, changed, test_files):
+        """
+        Select the test files a set of changed files can affect
+
+        Args:
+            changed (list): Changed file paths
+            test_files (list): Candidate test files
+
+        Returns:
+            tuple: (affected test files as a set of Paths, reason to run everything or None)
+        """
+        dependents = self._dependents()
+        queue = deque()
+        for path in changed:
+            path = Path(path).resolve()
+            key = self._key(path)
+            if key is None or path.suffix in IGNORED_SUFFIXES:
+                continue
+            if path.suffix == ".py" and not path.exists():
+                # Its importers are no longer in the index, but will fail to import now
+                return set(Path(f).resolve() for f in test_files), f"Python file deleted: {key}"
+            if path.suffix != ".py":
+                # Data and configuration files are read at runtime, not imported
+                return set(Path(f).resolve() for f in test_files), f"non-Python file changed: {key}"
+            queue.append(key)
+
+        reached = set(queue)
+        while queue:
+            for dependent in dependents.get(queue.popleft(), ()):
+                if dependent not in reached:
+                    reached.add(dependent)
+                    queue.append(dependent)
+
+        return {Path(f).resolve() for f in test_files if self._key(Path(f).resolve()) in reached}, None
+
+    def _dependents(self):
+        """Reverse dependency graph: file -> files depending on it"""
+        providers = {}
+        for key, entry in self.entries.items():
+            for name in entry["fixtures"]:
+                providers.setdefault(name, set()).add(key)
+        conftests = [key for key in self.entries if Path(key).name == "conftest.py"]
+
+        dependents = {}
+        for key, entry in self.entries.items():
+            dependencies = set(entry["imports"])
+            for name in entry["requests"]:
+                dependencies.update(providers.get(name, ()))
+            directory = Path(key).parent
+            dependencies.update(c for c in conftests
+                                if c != key and _is_within(directory, Path(c).parent))
+            for dependency in dependencies - {key}:
+                dependents.setdefault(dependency, set()).add(key)
+        return dependents
+
+    def _key(self, path):
+        """Path relative to the project root, or None if outside of it"""
+        try:
+            return path.relative_to(self.project_root).as_posix()
+        except ValueError:
+            return None
+
+    def _entry(self, path, key):
+        """Cached entry of a file, re-parsed only if its content changed"""
+        stat = path.stat()
+        entry = self.entries.get(key)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return entry
+
+        content = path.read_bytes()
+        digest = hashlib.sha1(content).hexdigest()
+        if entry and entry["hash"] == digest:
+            return dict(entry, mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+
+        self.stats["parsed"] += 1
+        imports, fixtures, requests = self._parse(path, content)
+        return {
+            "hash": digest,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "imports": sorted(imports),
+            "fixtures": sorted(fixtures),
+            "requests": sorted(requests)
+        }
+
+    def _parse(self, path, content):
+        """Extract imported project files, defined fixtures and requested fixture names"""
+        imports, fixtures, requests = set(), set(), set()
+        try:
+            tree = ast.parse(content, filename=str(path))
+        except SyntaxError as e:
+            logger.warning(f"Cannot parse {path} for impact analysis: {e}")
+            return imports, fixtures, requests
+
+        package = self._package_of(path.resolve())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    imports.update(self._resolve(alias.name))
+            elif isinstance(node, ast.ImportFrom):
+                base = self._absolute(node.module, node.level, package)
+                if base is None:
+                    continue
+                imports.update(self._resolve(base))
+                for alias in node.names:
+                    # 'from package import module' imports the submodule
+                    imports.update(self._resolve(f"{base}.{alias.name}", exact=True))
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                requests.update(arg.arg for arg in node.args.args + node.args.kwonlyargs
+                                if arg.arg not in ("self", "cls"))
+                name = self._fixture_name(node)
+                if name:
+                    fixtures.add(name)
+            elif isinstance(node, ast.Call) and self._is_usefixtures(node.func):
+                requests.update(arg.value for arg in node.args
+                                if isinstance(arg, ast.Constant) and isinstance(arg.value, str))
+
+        imports.discard(self._key(path.resolve()))
+        return imports, fixtures, requests
+
+    def _resolve(self, module, exact=False):
+        """
+        Project files executed by importing a module: the module and its parent packages
+
+        Args:
+            module (str): Dotted module name
+            exact (bool): Only return the module itself, if it is a project module
+        """
+        parts = module.split(".")
+        for base in self.search_paths:
+            files = []
+            for depth in range(1, len(parts) + 1):
+                candidate = base.joinpath(*parts[:depth])
+                if (candidate / "__init__.py").is_file():
+                    files.append(candidate / "__init__.py")
+                elif depth == len(parts) and candidate.with_suffix(".py").is_file():
+                    files.append(candidate.with_suffix(".py"))
+                elif not candidate.is_dir():
+                    # Not importable from this search path
+                    files = None
+                    break
+            if files:
+                if exact:
+                    files = files[-1:]
+                return {key for key in (self._key(f.resolve()) for f in files) if key}
+        return set()
+
+    def _package_of(self, path):
+        """Dotted name of the package containing a file, relative to the first matching search path"""
+        for base in self.search_paths:
+            if _is_within(path, base):
+                return ".".join(path.relative_to(base).parts[:-1])
+        return ""
+
+    @staticmethod
+    def _absolute(module, level, package):
+        """Turn a (possibly relative) 'from' import into an absolute module name"""
+        if not level:
+            return module
+        parts = package.split(".") if package else []
+        if level - 1 > len(parts):
+            return None
+        base = parts[:len(parts) - (level - 1)]
+        return ".".join(base + ([module] if module else [])) or None
+
+    @staticmethod
+    def _fixture_name(node):
+        """Name under which a decorated function is registered as a fixture, or None"""
+        for decorator in node.decorator_list:
+            call = decorator if isinstance(decorator, ast.Call) else None
+            target = call.func if call else decorator
+            name = target.attr if isinstance(target, ast.Attribute) else getattr(target, "id", None)
+            if name != "fixture":
+                continue
+            if call:
+                for keyword in call.keywords:
+                    if keyword.arg == "name" and isinstance(keyword.value, ast.Constant):
+                        return keyword.value.value
+            return node.name
+        return None
+
+    @staticmethod
+    def _is_usefixtures(func):
+        return isinstance(func, ast.Attribute) and func.attr == "usefixtures"
+
+def select_affected(config, items, changed):
+    """
+    Keep only the items in test files affected by the changed files
+
+    Args:
+        config: pytest config
+        items (list): Collected items, modified in place
+        changed (list): Changed file paths
+
+    Returns:
+        str: Summary of the selection for the terminal
+    """
+    start = time.perf_counter()
+    cache = getattr(config, "cache", None)
+    root = find_project_root(config.invocation_params.dir, config.rootpath)
+    index = ImpactIndex(root, cache.get(CACHE_KEY, {}) if cache else None)
+
+    test_files = {Path(str(item.path)).resolve() for item in items}
+    plugin_files = [Path(module.__file__) for module in config.pluginmanager.get_plugins()
+                    if getattr(module, "__file__", None)]
+    entries = index.update(sorted(test_files) + plugin_files)
+    if cache:
+        cache.set(CACHE_KEY, entries)
+
+    affected, run_all = index.affected(changed, test_files)
+    selected = [item for item in items if Path(str(item.path)).resolve() in affected]
+    deselected = [item for item in items if Path(str(item.path)).resolve() not in affected]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+
+    summary = (f"Impact analysis: {len(changed)} changed files, {len(selected)} of "
+               f"{len(selected) + len(deselected)} tests selected from {len(affected)} test files "
+               f"({index.stats['files']} files indexed, {index.stats['parsed']} re-parsed, "
+               f"{time.perf_counter() - start:.2f}s)")
+    if run_all:
+        summary += f"; running everything: {run_all}"
+    return summary
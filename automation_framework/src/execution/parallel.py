@@ -0,0 +1,281 @@
+# automation_framework/src/execution/parallel.py
+import json
+import logging
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+import pytest
+from .durations import balance
+
+logger = logging.getLogger(__name__)
+
+def parse_worker_count(value):
+    """
+    Parse the --workers option
+
+    Args:
+        value (str): Number of workers or 'auto' for one per CPU
+
+    Returns:
+        int: Number of worker processes (at least 1)
+    """
+    if value is None:
+        return 1
+    if str(value).lower() == "auto":
+        return os.cpu_count() or 1
+    try:
+        return max(1, int(value))
+    except ValueError:
+        raise pytest.UsageError(f"--workers must be a number or 'auto', got: {value}")
+
+def is_worker(config):
+    """Check whether this pytest process is a worker started by the parallel controller"""
+    return getattr(config.option, 'worker_index', None) is not None
+
+def worker_id(config):
+    """Name of this worker process (e.g. 'worker0'), or None in the controller/single process"""
+    if not is_worker(config):
+        return None
+    return f"worker{config.option.worker_index}"
+
+def assign_round_robin(nodeids, workers):
+    """
+    Split test node IDs between workers in collection order
+
+    Args:
+        nodeids (list): Collected test node IDs
+        workers (int): Number of workers
+
+    Returns:
+        list: One list of node IDs per worker
+    """
+    assignments = [[] for _ in range(workers)]
+    for index, nodeid in enumerate(nodeids):
+        assignments[index % workers].append(nodeid)
+    return assignments
+
+def select_assigned_items(config, items):
+    """
+    Keep only the items assigned to this worker, in assignment order
+
+    Args:
+        config: pytest config of the worker
+        items (list): Collected items, modified in place
+    """
+    with open(config.option.worker_assignment, encoding='utf-8') as f:
+        assigned = json.load(f)[config.option.worker_index]
+
+    by_nodeid = {item.nodeid: item for item in items}
+    selected = [by_nodeid[nodeid] for nodeid in assigned if nodeid in by_nodeid]
+    selected_ids = set(assigned)
+    deselected = [item for item in items if item.nodeid not in selected_ids]
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+
+class WorkerReporter:
+    """
+    Registered in worker processes: streams every test report to a JSONL
+    shard that the controller tails and replays into its own terminal.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        shard = Path(config.option.worker_assignment).parent / f"{worker_id(config)}.reports.jsonl"
+        self._file = open(shard, "w", encoding='utf-8')
+
+    @pytest.hookimpl
+    def pytest_runtest_logreport(self, report):
+        data = self.config.hook.pytest_report_to_serializable(config=self.config, report=report)
+        self._file.write(json.dumps(data, default=str) + "\n")
+        self._file.flush()
+
+    @pytest.hookimpl
+    def pytest_sessionfinish(self, session):
+        self._file.close()
+
+class ParallelController:
+    """
+    Registered in the controlling pytest process when --workers > 1.
+    Runs the collected tests in worker subprocesses (each with its own browser
+    pool and failure shard), replays their reports, and merges the shards so
+    failure analysis runs once in the controller.
+    """
+
+    POLL_INTERVAL = 0.2
+
+    def __init__(self, config, workers):
+        self.config = config
+        self.workers = workers
+        self.work_dir = Path(tempfile.mkdtemp(prefix="asaltech-parallel-"))
+
+    def assign(self, nodeids):
+        """Split node IDs between workers, balanced by duration history when available"""
+        history = getattr(self.config, '_asaltech_duration_history', None)
+        if history is None:
+            assignments = assign_round_robin(nodeids, self.workers)
+        else:
+            assignments = balance(nodeids, self.workers, history.estimate)
+
+        # Keep tests promoted by --order=failures-first at the front of every worker
+        promoted = getattr(self.config, '_asaltech_promoted_tests', None)
+        if promoted:
+            rank = {nodeid: index for index, (nodeid, _, _) in enumerate(promoted)}
+            for assignment in assignments:
+                assignment.sort(key=lambda nodeid: rank.get(nodeid, len(rank)))
+        return assignments
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtestloop(self, session):
+        if session.testsfailed and not session.config.option.continue_on_collection_errors:
+            raise session.Interrupted(f"{session.testsfailed} errors during collection")
+        if session.config.option.collectonly:
+            return True
+
+        assignments = [a for a in self.assign([item.nodeid for item in session.items]) if a]
+        assignment_file = self.work_dir / "assignment.json"
+        with open(assignment_file, "w", encoding='utf-8') as f:
+            json.dump(assignments, f)
+
+        terminal = self.config.pluginmanager.get_plugin("terminalreporter")
+        if terminal is not None:
+            terminal.write_line(
+                f"Running {len(session.items)} tests on {len(assignments)} worker processes"
+            )
+
+        processes = [self._spawn(index, assignment_file) for index in range(len(assignments))]
+        try:
+            crashed = self._follow(session, processes)
+        finally:
+            for process, log in processes:
+                self._stop(process)
+                log.close()
+
+        self._merge_failure_shards(len(assignments))
+
+        if crashed:
+            session.testsfailed += len(crashed)
+            for index in crashed:
+                self._report_crash(terminal, index)
+        else:
+            shutil.rmtree(self.work_dir, ignore_errors=True)
+        return True
+
+    def _spawn(self, index, assignment_file):
+        """Start one worker pytest process with the controller's arguments"""
+        args = [
+            sys.executable, "-m", "pytest",
+            *self.config.invocation_params.args,
+            # '=' form: a bare existing path argument would take part in rootdir detection
+            f"--worker-index={index}",
+            f"--worker-assignment={assignment_file}",
+            # Separate cache per worker so --lf/--ff state does not race between workers
+            "-o", f"cache_dir={self.work_dir / f'cache{index}'}"
+        ]
+        env = dict(os.environ, ASALTECH_WORKER_INDEX=str(index))
+        log = open(self.work_dir / f"worker{index}.log", "w", encoding='utf-8')
+        process = subprocess.Popen(
+            args,
+            cwd=str(self.config.invocation_params.dir),
+            env=env,
+            stdout=log,
+            stderr=subprocess.STDOUT
+        )
+        return process, log
+
+    def _follow(self, session, processes):
+        """Tail worker report shards until every worker exits; returns indexes of crashed workers"""
+        shards = {}
+        running = True
+        stopping = False
+        while running:
+            running = any(process.poll() is None for process, _ in processes)
+            if running and not stopping and (session.shouldstop or session.shouldfail):
+                # e.g. --maxfail or the true-bug budget was reached by a replayed report
+                stopping = True
+                for process, _ in processes:
+                    self._stop(process)
+            for index in range(len(processes)):
+                shard = self.work_dir / f"worker{index}.reports.jsonl"
+                if index not in shards and shard.exists():
+                    shards[index] = open(shard, encoding='utf-8')
+                if index in shards:
+                    self._replay(shards[index])
+            if running:
+                time.sleep(self.POLL_INTERVAL)
+
+        for shard in shards.values():
+            self._replay(shard)
+            shard.close()
+
+        # Exit codes 0-2 and 5 are normal outcomes (passed, failed, interrupted, nothing collected)
+        return [index for index, (process, _) in enumerate(processes)
+                if process.returncode not in (0, 1, 2, 5)]
+
+    @staticmethod
+    def _stop(process):
+        """Interrupt a running worker so it still tears down its fixtures (and browsers)"""
+        if process.poll() is not None:
+            return
+        if os.name == "nt":
+            process.terminate()
+        else:
+            # Exits with code 2 like a pytest run stopped with Ctrl+C
+            process.send_signal(signal.SIGINT)
+
+    def _replay(self, shard):
+        """Feed complete report lines from a shard into the controller's hooks"""
+        hook = self.config.hook
+        while True:
+            position = shard.tell()
+            line = shard.readline()
+            if not line.endswith("\n"):
+                # Partially written line: read it again on the next pass
+                shard.seek(position)
+                return
+            report = hook.pytest_report_from_serializable(config=self.config, data=json.loads(line))
+            if report.when == "setup":
+                hook.pytest_runtest_logstart(nodeid=report.nodeid, location=report.location)
+            hook.pytest_runtest_logreport(report=report)
+            if report.when == "teardown":
+                hook.pytest_runtest_logfinish(nodeid=report.nodeid, location=report.location)
+
+    def _merge_failure_shards(self, workers):
+        """
+        Add every worker's failure shard to the run history, which exports failures.json
+        at the end of the session, or else append it to failures.json; then remove the shards
+        """
+        output_dir = getattr(self.config, '_asaltech_output_dir', None)
+        if output_dir is None:
+            return
+
+        run_history = getattr(self.config, '_asaltech_run_history', None)
+        for index in range(workers):
+            shard = output_dir / f"failures.worker{index}.json"
+            if not shard.exists():
+                continue
+            text = shard.read_text(encoding='utf-8')
+            if run_history is not None:
+                for line in text.splitlines():
+                    if line.strip():
+                        run_history.add_failure(json.loads(line))
+            else:
+                with open(output_dir / "failures.json", "a", encoding='utf-8') as merged:
+                    merged.write(text)
+            shard.unlink()
+
+    def _report_crash(self, terminal, index):
+        log_file = self.work_dir / f"worker{index}.log"
+        message = f"Worker {index} exited abnormally, see {log_file}"
+        logger.error(message)
+        if terminal is not None:
+            terminal.write_line(message, red=True)
+            tail = log_file.read_text(encoding='utf-8', errors='replace').splitlines()[-20:]
+            for line in tail:
+                terminal.write_line(f"  {line}")
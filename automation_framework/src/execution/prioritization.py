@@ -0,0 +1,196 @@
+# automation_framework/src/execution/prioritization.py
+import json
+import logging
+import os
+from pathlib import Path
+import pytest
+
+logger = logging.getLogger(__name__)
+
+# Analyses above this probability count as true bugs, as in the AI Analysis Summary
+TRUE_BUG_THRESHOLD = 0.5
+
+class FailureHistory:
+    """
+    Failures and AI verdicts of recent runs, persisted next to failures.json.
+    Used to run recently failing, likely-true-bug tests first and to recognize
+    failures of tests that were already confirmed as true bugs.
+
+    Registered as a plugin in the controlling process, where it also sees the
+    reports replayed from parallel workers.
+    """
+
+    # Weight of a failure halves with every run since it happened
+    DECAY = 0.5
+
+    # Failures older than this many runs are forgotten
+    MAX_AGE = 20
+
+    def __init__(self, path):
+        """
+        Initialize the history
+
+        Args:
+            path (str or Path): JSON file of the history
+        """
+        self.path = Path(path)
+        data = self._load()
+        self.run = data.get("run", 0)
+        self.tests = data.get("tests", {})
+        self._failed = {}
+        self._executed = False
+
+        if not self.tests:
+            # First use: start from the analysis of the previous run, if any
+            self._import_analysis(self.path.parent / "analysis.json")
+
+    def priority(self, nodeid):
+        """
+        Priority of a test, higher runs earlier
+
+        Args:
+            nodeid (str): Test node ID
+
+        Returns:
+            tuple: (score, reason); score is 0.0 for tests without recent failures
+        """
+        entry = self.tests.get(nodeid)
+        if entry is None:
+            return 0.0, None
+
+        runs_ago = self.run - entry["last_failed_run"] + 1
+        probability = entry.get("probability_true_bug")
+        score = self.DECAY ** (runs_ago - 1) * (1 + (probability or 0.0))
+
+        when = "last run" if runs_ago == 1 else f"{runs_ago} runs ago"
+        verdict = "not analyzed" if probability is None else f"p(true bug)={probability:.2f}"
+        return score, f"failed {when}, {entry['failures']}x in history, {verdict}"
+
+    def is_true_bug(self, nodeid):
+        """Check whether the last analyzed failure of a test was classified as a true bug"""
+        probability = self.tests.get(nodeid, {}).get("probability_true_bug")
+        return probability is not None and probability > TRUE_BUG_THRESHOLD
+
+    def record_analysis(self, results):
+        """
+        Store the AI verdicts of this run's failures
+
+        Args:
+            results (dict): Output of FailureAnalyzer.analyze_failures()
+        """
+        for result in results.get("results", []):
+            nodeid = result.get("test_name")
+            probability = result.get("analysis", {}).get("probability_true_bug")
+            if nodeid in self._failed and probability is not None:
+                self._failed[nodeid]["probability_true_bug"] = probability
+
+    @pytest.hookimpl
+    def pytest_runtest_logreport(self, report):
+        self._executed = True
+        if report.failed and report.when == "call":
+            crash = getattr(report.longrepr, "reprcrash", None)
+            self._failed[report.nodeid] = {"error": crash.message.split("\n")[0] if crash else None}
+
+    @pytest.hookimpl
+    def pytest_unconfigure(self, config):
+        # After the terminal summary, so this run's AI verdicts are included
+        self.save()
+
+    def save(self):
+        """Add this run to the history and write it atomically"""
+        if not self._executed:
+            return
+
+        self.run += 1
+        for nodeid, failure in self._failed.items():
+            entry = self.tests.setdefault(nodeid, {"failures": 0})
+            entry["failures"] += 1
+            entry["last_failed_run"] = self.run
+            entry["last_error"] = failure.get("error")
+            # A new failure without a verdict keeps the previous one
+            if "probability_true_bug" in failure:
+                entry["probability_true_bug"] = failure["probability_true_bug"]
+
+        self.tests = {nodeid: entry for nodeid, entry in self.tests.items()
+                      if self.run - entry["last_failed_run"] < self.MAX_AGE}
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding='utf-8') as f:
+                json.dump({"run": self.run, "tests": dict(sorted(self.tests.items()))}, f, indent=1)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write failure history {self.path}: {e}")
+
+        self._failed = {}
+        self._executed = False
+
+    def _load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable failure history {self.path}: {e}")
+            return {}
+
+    def _import_analysis(self, analysis_file):
+        try:
+            with open(analysis_file, encoding='utf-8') as f:
+                results = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        self.run = 1
+        for result in results.get("results", []):
+            if not result.get("test_name"):
+                continue
+            entry = self.tests.setdefault(result["test_name"], {"failures": 0, "last_failed_run": 1})
+            entry["failures"] += 1
+            entry["last_error"] = result.get("failure_data", {}).get("error_message", "").split("\n")[0]
+            probability = result.get("analysis", {}).get("probability_true_bug")
+            if probability is not None:
+                entry["probability_true_bug"] = probability
+
+def prioritize(items, history):
+    """
+    Move recently failing tests to the front, highest priority first.
+    The sort is stable, so the remaining tests keep their order (e.g. longest first).
+
+    Args:
+        items (list): Collected items, reordered in place
+        history (FailureHistory): Source of the priorities
+
+    Returns:
+        list: (nodeid, score, reason) of the promoted tests, in run order
+    """
+    priorities = {item.nodeid: history.priority(item.nodeid) for item in items}
+    items.sort(key=lambda item: -priorities[item.nodeid][0])
+    return [(item.nodeid, *priorities[item.nodeid]) for item in items if priorities[item.nodeid][0] > 0]
+
+class TrueBugBudget:
+    """
+    Stops the run once a number of failures of tests already confirmed as true
+    bugs by a previous analysis have been seen: the build is broken, the rest of
+    the suite will not change that.
+    """
+
+    def __init__(self, history, limit):
+        self.history = history
+        self.limit = limit
+        self.seen = []
+        self.session = None
+
+    @pytest.hookimpl
+    def pytest_sessionstart(self, session):
+        self.session = session
+
+    @pytest.hookimpl
+    def pytest_runtest_logreport(self, report):
+        if not (report.failed and report.when == "call" and self.history.is_true_bug(report.nodeid)):
+            return
+        self.seen.append(report.nodeid)
+        if len(self.seen) >= self.limit and self.session is not None:
+            self.session.shouldstop = f"true-bug budget exhausted ({len(self.seen)} confirmed true-bug failures)"
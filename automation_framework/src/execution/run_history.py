@@ -0,0 +1,438 @@
+# automation_framework/src/execution/run_history.py
+import json
+import logging
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+import pytest
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    exit_status INTEGER,
+    environment TEXT,
+    arguments TEXT,
+    analysis_metadata TEXT
+);
+CREATE TABLE IF NOT EXISTS outcomes (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    duration REAL NOT NULL,
+    message TEXT,
+    PRIMARY KEY (run_id, nodeid)
+);
+CREATE INDEX IF NOT EXISTS outcomes_by_test ON outcomes (nodeid, run_id);
+CREATE TABLE IF NOT EXISTS failures (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT,
+    error_type TEXT,
+    error_message TEXT,
+    recorded_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS failures_by_run ON failures (run_id);
+CREATE INDEX IF NOT EXISTS failures_by_test ON failures (nodeid, run_id);
+CREATE TABLE IF NOT EXISTS analyses (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    position INTEGER NOT NULL,
+    nodeid TEXT,
+    probability_true_bug REAL,
+    category TEXT,
+    source TEXT,
+    analyzed_at TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (run_id, position)
+);
+CREATE INDEX IF NOT EXISTS analyses_by_test ON analyses (nodeid, run_id);
+"""
+
+# Outcomes that count as a failed execution of a test
+FAILED_OUTCOMES = ("failed", "error")
+
+class RunHistory:
+    """
+    SQLite store of test runs: the outcome and duration of every test (passes included),
+    the failures collected for analysis and their AI verdicts, kept across runs and
+    indexed by test node ID. failures.json and analysis.json are exports of one run.
+
+    Registered as a plugin in the controlling process, where it also sees the reports
+    replayed from parallel workers. Rows are buffered and written in one transaction
+    per batch, so the hooks do not pay for a commit per test.
+    """
+
+    # Completed tests buffered before they are written
+    BATCH_SIZE = 500
+
+    def __init__(self, path):
+        """
+        Open (or create) the store
+
+        Args:
+            path (str or Path): SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(self.path), timeout=30)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+        self.run_id = None
+        self._current = {}
+        self._outcomes = []
+        self._failures = []
+
+    # Recording
+
+    def start(self, environment=None, arguments=()):
+        """
+        Start recording a run
+
+        Args:
+            environment (str, optional): Environment the tests run against
+            arguments (list): Command line arguments of the run
+
+        Returns:
+            int: Id of the run
+        """
+        with self._connection:
+            cursor = self._connection.execute(
+                "INSERT INTO runs (started_at, environment, arguments) VALUES (?, ?, ?)",
+                (datetime.now().isoformat(), environment, json.dumps(list(arguments)))
+            )
+        self.run_id = cursor.lastrowid
+        return self.run_id
+
+    def add_report(self, report):
+        """
+        Add one phase report of a test; the test is buffered once its teardown is reported
+
+        Args:
+            report: pytest TestReport
+        """
+        test = self._current.setdefault(report.nodeid, {"outcome": "passed", "duration": 0.0, "message": None})
+        test["duration"] += report.duration
+        if report.failed:
+            if test["outcome"] not in FAILED_OUTCOMES:
+                test["outcome"] = "failed" if report.when == "call" else "error"
+                crash = getattr(report.longrepr, "reprcrash", None)
+                test["message"] = crash.message.split("\n")[0][:500] if crash else None
+        elif report.skipped and test["outcome"] == "passed":
+            test["outcome"] = "skipped"
+
+        if report.when == "teardown":
+            self._outcomes.append((report.nodeid, self._current.pop(report.nodeid)))
+            if len(self._outcomes) >= self.BATCH_SIZE:
+                self.flush()
+
+    def add_failure(self, failure):
+        """
+        Buffer a failure collected for analysis
+
+        Args:
+            failure (dict): Failure as recorded in failures.json
+        """
+        self._failures.append(failure)
+
+    def flush(self):
+        """Write the buffered outcomes and failures in one transaction"""
+        if not self._outcomes and not self._failures:
+            return
+        try:
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO outcomes (run_id, nodeid, outcome, duration, message) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(self.run_id, nodeid, test["outcome"], round(test["duration"], 4), test["message"])
+                     for nodeid, test in self._outcomes]
+                )
+                self._connection.executemany(
+                    "INSERT INTO failures (run_id, nodeid, error_type, error_message, recorded_at, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [(self.run_id, failure.get("test_name"), failure.get("error_type"),
+                      failure.get("error_message"), failure.get("timestamp"),
+                      json.dumps(failure, ensure_ascii=False))
+                     for failure in self._failures]
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not write run history {self.path}: {e}")
+            return
+        self._outcomes = []
+        self._failures = []
+
+    def record_analysis(self, results):
+        """
+        Store the AI verdicts of this run, replacing any stored earlier in the session
+
+        Args:
+            results (dict): Output of FailureAnalyzer.analyze_failures()
+        """
+        rows = []
+        for position, result in enumerate(results.get("results", [])):
+            analysis = result.get("analysis") or {}
+            probability = analysis.get("probability_true_bug")
+            rows.append((
+                self.run_id, position, result.get("test_name"),
+                probability if isinstance(probability, (int, float)) else None,
+                analysis.get("category"), analysis.get("source"), result.get("timestamp"),
+                json.dumps(result, ensure_ascii=False)
+            ))
+        try:
+            with self._connection:
+                self._connection.execute("DELETE FROM analyses WHERE run_id = ?", (self.run_id,))
+                self._connection.executemany(
+                    "INSERT INTO analyses (run_id, position, nodeid, probability_true_bug, category, "
+                    "source, analyzed_at, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+                )
+                self._connection.execute(
+                    "UPDATE runs SET analysis_metadata = ? WHERE id = ?",
+                    (json.dumps(results.get("metadata", {}), ensure_ascii=False), self.run_id)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not write analyses to run history {self.path}: {e}")
+
+    def finish(self, exit_status):
+        """Write the remaining buffered rows and close the run"""
+        # Tests of a crashed worker may never report their teardown
+        self._outcomes.extend(self._current.items())
+        self._current = {}
+        self.flush()
+        try:
+            with self._connection:
+                self._connection.execute(
+                    "UPDATE runs SET finished_at = ?, exit_status = ? WHERE id = ?",
+                    (datetime.now().isoformat(), int(exit_status), self.run_id)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not write run history {self.path}: {e}")
+
+    def close(self):
+        self._connection.close()
+
+    # Queries
+
+    def runs(self, limit=20):
+        """
+        Most recent runs
+
+        Args:
+            limit (int): Number of runs returned
+
+        Returns:
+            list: Runs, newest first, with 'id', 'started_at', 'finished_at', 'exit_status',
+                  'tests' and 'failed'
+        """
+        rows = self._connection.execute(
+            "SELECT runs.id, started_at, finished_at, exit_status, COUNT(outcomes.nodeid) AS tests, "
+            "SUM(outcomes.outcome IN ('failed', 'error')) AS failed "
+            "FROM runs LEFT JOIN outcomes ON outcomes.run_id = runs.id "
+            "GROUP BY runs.id ORDER BY runs.id DESC LIMIT ?", (limit,)
+        )
+        return [dict(row, failed=row["failed"] or 0) for row in rows]
+
+    def test_stats(self, nodeids=None, last_runs=20):
+        """
+        Flakiness rate, mean duration and last verdict per test over its most recent runs
+
+        Args:
+            nodeids (list, optional): Tests to report; all recorded tests by default
+            last_runs (int): Most recent runs of each test taken into account
+
+        Returns:
+            dict: Node ID -> {'runs', 'failures', 'failure_rate', 'flakiness_rate',
+                  'mean_duration', 'last_outcome', 'last_verdict'}. The flakiness rate is
+                  the share of consecutive executions (skips excluded) whose outcome flipped
+                  between pass and fail; the last verdict is the most recent AI analysis
+                  with a probability, or None.
+        """
+        history = {}
+        for chunk in self._chunks(nodeids):
+            where, parameters = self._nodeid_filter(chunk)
+            rows = self._connection.execute(
+                "SELECT nodeid, outcome, duration FROM ("
+                "  SELECT nodeid, outcome, duration, run_id, "
+                "  ROW_NUMBER() OVER (PARTITION BY nodeid ORDER BY run_id DESC) AS recent "
+                f"  FROM outcomes {where}"
+                ") WHERE recent <= ? ORDER BY nodeid, run_id", parameters + [last_runs]
+            )
+            for row in rows:
+                history.setdefault(row["nodeid"], []).append((row["outcome"], row["duration"]))
+
+        verdicts = self.last_verdicts(history)
+        stats = {}
+        for nodeid, runs in history.items():
+            executed = [outcome in FAILED_OUTCOMES for outcome, _ in runs if outcome != "skipped"]
+            failures = sum(executed)
+            flips = sum(1 for previous, current in zip(executed, executed[1:]) if previous != current)
+            stats[nodeid] = {
+                "runs": len(runs),
+                "failures": failures,
+                "failure_rate": failures / len(executed) if executed else 0.0,
+                "flakiness_rate": flips / (len(executed) - 1) if len(executed) > 1 else 0.0,
+                "mean_duration": sum(duration for _, duration in runs) / len(runs),
+                "last_outcome": runs[-1][0],
+                "last_verdict": verdicts.get(nodeid)
+            }
+        return stats
+
+    def flakiness_rate(self, nodeid, last_runs=20):
+        """Share of consecutive executions of a test whose outcome flipped, see test_stats()"""
+        return self.test_stats([nodeid], last_runs).get(nodeid, {}).get("flakiness_rate", 0.0)
+
+    def mean_duration(self, nodeid, last_runs=20):
+        """Mean duration of a test over its most recent runs, or None if it never ran"""
+        return self.test_stats([nodeid], last_runs).get(nodeid, {}).get("mean_duration")
+
+    def last_verdict(self, nodeid):
+        """Most recent AI verdict of a test, see last_verdicts()"""
+        return self.last_verdicts([nodeid]).get(nodeid)
+
+    def last_verdicts(self, nodeids=None):
+        """
+        Most recent AI verdict with a probability per test
+
+        Args:
+            nodeids (list, optional): Tests to report; all analyzed tests by default
+
+        Returns:
+            dict: Node ID -> {'run_id', 'probability_true_bug', 'category', 'source', 'analyzed_at'}
+        """
+        verdicts = {}
+        for chunk in self._chunks(nodeids):
+            where, parameters = self._nodeid_filter(chunk, "probability_true_bug IS NOT NULL")
+            rows = self._connection.execute(
+                "SELECT nodeid, run_id, probability_true_bug, category, source, analyzed_at FROM ("
+                "  SELECT *, ROW_NUMBER() OVER (PARTITION BY nodeid ORDER BY run_id DESC, position DESC) AS recent "
+                f"  FROM analyses {where}"
+                ") WHERE recent = 1", parameters
+            )
+            for row in rows:
+                verdicts[row["nodeid"]] = {key: row[key] for key in row.keys() if key != "nodeid"}
+        return verdicts
+
+    def failures(self, run_id=None):
+        """
+        Failures collected in a run
+
+        Args:
+            run_id (int, optional): Run; the current run by default
+
+        Returns:
+            list: Failure dictionaries as recorded in failures.json, in recording order
+        """
+        self.flush()
+        rows = self._connection.execute(
+            "SELECT data FROM failures WHERE run_id = ? ORDER BY id", (run_id or self.run_id,)
+        )
+        return [json.loads(row["data"]) for row in rows]
+
+    def analysis(self, run_id=None):
+        """
+        AI analysis of a run
+
+        Args:
+            run_id (int, optional): Run; the current run by default
+
+        Returns:
+            dict: As returned by FailureAnalyzer.analyze_failures(), or None if the run was not analyzed
+        """
+        run_id = run_id or self.run_id
+        run = self._connection.execute(
+            "SELECT analysis_metadata FROM runs WHERE id = ?", (run_id,)
+        ).fetchone()
+        if run is None or run["analysis_metadata"] is None:
+            return None
+        rows = self._connection.execute(
+            "SELECT data FROM analyses WHERE run_id = ? ORDER BY position", (run_id,)
+        )
+        return {
+            "metadata": json.loads(run["analysis_metadata"]),
+            "results": [json.loads(row["data"]) for row in rows]
+        }
+
+    # Exports
+
+    def export_failures(self, path, run_id=None):
+        """Write the failures of a run as failures.json (JSON lines), atomically"""
+        failures = self.failures(run_id)
+        self._write(path, "".join(json.dumps(failure, ensure_ascii=False) + "\n" for failure in failures))
+        return len(failures)
+
+    def export_analysis(self, path, run_id=None):
+        """Write the analysis of a run as analysis.json, atomically; returns False if there is none"""
+        results = self.analysis(run_id)
+        if results is None:
+            return False
+        self._write(path, json.dumps(results, indent=2))
+        return True
+
+    # Hooks
+
+    @pytest.hookimpl
+    def pytest_sessionstart(self, session):
+        config = session.config
+        self.start(getattr(config.option, 'env', None), config.invocation_params.args)
+
+    @pytest.hookimpl
+    def pytest_runtest_logreport(self, report):
+        self.add_report(report)
+
+    @pytest.hookimpl
+    def pytest_sessionfinish(self, session, exitstatus):
+        # Before the terminal summary, which analyzes the exported failures
+        self.finish(exitstatus)
+        failures_file = getattr(session.config, '_asaltech_failures_file', None)
+        if failures_file is not None:
+            try:
+                self.export_failures(failures_file)
+            except OSError as e:
+                logger.warning(f"Could not export failures to {failures_file}: {e}")
+
+    @pytest.hookimpl
+    def pytest_unconfigure(self, config):
+        self.close()
+
+    def _create_schema(self):
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            raise sqlite3.DatabaseError(f"{self.path} was written by a newer schema version ({version})")
+        with self._connection:
+            self._connection.executescript(SCHEMA)
+            self._connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    @staticmethod
+    def _chunks(nodeids, size=500):
+        """Node IDs in chunks below SQLite's limit of query parameters; [None] for all tests"""
+        if nodeids is None:
+            return [None]
+        nodeids = list(nodeids)
+        return [nodeids[i:i + size] for i in range(0, len(nodeids), size)]
+
+    @staticmethod
+    def _nodeid_filter(nodeids, condition=None):
+        conditions, parameters = [], []
+        if nodeids is not None:
+            conditions.append(f"nodeid IN ({', '.join('?' * len(nodeids))})")
+            parameters = list(nodeids)
+        if condition:
+            conditions.append(condition)
+        return (f"WHERE {' AND '.join(conditions)}" if conditions else ""), parameters
+
+    @staticmethod
+    def _write(path, text):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
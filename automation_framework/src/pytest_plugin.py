@@ -7,6 +7,7 @@ from datetime import datetime
 import logging
 import sys
 import os
+import argparse
 
 logger = logging.getLogger(__name__)
 
@@ -29,12 +30,190 @@ def pytest_addoption(parser):
         action="store_true",
         help="Automatically analyze failures after test run"
     )
+    group.addoption(
+        "--ai-concurrency",
+        action="store",
+        type=int,
+        help="Number of failures analyzed in parallel (defaults to the provider's max_concurrency setting)"
+    )
+    group.addoption(
+        "--ai-cache-ttl",
+        action="store",
+        type=float,
+        default=168,
+        help="Hours a cached failure analysis is reused for the same failure signature (0 disables the cache)"
+    )
+    group.addoption(
+        "--ai-cluster-threshold",
+        action="store",
+        type=float,
+        default=0.8,
+        help="Similarity (0-1) from which failures are clustered and analyzed once; 0 analyzes every failure"
+    )
+    group.addoption(
+        "--ai-batch-tokens",
+        action="store",
+        type=int,
+        help="Pack several failures into one analysis request of at most this many prompt tokens (default: one failure per request)"
+    )
+    group.addoption(
+        "--ai-max-prompt-tokens",
+        action="store",
+        type=int,
+        help="Token budget of a single-failure analysis prompt; longer stack traces are shortened (default: 2000)"
+    )
+    group.addoption(
+        "--ai-classifier",
+        action="store",
+        help="Model file of the local failure classifier (see train_classifier); failures it classifies "
+             "confidently are not sent to the AI provider"
+    )
+    group.addoption(
+        "--ai-classifier-threshold",
+        action="store",
+        type=float,
+        default=0.9,
+        help="Confidence (0-1) from which a local classifier verdict is kept instead of escalated (default: 0.9)"
+    )
+    group.addoption(
+        "--ai-reuse-similarity",
+        action="store",
+        type=float,
+        default=0,
+        help="Similarity (0-1) from which the verdict of an earlier, similar failure is reused instead of "
+             "asking the AI provider; 0 always asks (default)"
+    )
+    group.addoption(
+        "--ai-stream",
+        action="store_true",
+        help="Start analyzing failures in the background while the remaining tests run"
+    )
+    group.addoption(
+        "--ai-stream-deadline",
+        action="store",
+        type=float,
+        default=60.0,
+        help="Seconds the terminal summary waits for streamed analyses still running; later results "
+             "are added to analysis.json and the report before pytest exits (default: 60)"
+    )
+    group.addoption(
+        "--ai-http2",
+        action="store_true",
+        help="Send analysis requests over HTTP/2 (requires the 'h2' package, otherwise HTTP/1.1 is used)"
+    )
     group.addoption(
         "--output-dir",
         action="store",
         help="Custom output directory for test results and reports (relative to project root)"
     )
 
+    web_group = parser.getgroup("web_sessions", "Web browser session management")
+    web_group.addoption(
+        "--browser-pool-size",
+        action="store",
+        type=int,
+        default=1,
+        help="Number of idle browser sessions kept alive per worker for reuse (0 launches a new browser per test)"
+    )
+    web_group.addoption(
+        "--browser-prewarm",
+        action="store",
+        type=int,
+        default=0,
+        help="Number of browser sessions launched ahead of time in the background (0 disables prewarming)"
+    )
+    web_group.addoption(
+        "--launch-profile",
+        action="store",
+        help="Browser launch profile (default/fidelity/fast-ci). Defaults to the 'web.launch_profile' value of the environment YAML file"
+    )
+    web_group.addoption(
+        "--reuse-driver-service",
+        action="store_true",
+        help="Keep one long-lived driver process (chromedriver/geckodriver/...) per worker and open sessions against it"
+    )
+    web_group.addoption(
+        "--slow-wait-threshold",
+        action="store",
+        type=float,
+        default=2.0,
+        help="Explicit waits taking at least this many seconds are listed in the terminal summary"
+    )
+    web_group.addoption(
+        "--driver-offline",
+        action="store_true",
+        help="Only use driver binaries from the local driver manifest, never download or probe online"
+    )
+
+    execution_group = parser.getgroup("parallel_execution", "Parallel test execution")
+    execution_group.addoption(
+        "--workers",
+        action="store",
+        default="1",
+        help="Number of worker processes running tests in parallel, each with its own browsers ('auto' for one per CPU)"
+    )
+    execution_group.addoption(
+        "--shard",
+        action="store",
+        help="Run only shard i of N (e.g. 2/4), with shards balanced by recorded test durations"
+    )
+    execution_group.addoption(
+        "--duration-history",
+        action="store",
+        help="JSON file of recorded test durations used for sharding and scheduling (default: .test_durations.json in the rootdir)"
+    )
+    execution_group.addoption(
+        "--run-history",
+        action="store",
+        help="SQLite file keeping the outcomes, durations, failures and AI verdicts of every run (default with --analyze-failures: run_history.db in the output directory)"
+    )
+    execution_group.addoption(
+        "--order",
+        action="store",
+        choices=("collection", "failures-first"),
+        default="collection",
+        help="Test order: 'failures-first' runs recently failing tests first, likely true bugs before others"
+    )
+    execution_group.addoption(
+        "--max-true-bugs",
+        action="store",
+        type=int,
+        default=0,
+        help="Stop the run after this many failures of tests confirmed as true bugs by a previous analysis (0 disables)"
+    )
+    execution_group.addoption(
+        "--quarantine",
+        action="store_true",
+        help="Run known flaky tests last in a quarantine lane with in-process reruns; their failures do not fail the build"
+    )
+    execution_group.addoption(
+        "--flaky-threshold",
+        action="store",
+        type=float,
+        default=0.3,
+        help="Flakiness score (flip rate of recent outcomes, discounted by the AI true-bug probability) from which a test is quarantined"
+    )
+    execution_group.addoption(
+        "--quarantine-reruns",
+        action="store",
+        type=int,
+        default=2,
+        help="In-process reruns of a failing quarantined test, in the same browser session"
+    )
+    execution_group.addoption(
+        "--changed-files",
+        action="store",
+        help="Comma-separated list of changed files; only tests that can be affected by them are run"
+    )
+    execution_group.addoption(
+        "--changed-since",
+        action="store",
+        help="Git revision (e.g. origin/main); only tests affected by files changed since then are run"
+    )
+    # Internal options passed by the controller to the worker processes
+    execution_group.addoption("--worker-index", action="store", type=int, default=None, help=argparse.SUPPRESS)
+    execution_group.addoption("--worker-assignment", action="store", default=None, help=argparse.SUPPRESS)
+
 def _get_app_name_from_path(paths):
     """Extract the app name from the test paths"""
     # Example path: examples/web_the_internet/tests/test_login.py
@@ -55,9 +234,127 @@ def _get_app_name_from_path(paths):
     
     return None
 
+def _get_browser_options(config):
+    """Read the browser type and headless flag, with fallbacks if the options are not registered"""
+    try:
+        browser_type = config.getoption("--browser")
+    except (ValueError, AttributeError):
+        browser_type = "chrome"
+
+    try:
+        headless = config.getoption("--headless")
+    except (ValueError, AttributeError):
+        headless = False
+
+    return browser_type, headless
+
+def _get_launch_profile(config):
+    """Read the launch profile from the command line, falling back to the environment YAML file"""
+    launch_profile = getattr(config.option, 'launch_profile', None)
+    if launch_profile:
+        return launch_profile
+
+    from automation_framework.src.web.config.web_settings import web_settings
+    return web_settings.launch_profile
+
+@pytest.fixture(scope="session")
+def browser_pool(request):
+    """Worker-wide pool of reusable browser sessions"""
+    from automation_framework.src.web.drivers.browser_pool import BrowserPool
+
+    browser_type, headless = _get_browser_options(request.config)
+    pool = BrowserPool(
+        browser_type,
+        headless,
+        size=request.config.getoption("--browser-pool-size"),
+        prewarm=request.config.getoption("--browser-prewarm"),
+        launch_profile=_get_launch_profile(request.config)
+    )
+    request.config._asaltech_browser_pool = pool
+
+    yield pool
+
+    pool.close()
+
+    from automation_framework.src.web.drivers.service_manager import driver_service_manager
+    driver_service_manager.stop_all()
+
 @pytest.hookimpl(trylast=True)
 def pytest_configure(config):
     """Set up test environment and ensure output directories exist"""
+    config.addinivalue_line(
+        "markers",
+        "fresh_browser: run the test in a newly launched browser instead of a pooled session"
+    )
+
+    if getattr(config.option, 'driver_offline', False):
+        from automation_framework.src.web.drivers.driver_resolver import driver_resolver
+        driver_resolver.offline = True
+
+    if getattr(config.option, 'reuse_driver_service', False):
+        from automation_framework.src.web.drivers.service_manager import driver_service_manager
+        driver_service_manager.enabled = True
+
+    from automation_framework.src.web.actions.wait_actions import wait_recorder
+    wait_recorder.slow_threshold = getattr(config.option, 'slow_wait_threshold', 2.0)
+
+    from automation_framework.src.execution.parallel import (
+        ParallelController, WorkerReporter, is_worker, parse_worker_count, worker_id
+    )
+    if is_worker(config):
+        config.pluginmanager.register(WorkerReporter(config), "asaltech_worker_reporter")
+    else:
+        workers = parse_worker_count(getattr(config.option, 'workers', "1"))
+        history_path = getattr(config.option, 'duration_history', None)
+        # Durations are only needed to balance shards and workers; plain runs write nothing
+        if history_path or workers > 1 or getattr(config.option, 'shard', None):
+            from automation_framework.src.execution.durations import DurationHistory
+            config._asaltech_duration_history = DurationHistory(history_path or config.rootpath / ".test_durations.json")
+            config.pluginmanager.register(config._asaltech_duration_history, "asaltech_duration_history")
+
+        run_history_path = getattr(config.option, 'run_history', None)
+        if (run_history_path or config.option.analyze_failures) and not config.option.collectonly:
+            import sqlite3
+            from automation_framework.src.execution.run_history import RunHistory
+            run_history_path = run_history_path or _get_output_dir(config) / "run_history.db"
+            try:
+                config._asaltech_run_history = RunHistory(run_history_path)
+                config.pluginmanager.register(config._asaltech_run_history, "asaltech_run_history")
+            except sqlite3.Error as e:
+                logger.warning(f"Run history disabled, could not open {run_history_path}: {e}")
+
+        max_true_bugs = getattr(config.option, 'max_true_bugs', 0)
+        failures_first = getattr(config.option, 'order', "collection") == "failures-first"
+        if failures_first or max_true_bugs > 0 or config.option.analyze_failures:
+            from automation_framework.src.execution.prioritization import FailureHistory, TrueBugBudget
+            config._asaltech_failure_history = FailureHistory(_get_output_dir(config) / "failure_history.json")
+            config.pluginmanager.register(config._asaltech_failure_history, "asaltech_failure_history")
+
+            if max_true_bugs > 0:
+                config._asaltech_true_bug_budget = TrueBugBudget(config._asaltech_failure_history, max_true_bugs)
+                config.pluginmanager.register(config._asaltech_true_bug_budget, "asaltech_true_bug_budget")
+
+        if getattr(config.option, 'quarantine', False) or config.option.analyze_failures:
+            from automation_framework.src.execution.flakiness import FlakinessTracker
+            config._asaltech_flakiness = FlakinessTracker(
+                _get_output_dir(config) / "flakiness.json", getattr(config, '_asaltech_run_history', None)
+            )
+            config.pluginmanager.register(config._asaltech_flakiness, "asaltech_flakiness")
+
+        if workers > 1 and not config.option.collectonly:
+            config.pluginmanager.register(ParallelController(config, workers), "asaltech_parallel_controller")
+
+    if getattr(config.option, 'quarantine', False):
+        from automation_framework.src.execution.flakiness import FlakinessTracker, QuarantineLane
+        # Workers only read the scores; the controller updates them
+        tracker = getattr(config, '_asaltech_flakiness', None) or FlakinessTracker(_get_output_dir(config) / "flakiness.json")
+        config._asaltech_quarantine = QuarantineLane(
+            tracker,
+            threshold=getattr(config.option, 'flaky_threshold', 0.3),
+            reruns=getattr(config.option, 'quarantine_reruns', 2)
+        )
+        config.pluginmanager.register(config._asaltech_quarantine, "asaltech_quarantine")
+
     if not config.option.analyze_failures:
         return
 
@@ -70,8 +367,12 @@ def pytest_configure(config):
     # Store the output directory in config for later use
     config._asaltech_output_dir = output_dir
     
-    # Initialize failures file for this test run
-    failures_file = output_dir / "failures.json"
+    # Initialize failures file for this test run; workers write their own shard,
+    # which the controller merges into failures.json (an export of the run history
+    # at the end of the session when the history is enabled)
+    worker = worker_id(config)
+    failures_file = output_dir / (f"failures.{worker}.json" if worker else "failures.json")
+    config._asaltech_failures_file = failures_file
     with open(failures_file, "w") as f:
         f.write("")
     
@@ -101,6 +402,67 @@ def _format_traceback(excinfo):
         excinfo.tb
     ))
 
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """Keep only the tests of this worker or shard"""
+    from automation_framework.src.execution.parallel import is_worker, select_assigned_items
+    quarantine = getattr(config, '_asaltech_quarantine', None)
+    if is_worker(config):
+        select_assigned_items(config, items)
+        if quarantine is not None:
+            quarantine.select(items)
+        return
+
+    changed = _get_changed_files(config)
+    if changed is not None:
+        from automation_framework.src.execution.impact import select_affected
+        config._asaltech_impact_summary = select_affected(config, items, changed)
+
+    shard = getattr(config.option, 'shard', None)
+    if shard:
+        from automation_framework.src.execution.durations import parse_shard, select_shard
+        history = config._asaltech_duration_history
+        select_shard(config, items, parse_shard(shard), history)
+
+        nodeids = [item.nodeid for item in items]
+        config._asaltech_shard_summary = (
+            f"Shard {shard}: {len(nodeids)} tests, estimated "
+            f"{sum(history.estimate(nodeid) for nodeid in nodeids):.1f}s "
+            f"({history.known(nodeids)} with recorded durations, longest first)"
+        )
+
+    if getattr(config.option, 'order', "collection") == "failures-first":
+        from automation_framework.src.execution.prioritization import prioritize
+        config._asaltech_promoted_tests = prioritize(items, config._asaltech_failure_history)
+
+    if quarantine is not None:
+        quarantine.select(items)
+
+def _get_changed_files(config):
+    """Changed files given with --changed-files or --changed-since, or None if neither is set"""
+    changed_files = getattr(config.option, 'changed_files', None)
+    changed_since = getattr(config.option, 'changed_since', None)
+    if not changed_files and not changed_since:
+        return None
+
+    changed = []
+    if changed_files:
+        base = config.invocation_params.dir
+        changed += [base / name.strip() for name in changed_files.split(",") if name.strip()]
+    if changed_since:
+        import subprocess
+        from automation_framework.src.execution.impact import changed_files_since
+        try:
+            changed += changed_files_since(changed_since, config.invocation_params.dir)
+        except (OSError, subprocess.CalledProcessError) as e:
+            raise pytest.UsageError(f"Could not list files changed since {changed_since}: {e}")
+    return changed
+
+def pytest_runtest_setup(item):
+    """Attribute explicit wait timings to the test that is about to run"""
+    from automation_framework.src.web.actions.wait_actions import wait_recorder
+    wait_recorder.current_test = item.nodeid
+
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """Collect test failures during the call phase"""
@@ -110,7 +472,9 @@ def pytest_runtest_makereport(item, call):
     if not hasattr(item.config.option, 'analyze_failures') or not item.config.option.analyze_failures:
         return
         
-    if report.when == "call" and report.outcome == "failed":
+    from automation_framework.src.execution.flakiness import will_rerun
+    # Failed attempts of quarantined tests that are rerun are not recorded
+    if report.when == "call" and report.outcome == "failed" and not will_rerun(item, report):
         # Get exception info from the report
         longrepr = getattr(report, 'longrepr', None)
         if longrepr is None:
@@ -118,8 +482,10 @@ def pytest_runtest_makereport(item, call):
         
         # Get the output directory from config
         output_dir = getattr(item.config, '_asaltech_output_dir', Path("test_results"))
-        failures_file = output_dir / "failures.json"
+        failures_file = getattr(item.config, '_asaltech_failures_file', output_dir / "failures.json")
             
+        from automation_framework.src.ai_module.analyzers.trace_compactor import compact_trace
+
         # Try to extract error information
         try:
             if hasattr(call, 'excinfo') and call.excinfo is not None:
@@ -145,6 +511,7 @@ def pytest_runtest_makereport(item, call):
                 "error_type": error_type,
                 "error_message": error_message,
                 "stack_trace": trace,
+                "stack_trace_compact": compact_trace(trace),
                 "environment": getattr(item.config.option, 'env', 'test'),
                 "test_duration": call.duration if hasattr(call, 'duration') else 0.0,
                 "test_phase": report.when,
@@ -154,12 +521,21 @@ def pytest_runtest_makereport(item, call):
             # Create output directory if it doesn't exist
             output_dir.mkdir(exist_ok=True, parents=True)
             
-            # Write failure to file
-            with open(failures_file, "a", encoding='utf-8') as f:
-                json.dump(failure_data, f, ensure_ascii=False)
-                f.write("\n")
+            run_history = getattr(item.config, '_asaltech_run_history', None)
+            if run_history is not None:
+                # Exported to failures.json at the end of the session
+                run_history.add_failure(failure_data)
+            else:
+                # Write failure to file
+                with open(failures_file, "a", encoding='utf-8') as f:
+                    json.dump(failure_data, f, ensure_ascii=False)
+                    f.write("\n")
             
-            logger.info(f"Test failure recorded: {item.nodeid} in {failures_file}")
+            logger.info(f"Test failure recorded: {item.nodeid}")
+
+            streaming = _get_streaming_analyzer(item.config)
+            if streaming is not None:
+                streaming.submit(failure_data)
             
         except Exception as e:
             logger.error(f"Error recording test failure: {e}", exc_info=True)
@@ -167,8 +543,28 @@ def pytest_runtest_makereport(item, call):
 @pytest.hookimpl(trylast=True)
 def pytest_terminal_summary(terminalreporter, exitstatus, config):
     """Run analysis on failures at the end of test execution if enabled"""
+    browser_pool = getattr(config, '_asaltech_browser_pool', None)
+    if browser_pool is not None:
+        terminalreporter.write_sep("=", "Browser Pool Summary")
+        terminalreporter.write_line(f"Browser sessions: {browser_pool.summary()}")
+
+        from automation_framework.src.web.drivers.service_manager import driver_service_manager
+        if driver_service_manager.enabled:
+            terminalreporter.write_line(f"Driver services: {driver_service_manager.summary()}")
+
+    _write_schedule(terminalreporter, config)
+    _write_quarantine(terminalreporter, config)
+
+    _write_slow_waits(terminalreporter)
+    _write_element_cache_stats(terminalreporter)
+
     if not hasattr(config.option, 'analyze_failures') or not config.option.analyze_failures:
         return
+
+    from automation_framework.src.execution.parallel import is_worker
+    if is_worker(config):
+        # The controller analyzes the merged failures of all workers once
+        return
     
     if exitstatus == 0:
         logger.info("All tests passed, no analysis needed")
@@ -177,56 +573,207 @@ def pytest_terminal_summary(terminalreporter, exitstatus, config):
     # Direct implementation that doesn't rely on complex pytest hooks
     analyze_failures(terminalreporter, config)
 
+def _write_schedule(terminalreporter, config):
+    """Explain how the tests were selected and ordered"""
+    impact_summary = getattr(config, '_asaltech_impact_summary', None)
+    shard_summary = getattr(config, '_asaltech_shard_summary', None)
+    promoted = getattr(config, '_asaltech_promoted_tests', None)
+    budget = getattr(config, '_asaltech_true_bug_budget', None)
+    if not impact_summary and not shard_summary and promoted is None and not (budget and budget.seen):
+        return
+
+    terminalreporter.write_sep("=", "Test Schedule")
+    if impact_summary:
+        terminalreporter.write_line(impact_summary)
+    if shard_summary:
+        terminalreporter.write_line(shard_summary)
+    if promoted is not None:
+        terminalreporter.write_line(f"Failures first: {len(promoted)} tests promoted")
+        for nodeid, score, reason in promoted[:10]:
+            terminalreporter.write_line(f"  {score:.2f} {nodeid} ({reason})")
+        if len(promoted) > 10:
+            terminalreporter.write_line(f"  ... and {len(promoted) - 10} more")
+    if budget and budget.seen:
+        terminalreporter.write_line(
+            f"Confirmed true-bug failures: {len(budget.seen)} of {budget.limit} allowed: {', '.join(budget.seen)}"
+        )
+
+def _write_quarantine(terminalreporter, config):
+    """Show how the quarantined tests fared"""
+    quarantine = getattr(config, '_asaltech_quarantine', None)
+    if quarantine is None or not quarantine.quarantined:
+        return
+
+    results = quarantine.results
+    failed = sum(1 for result in results.values() if result == "failed")
+    terminalreporter.write_sep("=", "Quarantine")
+    terminalreporter.write_line(
+        f"{len(quarantine.quarantined)} flaky tests (score >= {quarantine.threshold:.2f}) run last with up to "
+        f"{quarantine.reruns} reruns: {len(results) - failed} passed or skipped, "
+        f"{failed} failed without failing the build"
+    )
+    for nodeid, score in sorted(quarantine.quarantined.items(), key=lambda entry: -entry[1]):
+        terminalreporter.write_line(f"  {score:.2f} {nodeid}: {results.get(nodeid, 'not run')}")
+
+def _write_slow_waits(terminalreporter):
+    """List the slowest explicit waits of the run"""
+    from automation_framework.src.web.actions.wait_actions import wait_recorder
+
+    slow_waits = wait_recorder.slowest()
+    if not slow_waits:
+        return
+
+    totals = wait_recorder.totals
+    terminalreporter.write_sep("=", "Slow Waits")
+    terminalreporter.write_line(
+        f"{totals['waits']} waits, {totals['polls']} polls, {totals['seconds']:.1f}s total, "
+        f"{totals['timeouts']} timed out"
+    )
+    for record in slow_waits:
+        status = "timed out" if record["timed_out"] else "met"
+        terminalreporter.write_line(
+            f"{record['duration']:.2f}s ({record['polls']} polls, {status}) "
+            f"{record['description']} in {record['test_name']}"
+        )
+
+def _write_element_cache_stats(terminalreporter):
+    """Show element cache hit rates and skipped frame/window switches of page objects"""
+    from automation_framework.src.web.pages.base_page import BasePage
+    from automation_framework.src.web.actions.browser_actions import BrowsingContext
+
+    context_totals = BrowsingContext.totals
+    if not BasePage.cache_stats_by_page and not context_totals["switches"] + context_totals["skipped"]:
+        return
+
+    terminalreporter.write_sep("=", "Page Object Stats")
+    terminalreporter.write_line(
+        f"Frame/window switches: {context_totals['switches']} performed, "
+        f"{context_totals['skipped']} skipped (already in context)"
+    )
+    for page, stats in sorted(BasePage.cache_stats_by_page.items()):
+        lookups = stats["hits"] + stats["misses"]
+        hit_rate = stats["hits"] / lookups if lookups else 0.0
+        terminalreporter.write_line(
+            f"{page}: {stats['hits']} hits, {stats['misses']} misses, "
+            f"{stats['stale']} stale re-lookups ({hit_rate:.0%} hit rate)"
+        )
+
+def _create_analyzer(config, output_dir):
+    """Create the FailureAnalyzer configured by the command line options"""
+    from automation_framework.src.ai_module.analyzers.failure_analyzer import FailureAnalyzer
+    from automation_framework.src.ai_module.config.ai_settings import ai_settings
+
+    # Get provider and model from options
+    provider = getattr(config.option, 'ai_provider', 'openai')
+    model_name = getattr(config.option, 'model_name', None)
+
+    # Create AI configuration
+    ai_config = ai_settings.get_model_config(provider, model_name)
+    if getattr(config.option, 'ai_http2', False):
+        ai_config["http2"] = True
+
+    # Cache analyses by failure signature across runs
+    cache = None
+    cache_ttl = getattr(config.option, 'ai_cache_ttl', 168)
+    if cache_ttl and cache_ttl > 0:
+        from automation_framework.src.ai_module.analyzers.analysis_cache import AnalysisCache
+        cache = AnalysisCache(output_dir / "analysis_cache.json", ttl_hours=cache_ttl)
+
+    # Cluster near-identical failures so each cluster costs one model call
+    pattern_detector = None
+    cluster_threshold = getattr(config.option, 'ai_cluster_threshold', 0.8)
+    if cluster_threshold and cluster_threshold > 0:
+        from automation_framework.src.ai_module.analyzers.pattern_detector import PatternDetector
+        pattern_detector = PatternDetector(threshold=cluster_threshold)
+
+    # Classify familiar failures locally and escalate only the uncertain ones
+    classifier = None
+    classifier_file = getattr(config.option, 'ai_classifier', None)
+    if classifier_file:
+        from automation_framework.src.ai_module.models.classifier import FailureClassifier
+        try:
+            classifier = FailureClassifier.load(classifier_file)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Local failure classifier not loaded, all failures are escalated: {e}")
+
+    # Index of earlier failures, for 'seen before' and their suggested fixes
+    from automation_framework.src.ai_module.analyzers.recommendation_engine import RecommendationEngine
+    recommendation_engine = RecommendationEngine(output_dir / "failure_index.jsonl")
+
+    return FailureAnalyzer(
+        ai_config,
+        max_concurrency=getattr(config.option, 'ai_concurrency', None),
+        cache=cache,
+        pattern_detector=pattern_detector,
+        batch_token_budget=getattr(config.option, 'ai_batch_tokens', None),
+        max_prompt_tokens=getattr(config.option, 'ai_max_prompt_tokens', None),
+        classifier=classifier,
+        classifier_threshold=getattr(config.option, 'ai_classifier_threshold', 0.9),
+        recommendation_engine=recommendation_engine,
+        reuse_similarity=getattr(config.option, 'ai_reuse_similarity', 0) or None
+    )
+
+def _get_streaming_analyzer(config):
+    """Background analyzer of --ai-stream, created with the first failure; None if streaming is off"""
+    if not getattr(config.option, 'ai_stream', False):
+        return None
+    from automation_framework.src.execution.parallel import is_worker
+    if is_worker(config):
+        return None
+
+    if not hasattr(config, '_asaltech_streaming'):
+        config._asaltech_streaming = None
+        try:
+            from automation_framework.src.ai_module.analyzers.streaming_analyzer import StreamingAnalyzer
+            output_dir = getattr(config, '_asaltech_output_dir', Path("test_results"))
+            config._asaltech_streaming = StreamingAnalyzer(_create_analyzer(config, output_dir))
+        except Exception as e:
+            logger.error(f"Could not start streaming analysis, failures are analyzed after the run: {e}")
+    return config._asaltech_streaming
+
 def analyze_failures(terminalreporter, config):
     """Analyze the failures file and generate a report"""
     try:
-        # Import here to avoid circular imports
-        from automation_framework.src.ai_module.analyzers.failure_analyzer import FailureAnalyzer
-        from automation_framework.src.ai_module.config.ai_settings import ai_settings
-        
         # Get the output directory from config
         output_dir = getattr(config, '_asaltech_output_dir', Path("test_results"))
-        failures_file = output_dir / "failures.json"
-        
-        # Check if the failures file exists
-        if not failures_file.exists():
-            logger.warning(f"Failures file does not exist: {failures_file}")
+        failures = _load_failures(config, output_dir)
+        if failures is None:
             return
-            
-        # Check if the file is empty
-        if failures_file.stat().st_size == 0:
-            logger.info("No failures recorded to analyze (empty file)")
-            return
-            
-        # Read failures from the file
-        failures = []
-        with open(failures_file) as f:
-            for line in f:
-                if line.strip():
-                    failures.append(json.loads(line))
         
         if not failures:
             logger.info("No failures found in the failures file")
             return
-            
-        # Get provider and model from options
-        provider = getattr(config.option, 'ai_provider', 'openai')
-        model_name = getattr(config.option, 'model_name', None)
-        
-        # Create AI configuration
-        ai_config = ai_settings.get_model_config(provider, model_name)
-        
-        # Create analyzer
-        analyzer = FailureAnalyzer(ai_config)
+
+        streaming = getattr(config, '_asaltech_streaming', None)
+        if streaming is not None:
+            # Most failures were analyzed while the remaining tests ran; only wait for the rest
+            analyzer = streaming.analyzer
+            still_running = streaming.wait(getattr(config.option, 'ai_stream_deadline', 60.0))
+            analyzer.prefetched = streaming.results()
+            for key in streaming.pending_keys:
+                analyzer.prefetched[key] = {
+                    "error": "Analysis still running at the end of the session",
+                    "pending": True
+                }
+            if still_running:
+                config._asaltech_late_failures = failures
+        else:
+            analyzer = _create_analyzer(config, output_dir)
+        cache = analyzer.cache
         
         # Run analysis
         logger.info(f"Analyzing {len(failures)} test failures...")
         results = analyzer.analyze_failures(failures)
+        if cache is not None:
+            cache.save()
         
         # Save analysis results
-        analysis_file = output_dir / "analysis.json"
-        with open(analysis_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        analysis_file = _save_analysis(results, output_dir, getattr(config, '_asaltech_run_history', None))
+
+        _record_verdicts(config, results)
+        if not getattr(config, '_asaltech_late_failures', None):
+            # With analyses still running, the run is indexed once they are added
+            _index_failures(analyzer, results)
         
         terminalreporter.write_sep("=", "AI Analysis Summary")
         terminalreporter.write_line(f"Analysis results saved to {analysis_file}")
@@ -234,6 +781,53 @@ def analyze_failures(terminalreporter, config):
         metadata = results.get("metadata", {})
         terminalreporter.write_line(f"Provider: {metadata.get('provider')}")
         terminalreporter.write_line(f"Model: {metadata.get('model')}")
+        if streaming is not None:
+            batched = (f" ({streaming.stats['batches']} batched requests)"
+                       if analyzer.batch_token_budget else "")
+            terminalreporter.write_line(
+                f"Streamed analysis: {streaming.stats['submitted']} failures during the run, "
+                f"{streaming.stats['analyzed']} analyzed in the background{batched}, "
+                f"{streaming.stats['skipped']} similar to an earlier failure"
+            )
+            if streaming.stats["errors"]:
+                terminalreporter.write_line(
+                    f"{streaming.stats['errors']} streamed analyses failed and are reported as errors", yellow=True
+                )
+            if still_running:
+                terminalreporter.write_line(
+                    f"{still_running} analyses still running after the deadline; they are added to "
+                    f"{analysis_file.name} and the report before pytest exits", yellow=True
+                )
+        if "seen_before" in metadata:
+            terminalreporter.write_line(
+                f"Seen before: {metadata['seen_before']} of {len(failures)} failures resemble earlier failures, "
+                f"{metadata['reused_verdicts']} earlier verdicts reused"
+            )
+        if "local_verdicts" in metadata:
+            terminalreporter.write_line(
+                f"Local classifier: {metadata['local_verdicts']} verdicts made locally, "
+                f"the others escalated to {metadata.get('provider')}"
+            )
+        if "clusters" in metadata:
+            terminalreporter.write_line(
+                f"Failure clusters: {len(failures)} failures in {metadata['clusters']} clusters, "
+                f"{metadata['model_analyses']} analyzed by {metadata.get('provider')}"
+            )
+        batches = metadata.get("batches")
+        if batches:
+            total_tokens = sum(batch["total_tokens"] or 0 for batch in batches)
+            fallbacks = sum(batch["fallbacks"] for batch in batches)
+            terminalreporter.write_line(
+                f"Batched requests: {len(batches)} for {sum(batch['size'] for batch in batches)} failures, "
+                f"{total_tokens} tokens, {fallbacks} re-analyzed individually"
+            )
+        if cache is not None:
+            terminalreporter.write_line(
+                f"Analysis cache: {cache.stats['hits']} hits, {cache.stats['misses']} misses "
+                f"({cache.hit_rate:.0%} hit rate)"
+            )
+        if analyzer.transport.stats["requests"]:
+            terminalreporter.write_line(f"LLM transport: {analyzer.transport.summary()}")
         
         # Count true bugs vs false positives
         true_bugs = sum(1 for r in results.get("results", []) 
@@ -242,34 +836,133 @@ def analyze_failures(terminalreporter, config):
         terminalreporter.write_line(f"Likely true bugs: {true_bugs}")
         terminalreporter.write_line(f"Likely false positives: {len(failures) - true_bugs}")
         
-        # Generate HTML report
-        try:
-            # Correct import path for AIReportGenerator
-            from automation_framework.src.reporters.ai_report_generator import AIReportGenerator
-            
-            # Create reports directory at the same level as the output directory
-            reports_dir = output_dir.parent / "reports" 
-            reports_dir.mkdir(exist_ok=True, parents=True)
+        config._asaltech_report_name = _generate_html_report(results, output_dir, terminalreporter.write_line)
             
-            # Generate timestamp for unique report name
+    except Exception as e:
+        logger.error(f"Error during failure analysis: {e}", exc_info=True)
+        terminalreporter.write_line(f"Error during failure analysis: {str(e)}", red=True)
+
+def _load_failures(config, output_dir):
+    """Failures of this run from the run history, or from failures.json; None if there is no record"""
+    run_history = getattr(config, '_asaltech_run_history', None)
+    if run_history is not None:
+        return run_history.failures()
+
+    failures_file = output_dir / "failures.json"
+    
+    # Check if the failures file exists
+    if not failures_file.exists():
+        logger.warning(f"Failures file does not exist: {failures_file}")
+        return None
+        
+    # Read failures from the file
+    failures = []
+    with open(failures_file) as f:
+        for line in f:
+            if line.strip():
+                failures.append(json.loads(line))
+    return failures
+
+def _record_verdicts(config, results):
+    """Pass the AI verdicts of this run to the failure history and the flakiness scores"""
+    for name in ('_asaltech_failure_history', '_asaltech_flakiness'):
+        history = getattr(config, name, None)
+        if history is not None:
+            history.record_analysis(results)
+
+def _index_failures(analyzer, results):
+    """Add the failures and verdicts of this run to the index of earlier failures"""
+    if analyzer.recommendation_engine is not None and "results" in results:
+        analyzer.recommendation_engine.add_results(results)
+        analyzer.recommendation_engine.save()
+
+def _save_analysis(results, output_dir, run_history=None):
+    """Store the analysis in the run history, write analysis.json and return its path"""
+    analysis_file = output_dir / "analysis.json"
+    if run_history is not None:
+        run_history.record_analysis(results)
+        if run_history.export_analysis(analysis_file):
+            return analysis_file
+    with open(analysis_file, 'w') as f:
+        json.dump(results, f, indent=2)
+    return analysis_file
+
+def _generate_html_report(results, output_dir, write_line, report_name=None):
+    """
+    Generate the HTML report of an analysis next to the output directory
+
+    Returns:
+        str: File name of the report, or None if it could not be generated
+    """
+    try:
+        # Correct import path for AIReportGenerator
+        from automation_framework.src.reporters.ai_report_generator import AIReportGenerator
+        
+        # Create reports directory at the same level as the output directory
+        reports_dir = output_dir.parent / "reports" 
+        reports_dir.mkdir(exist_ok=True, parents=True)
+        
+        # Generate timestamp for unique report name
+        if report_name is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             report_name = f"ai_analysis_{timestamp}.html"
-            
-            # Create reporter and generate report
-            reporter = AIReportGenerator(output_dir=str(reports_dir))
-            report_path = reporter.generate_analysis_report(results, report_name)
-            
-            terminalreporter.write_line(f"AI analysis HTML report generated: {report_path}")
-            
-        except ImportError as e:
-            # Log the import error with more details
-            logger.error(f"Error importing AIReportGenerator: {e}")
-            terminalreporter.write_line("Could not generate HTML report - AIReportGenerator not found", red=True)
-        except Exception as e:
-            # Handle other exceptions during report generation
-            logger.error(f"Error generating HTML report: {e}", exc_info=True)
-            terminalreporter.write_line(f"Error generating HTML report: {str(e)}", red=True)
-            
+        
+        # Create reporter and generate report
+        reporter = AIReportGenerator(output_dir=str(reports_dir))
+        report_path = reporter.generate_analysis_report(results, report_name)
+        
+        write_line(f"AI analysis HTML report generated: {report_path}")
+        return report_name
+        
+    except ImportError as e:
+        # Log the import error with more details
+        logger.error(f"Error importing AIReportGenerator: {e}")
+        write_line("Could not generate HTML report - AIReportGenerator not found", red=True)
     except Exception as e:
-        logger.error(f"Error during failure analysis: {e}", exc_info=True)
-        terminalreporter.write_line(f"Error during failure analysis: {str(e)}", red=True)
\ No newline at end of file
+        # Handle other exceptions during report generation
+        logger.error(f"Error generating HTML report: {e}", exc_info=True)
+        write_line(f"Error generating HTML report: {str(e)}", red=True)
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_unconfigure(config):
+    """
+    Add streamed analyses that finished after the terminal summary, stop the background
+    analyzer and close the pooled connections to the AI providers
+    """
+    streaming = getattr(config, '_asaltech_streaming', None)
+    if streaming is not None:
+        failures = getattr(config, '_asaltech_late_failures', None)
+        try:
+            if failures:
+                _finish_late_analysis(config, streaming, failures)
+        except Exception as e:
+            logger.error(f"Error adding late streamed analyses: {e}", exc_info=True)
+        finally:
+            streaming.shutdown()
+
+    # Only loaded if an analyzer was created
+    http_transport = sys.modules.get("automation_framework.src.ai_module.analyzers.http_transport")
+    if http_transport is not None:
+        http_transport.close_http_transports()
+
+def _finish_late_analysis(config, streaming, failures):
+    """Wait for the streamed analyses still running and rewrite analysis.json and the report"""
+    terminalreporter = config.pluginmanager.get_plugin("terminalreporter")
+    write_line = terminalreporter.write_line if terminalreporter else lambda line, **kwargs: logger.info(line)
+
+    streaming.wait()
+    analyzer = streaming.analyzer
+    analyzer.prefetched = streaming.results()
+    results = analyzer.analyze_failures(failures)
+    if analyzer.cache is not None:
+        analyzer.cache.save()
+
+    # Before the failure history and flakiness scores are saved in their own pytest_unconfigure
+    _record_verdicts(config, results)
+    _index_failures(analyzer, results)
+
+    output_dir = getattr(config, '_asaltech_output_dir', Path("test_results"))
+    analysis_file = _save_analysis(results, output_dir, getattr(config, '_asaltech_run_history', None))
+    write_line(f"Late streamed analyses added to {analysis_file}")
+    # Replace the report of the terminal summary
+    _generate_html_report(results, output_dir, write_line, getattr(config, '_asaltech_report_name', None))
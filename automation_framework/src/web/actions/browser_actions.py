@@ -0,0 +1,176 @@
+# automation_framework/src/web/actions/browser_actions.py
+import logging
+import weakref
+from urllib.parse import urlsplit
+from selenium.common.exceptions import NoSuchFrameException, StaleElementReferenceException
+
+logger = logging.getLogger(__name__)
+
+def origin_of(url):
+    """
+    Origin of an http(s) URL
+
+    Args:
+        url (str): URL
+
+    Returns:
+        str: 'scheme://host[:port]', or None for other URLs such as about:blank
+    """
+    parts = urlsplit(url or "")
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        return None
+    return f"{parts.scheme}://{parts.netloc.rsplit('@', 1)[-1].lower()}"
+
+class BrowsingContext:
+    """
+    Tracks the current window handle and frame path of a driver so that
+    switches to the context the driver is already in can be skipped.
+
+    It also holds the scope: the frame path page objects expect outside
+    @in_frame methods. Leaving a frame block only restores the scope; the
+    driver is switched back lazily by the next page object call that runs
+    outside the frame, so consecutive calls in the same frame send no switch.
+
+    One instance is shared by every page object using the same driver; get it
+    with BrowsingContext.of(driver). Code that switches frames or windows
+    behind its back must call reset() (BrowserPool does after each test,
+    once the session is parked on about:blank).
+    """
+
+    _contexts = weakref.WeakKeyDictionary()
+
+    # Switches performed and skipped across all drivers
+    totals = {"switches": 0, "skipped": 0}
+
+    def __init__(self, driver):
+        self._driver_ref = weakref.ref(driver)
+        self.window = None
+        self.frame_path = ()
+        self.scope = ()
+        # Origins opened through page objects, whose storage BrowserPool clears between tests
+        self.origins = set()
+
+    @classmethod
+    def of(cls, driver):
+        """
+        Get the context tracker of a driver
+
+        Args:
+            driver (WebDriver): Browser session
+
+        Returns:
+            BrowsingContext: Tracker shared by all users of the driver
+        """
+        context = cls._contexts.get(driver)
+        if context is None:
+            context = cls(driver)
+            cls._contexts[driver] = context
+        return context
+
+    @property
+    def driver(self):
+        return self._driver_ref()
+
+    def reset(self, window=None):
+        """
+        Forget the tracked context, e.g. after switching outside the tracker
+
+        Args:
+            window (str, optional): Window handle the driver is known to be in
+        """
+        self.window = window
+        self.frame_path = ()
+        self.scope = ()
+        self.origins = set()
+
+    def navigated(self, url=None):
+        """
+        Record a top-level navigation, which always lands in the top-level document
+
+        Args:
+            url (str, optional): URL navigated to, whose origin is recorded
+        """
+        self.frame_path = ()
+        self.scope = ()
+        origin = origin_of(url)
+        if origin:
+            self.origins.add(origin)
+
+    def switch_to_default_content(self):
+        """Switch to the top-level document unless already there"""
+        if not self.frame_path:
+            self._skipped()
+            return
+        self.driver.switch_to.default_content()
+        self.frame_path = ()
+        self._switched()
+
+    def switch_to_frame_path(self, path, find):
+        """
+        Switch to a nested frame path, reusing the part shared with the current path
+
+        Args:
+            path (tuple): Frame locators from the top-level document down; () is the top level
+            find (callable): Locates an element in the current context, e.g. BasePage.find_element
+        """
+        path = tuple(path)
+        if path == self.frame_path:
+            self._skipped()
+            return
+
+        try:
+            self._walk(path, find)
+        except (StaleElementReferenceException, NoSuchFrameException) as e:
+            # A frame reloaded or vanished: start again from the top-level document.
+            # Other errors, e.g. the timeout of a frame locator that matches nothing, are raised
+            # right away instead of waiting them out a second time
+            logger.debug(f"Frame switch failed ({e.msg}), retrying from default content")
+            self.driver.switch_to.default_content()
+            self.frame_path = ()
+            self._walk(path, find)
+
+    def switch_to_window(self, handle):
+        """
+        Switch to a window unless already in it. Switching windows lands in its top-level document.
+
+        Args:
+            handle (str): Window handle
+        """
+        if handle == self.window:
+            self._skipped()
+            return
+        self.driver.switch_to.window(handle)
+        self.window = handle
+        self.frame_path = ()
+        self._switched()
+
+    def _walk(self, path, find):
+        """Move from the current frame path to the target path with the fewest switches"""
+        common = 0
+        while (common < len(self.frame_path) and common < len(path)
+               and self.frame_path[common] == path[common]):
+            common += 1
+
+        levels_up = len(self.frame_path) - common
+        if levels_up + (len(path) - common) > 1 + len(path):
+            # Cheaper to start again from the top
+            self.driver.switch_to.default_content()
+            self.frame_path = ()
+            self._switched()
+            common = 0
+        else:
+            for _ in range(levels_up):
+                self.driver.switch_to.parent_frame()
+                self.frame_path = self.frame_path[:-1]
+                self._switched()
+
+        for locator in path[common:]:
+            self.driver.switch_to.frame(find(locator))
+            self.frame_path = self.frame_path + (locator,)
+            self._switched()
+
+    def _switched(self):
+        BrowsingContext.totals["switches"] += 1
+
+    def _skipped(self):
+        BrowsingContext.totals["skipped"] += 1
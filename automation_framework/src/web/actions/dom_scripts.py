@@ -0,0 +1,118 @@
+# automation_framework/src/web/actions/dom_scripts.py
+"""
+JavaScript run in the page by the wait engine and BasePage.
+Locators are passed as Selenium (by, value) pairs and resolved in the page.
+"""
+
+# Shared helpers: locate an element from a Selenium locator and check visibility
+DOM_HELPERS = """
+function find(by, value) {
+    switch (by) {
+        case "id": return document.getElementById(value);
+        case "css selector": return document.querySelector(value);
+        case "xpath": return document.evaluate(value, document, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        case "name": return document.getElementsByName(value)[0] || null;
+        case "class name": return document.getElementsByClassName(value)[0] || null;
+        case "tag name": return document.getElementsByTagName(value)[0] || null;
+        case "link text": return Array.prototype.find.call(document.links,
+            function (a) { return a.textContent.trim() === value; }) || null;
+        case "partial link text": return Array.prototype.find.call(document.links,
+            function (a) { return a.textContent.indexOf(value) !== -1; }) || null;
+    }
+    return null;
+}
+
+function isVisible(el) {
+    if (!el || !el.isConnected) { return false; }
+    var style = window.getComputedStyle(el);
+    if (style.visibility === "hidden" || style.display === "none" || style.opacity === "0") { return false; }
+    return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+}
+"""
+
+# Resolves a sequence of DOM conditions inside the page with a MutationObserver,
+# so the whole wait costs a single WebDriver round-trip.
+# arguments: steps, timeout (ms), callback
+DOM_WAIT_SCRIPT = DOM_HELPERS + """
+var steps = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+var start = Date.now(), index = 0, stepStart = start, finished = false, observer, timer, interval;
+
+function holds(step) {
+    var el = find(step.by, step.value);
+    switch (step.condition) {
+        case "present": return !!el;
+        case "visible": return isVisible(el);
+        case "invisible": return !isVisible(el);
+        case "text": return isVisible(el) && (el.innerText || el.textContent).indexOf(step.text) !== -1;
+    }
+    return false;
+}
+
+function finish(ok) {
+    if (finished) { return; }
+    finished = true;
+    if (observer) { observer.disconnect(); }
+    clearTimeout(timer);
+    clearInterval(interval);
+    done({ok: ok, step: index, elapsed: Date.now() - start});
+}
+
+function check() {
+    if (finished) { return; }
+    var now = Date.now();
+    while (index < steps.length) {
+        var step = steps[index];
+        if (holds(step)) {
+            index++;
+            stepStart = now;
+        } else if (step.optional && step.timeout !== null && now - stepStart >= step.timeout) {
+            index++;
+            stepStart = now;
+        } else {
+            break;
+        }
+    }
+    if (index >= steps.length) { finish(true); }
+}
+
+observer = new MutationObserver(check);
+observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+// Layout-only changes (animations, stylesheet loads) do not produce mutations
+interval = setInterval(check, 100);
+timer = setTimeout(function () { finish(false); }, timeoutMs);
+check();
+"""
+
+# Reads text, visibility, enabled state and attributes of several elements at once.
+# Text follows WebElement.text: rendered text of visible elements, empty otherwise.
+# arguments: fields ({name: [by, value]}), attribute names
+BATCH_READ_SCRIPT = DOM_HELPERS + """
+var fields = arguments[0], attributes = arguments[1], results = {};
+Object.keys(fields).forEach(function (name) {
+    var el = null;
+    try {
+        el = find(fields[name][0], fields[name][1]);
+    } catch (e) {
+        el = null;
+    }
+    if (!el) {
+        results[name] = {found: false, text: null, visible: false, enabled: false, attributes: {}};
+        return;
+    }
+    var visible = isVisible(el), attrs = {};
+    attributes.forEach(function (attr) {
+        // Property first, like WebElement.get_attribute()
+        var prop = el[attr], type = typeof prop;
+        attrs[attr] = (type === "string" || type === "number" || type === "boolean") ? prop : el.getAttribute(attr);
+    });
+    results[name] = {
+        found: true,
+        text: visible ? (el.innerText || "").trim() : "",
+        visible: visible,
+        enabled: !el.disabled,
+        attributes: attrs
+    };
+});
+return results;
+"""
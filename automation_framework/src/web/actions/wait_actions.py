@@ -0,0 +1,360 @@
+# automation_framework/src/web/actions/wait_actions.py
+import logging
+import threading
+import time
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    UnknownMethodException,
+    WebDriverException
+)
+from selenium.webdriver.support import expected_conditions as EC
+from .dom_scripts import DOM_WAIT_SCRIPT
+
+logger = logging.getLogger(__name__)
+
+def dom_step(condition, locator, text=None, timeout=None, optional=False):
+    """
+    Build one step of an in-page DOM wait
+
+    Args:
+        condition (str): 'present', 'visible', 'invisible' or 'text'
+        locator (tuple): Selenium locator, e.g. (By.ID, "finish")
+        text (str, optional): Expected substring for the 'text' condition
+        timeout (float, optional): Seconds after which an optional step is skipped
+        optional (bool): Skip the step if it does not hold within its timeout
+
+    Returns:
+        dict: Step definition for WaitActions.until_dom()
+    """
+    if condition not in ("present", "visible", "invisible", "text"):
+        raise ValueError(f"Unsupported DOM wait condition: {condition}")
+    return {
+        "by": locator[0],
+        "value": locator[1],
+        "condition": condition,
+        "text": text,
+        "timeout": None if timeout is None else int(timeout * 1000),
+        "optional": optional
+    }
+
+# Polling equivalents of the DOM wait conditions, used as a fallback
+POLL_CONDITIONS = {
+    "present": lambda step: EC.presence_of_element_located((step["by"], step["value"])),
+    "visible": lambda step: EC.visibility_of_element_located((step["by"], step["value"])),
+    "invisible": lambda step: EC.invisibility_of_element_located((step["by"], step["value"])),
+    "text": lambda step: EC.text_to_be_present_in_element((step["by"], step["value"]), step["text"])
+}
+
+class WaitRecorder:
+    """
+    Collects timing of every wait so slow waits can be reported per test.
+    Only waits above the slow threshold are kept individually; the rest are counted.
+    """
+
+    def __init__(self, slow_threshold=2.0, max_records=200):
+        self.slow_threshold = slow_threshold
+        self.max_records = max_records
+        self.current_test = None
+        self.slow_waits = []
+        self.totals = {"waits": 0, "polls": 0, "seconds": 0.0, "timeouts": 0}
+        self._lock = threading.Lock()
+
+    def record(self, description, duration, polls, timed_out):
+        with self._lock:
+            self.totals["waits"] += 1
+            self.totals["polls"] += polls
+            self.totals["seconds"] += duration
+            if timed_out:
+                self.totals["timeouts"] += 1
+
+            if duration >= self.slow_threshold:
+                self.slow_waits.append({
+                    "test_name": self.current_test,
+                    "description": description,
+                    "duration": round(duration, 3),
+                    "polls": polls,
+                    "timed_out": timed_out
+                })
+                # Keep only the slowest records
+                if len(self.slow_waits) > self.max_records:
+                    self.slow_waits.sort(key=lambda r: r["duration"], reverse=True)
+                    del self.slow_waits[self.max_records:]
+
+    def slowest(self, limit=10):
+        """
+        Get the slowest recorded waits
+
+        Args:
+            limit (int): Maximum number of records
+
+        Returns:
+            list: Wait records sorted by duration, slowest first
+        """
+        with self._lock:
+            return sorted(self.slow_waits, key=lambda r: r["duration"], reverse=True)[:limit]
+
+# Create default recorder instance
+wait_recorder = WaitRecorder()
+
+class WaitActions:
+    """
+    Explicit wait engine replacing WebDriverWait.
+    Polls with exponential backoff, records duration and poll count of each wait,
+    and offers immediate checks for negative assertions.
+
+    Assumes the driver's implicit wait is 0 (as set by WebTestBase); an implicit
+    wait would make every poll of a missing element block for its full duration.
+    """
+
+    DEFAULT_IGNORED = (NoSuchElementException, StaleElementReferenceException)
+
+    def __init__(self, driver, timeout=10, poll_initial=0.05, poll_max=0.5, backoff=1.5,
+                 ignored_exceptions=None, recorder=None):
+        """
+        Initialize the wait engine
+
+        Args:
+            driver (WebDriver): Browser session
+            timeout (float): Default timeout in seconds
+            poll_initial (float): First poll interval in seconds
+            poll_max (float): Upper bound of the poll interval
+            backoff (float): Factor applied to the poll interval after every unsuccessful poll
+            ignored_exceptions (tuple, optional): Exceptions treated as "condition not met yet"
+            recorder (WaitRecorder, optional): Where wait timings are recorded. Defaults to wait_recorder
+        """
+        self.driver = driver
+        self.timeout = timeout
+        self.poll_initial = poll_initial
+        self.poll_max = poll_max
+        self.backoff = backoff
+        self.ignored_exceptions = tuple(ignored_exceptions or self.DEFAULT_IGNORED)
+        self.recorder = recorder or wait_recorder
+
+    def until(self, method, message="", timeout=None, description=None):
+        """
+        Wait until method(driver) returns a truthy value
+
+        Args:
+            method (callable): Condition, e.g. an expected_conditions predicate
+            message (str): Message of the TimeoutException
+            timeout (float, optional): Override of the default timeout
+            description (str, optional): Label used in wait records
+
+        Returns:
+            The truthy value returned by the condition
+
+        Raises:
+            TimeoutException: If the condition is not met in time
+        """
+        return self._poll(method, False, message, timeout, description)
+
+    def until_not(self, method, message="", timeout=None, description=None):
+        """
+        Wait until method(driver) returns a falsy value
+
+        Returns:
+            The falsy value returned by the condition, or True if it raised an ignored exception
+
+        Raises:
+            TimeoutException: If the condition still holds after the timeout
+        """
+        return self._poll(method, True, message, timeout, description)
+
+    def until_any(self, conditions, message="", timeout=None):
+        """
+        Wait until the first of several conditions is met
+
+        Args:
+            conditions (dict): Name -> condition
+
+        Returns:
+            tuple: (name, value) of the first condition that was met
+        """
+        def _any(driver):
+            for name, condition in conditions.items():
+                try:
+                    value = condition(driver)
+                except self.ignored_exceptions:
+                    continue
+                if value:
+                    return name, value
+            return False
+
+        return self._poll(_any, False, message, timeout, f"any of {list(conditions)}")
+
+    def check(self, method):
+        """
+        Evaluate a condition once, without waiting
+
+        Returns:
+            The condition's value, or False if it raised an ignored exception
+        """
+        try:
+            return method(self.driver)
+        except self.ignored_exceptions:
+            return False
+
+    def present(self, locator, timeout=None):
+        """Wait for an element to be present in the DOM and return it"""
+        return self.until(EC.presence_of_element_located(locator), timeout=timeout,
+                          description=f"presence of {locator}")
+
+    def visible(self, locator, timeout=None):
+        """Wait for an element to be visible and return it"""
+        return self.until(EC.visibility_of_element_located(locator), timeout=timeout,
+                          description=f"visibility of {locator}")
+
+    def clickable(self, locator, timeout=None):
+        """Wait for an element to be visible and enabled and return it"""
+        return self.until(EC.element_to_be_clickable(locator), timeout=timeout,
+                          description=f"clickability of {locator}")
+
+    def invisible(self, locator, timeout=None):
+        """Wait for an element to be hidden or removed from the DOM"""
+        return self.until(EC.invisibility_of_element_located(locator), timeout=timeout,
+                          description=f"invisibility of {locator}")
+
+    def is_visible(self, locator, timeout=0):
+        """
+        Check element visibility without raising. With the default timeout of 0 the
+        check is a single poll, so a negative answer costs one round-trip.
+
+        Args:
+            locator (tuple): Element locator
+            timeout (float): Time to keep polling for a positive answer
+
+        Returns:
+            bool: True if the element is visible
+        """
+        if not timeout:
+            start = time.perf_counter()
+            visible = bool(self.check(EC.visibility_of_element_located(locator)))
+            self.recorder.record(f"visibility of {locator}", time.perf_counter() - start, 1, False)
+            return visible
+        try:
+            self.visible(locator, timeout)
+            return True
+        except TimeoutException:
+            return False
+
+    def until_dom(self, steps, message="", timeout=None):
+        """
+        Wait for a sequence of DOM conditions in a single round-trip, using an
+        in-page MutationObserver instead of polling from the client.
+        Falls back to polling if the script cannot run (e.g. the page navigates away
+        or the driver does not support async scripts).
+
+        Args:
+            steps (list): Steps built with dom_step(), met in order
+            message (str): Message of the TimeoutException
+            timeout (float, optional): Override of the default timeout
+
+        Raises:
+            TimeoutException: If the steps are not all met in time
+        """
+        timeout = self.timeout if timeout is None else timeout
+        description = "dom: " + ", then ".join(
+            f"{step['condition']} of {(step['by'], step['value'])}" for step in steps
+        )
+        start = time.perf_counter()
+
+        previous_timeout = None
+        try:
+            # The session's script timeout (30s by default, but tests may lower it) must
+            # outlast the in-page timeout
+            script_timeout = self.driver.timeouts.script
+            if timeout + 5 > script_timeout:
+                self.driver.set_script_timeout(timeout + 5)
+                previous_timeout = script_timeout
+            result = self.driver.execute_async_script(DOM_WAIT_SCRIPT, steps, int(timeout * 1000))
+        except TimeoutException:
+            # Raised for a script timeout: the in-page wait ran out of time, so polling now
+            # would only have ~0s left
+            duration = time.perf_counter() - start
+            self.recorder.record(description, duration, 1, True)
+            raise TimeoutException(
+                message or f"Timed out after {timeout}s waiting for {description} (script timeout)"
+            )
+        except (JavascriptException, UnknownMethodException) as e:
+            logger.debug(f"DOM wait unavailable, falling back to polling: {e.msg}")
+            remaining = max(0.0, timeout - (time.perf_counter() - start))
+            return self.until_steps(steps, message, remaining)
+        finally:
+            # The session may be pooled and reused by later tests, so do not leave it raised
+            if previous_timeout is not None:
+                try:
+                    self.driver.set_script_timeout(previous_timeout)
+                except WebDriverException as e:
+                    logger.debug(f"Could not restore the script timeout: {e.msg}")
+
+        duration = time.perf_counter() - start
+        timed_out = not result.get("ok")
+        self.recorder.record(description, duration, 1, timed_out)
+        if timed_out:
+            raise TimeoutException(
+                message or f"Timed out after {timeout}s waiting for {description} "
+                           f"(stopped at step {result.get('step', 0) + 1})"
+            )
+        return True
+
+    def until_steps(self, steps, message="", timeout=None):
+        """
+        Poll a sequence of dom_step() conditions in order, sharing one deadline.
+        Used as the polling counterpart (and fallback) of until_dom().
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.perf_counter() + timeout
+        for step in steps:
+            remaining = max(0.0, deadline - time.perf_counter())
+            step_timeout = remaining
+            if step["optional"] and step["timeout"] is not None:
+                step_timeout = min(remaining, step["timeout"] / 1000)
+            try:
+                self.until(POLL_CONDITIONS[step["condition"]](step), message, step_timeout,
+                           f"{step['condition']} of {(step['by'], step['value'])}")
+            except TimeoutException:
+                if not step["optional"]:
+                    raise
+        return True
+
+    def _poll(self, method, negate, message, timeout, description):
+        """Poll a condition with exponential backoff until it (or its negation) holds"""
+        timeout = self.timeout if timeout is None else timeout
+        description = description or self._describe(method)
+        interval = self.poll_initial
+        start = time.perf_counter()
+        deadline = start + timeout
+        polls = 0
+
+        while True:
+            polls += 1
+            try:
+                value = method(self.driver)
+                done = not value if negate else bool(value)
+            except self.ignored_exceptions:
+                value, done = True, negate
+
+            if done:
+                self.recorder.record(description, time.perf_counter() - start, polls, False)
+                return value
+
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                duration = time.perf_counter() - start
+                self.recorder.record(description, duration, polls, True)
+                logger.debug(f"Wait for {description} timed out after {duration:.2f}s ({polls} polls)")
+                raise TimeoutException(
+                    message or f"Timed out after {timeout}s waiting for {description} ({polls} polls)"
+                )
+
+            time.sleep(min(interval, remaining))
+            interval = min(interval * self.backoff, self.poll_max)
+
+    @staticmethod
+    def _describe(method):
+        """Derive a readable label from a condition, e.g. 'visibility_of_element_located'"""
+        name = getattr(method, "__qualname__", None) or type(method).__name__
+        return name.split(".<locals>")[0]
@@ -0,0 +1,67 @@
+# automation_framework/src/web/config/web_settings.py
+from pathlib import Path
+import os
+import logging
+import yaml
+
+logger = logging.getLogger(__name__)
+
+class WebSettings:
+    """
+    Configuration settings for web testing components.
+    Loads the 'web' section of the environment YAML file (config/env/<env>.yaml).
+    """
+
+    # Defaults used when the environment file does not set a value
+    DEFAULTS = {
+        "launch_profile": "default"
+    }
+
+    def __init__(self, env=None):
+        """
+        Initialize web settings
+
+        Args:
+            env (str): Environment name ('dev', 'staging', 'prod')
+        """
+        self.env = env or os.getenv('ENV', 'dev')
+        self.settings = dict(self.DEFAULTS)
+        self._load_env_file()
+
+    def _load_env_file(self):
+        """Load the 'web' section from the environment YAML file if it exists"""
+        env_file = Path(__file__).parents[3] / "config" / "env" / f"{self.env}.yaml"
+        if not env_file.exists():
+            logger.debug(f"No environment file found at {env_file}, using web defaults")
+            return
+
+        try:
+            with open(env_file, encoding='utf-8') as f:
+                data = yaml.safe_load(f) or {}
+        except yaml.YAMLError as e:
+            logger.warning(f"Could not parse environment file {env_file}: {e}")
+            return
+
+        self.settings.update(data.get("web") or {})
+        logger.info(f"Loaded web settings from {env_file}")
+
+    def get(self, key, default=None):
+        """
+        Get a web setting
+
+        Args:
+            key (str): Setting name
+            default: Value returned if the setting is not defined
+
+        Returns:
+            Setting value
+        """
+        return self.settings.get(key, default)
+
+    @property
+    def launch_profile(self):
+        """Name of the browser launch profile for this environment"""
+        return self.settings["launch_profile"]
+
+# Create default settings instance
+web_settings = WebSettings()
@@ -3,13 +3,12 @@ from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.ie.service import Service as IEService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager, IEDriverManager
-from webdriver_manager.opera import OperaDriverManager
-from webdriver_manager.core.os_manager import ChromeType
 import logging
 import os
+from .driver_resolver import driver_resolver
+from .browser_prewarmer import BrowserPrewarmer
+from .capabilities import get_launch_profile, apply_launch_profile
+from .service_manager import driver_service_manager
 
 # Enable detailed logging for webdriver-manager
 os.environ['WDM_LOG'] = str(logging.INFO)
@@ -18,102 +17,125 @@ os.environ['WDM_LOG'] = str(logging.INFO)
 
 class BrowserFactory:
     @staticmethod
-    def get_browser(browser_type="chrome", headless=False):
+    def get_browser(browser_type="chrome", headless=False, launch_profile=None):
         """
         Factory method to get a WebDriver instance based on browser type.
         
         Args:
             browser_type (str): Type of browser ('chrome', 'firefox', 'edge', 'ie', 'opera', 'chromium', 'brave')
             headless (bool): Whether to run the browser in headless mode
+            launch_profile (str, optional): Named launch profile from capabilities.LAUNCH_PROFILES
+                                            ('default', 'fidelity', 'fast-ci'). None selects 'default'
             
         Returns:
             WebDriver: Configured WebDriver instance
             
         Raises:
-            ValueError: If browser_type is not supported
+            ValueError: If browser_type or launch_profile is not supported
         """
         browser_type = browser_type.lower()
+        profile = get_launch_profile(launch_profile)
         
         if browser_type == "chrome":
             options = webdriver.ChromeOptions()
             if headless:
                 options.add_argument("--headless=new")
+            apply_launch_profile(options, browser_type, profile)
             
-            driver = webdriver.Chrome(
-                service=ChromeService(ChromeDriverManager().install()),
-                options=options
-            )
+            driver = BrowserFactory._create_driver("chrome", webdriver.Chrome, ChromeService, options)
             
         elif browser_type == "chromium":
             options = webdriver.ChromeOptions()
             if headless:
                 options.add_argument("--headless=new")
+            apply_launch_profile(options, browser_type, profile)
                 
-            driver = webdriver.Chrome(
-                service=ChromeService(ChromeDriverManager(chrome_type=ChromeType.CHROMIUM).install()),
-                options=options
-            )
+            driver = BrowserFactory._create_driver("chromium", webdriver.Chrome, ChromeService, options)
             
         elif browser_type == "brave":
             options = webdriver.ChromeOptions()
             if headless:
                 options.add_argument("--headless=new")
+            apply_launch_profile(options, browser_type, profile)
                 
-            driver = webdriver.Chrome(
-                service=ChromeService(ChromeDriverManager(chrome_type=ChromeType.BRAVE).install()),
-                options=options
-            )
+            driver = BrowserFactory._create_driver("brave", webdriver.Chrome, ChromeService, options)
             
         elif browser_type == "firefox":
             options = webdriver.FirefoxOptions()
             if headless:
                 options.add_argument("--headless")
+            apply_launch_profile(options, browser_type, profile)
             
-            driver = webdriver.Firefox(
-                service=FirefoxService(GeckoDriverManager().install()),
-                options=options
-            )
+            driver = BrowserFactory._create_driver("firefox", webdriver.Firefox, FirefoxService, options)
             
         elif browser_type == "edge":
             options = webdriver.EdgeOptions()
             if headless:
                 options.add_argument("--headless")
+            apply_launch_profile(options, browser_type, profile)
             
-            driver = webdriver.Edge(
-                service=EdgeService(EdgeChromiumDriverManager().install()),
-                options=options
-            )
+            driver = BrowserFactory._create_driver("edge", webdriver.Edge, EdgeService, options)
             
         elif browser_type == "ie":
             options = webdriver.IeOptions()
+            apply_launch_profile(options, browser_type, profile)
             
-            driver = webdriver.Ie(
-                service=IEService(IEDriverManager().install()),
-                options=options
-            )
+            driver = BrowserFactory._create_driver("ie", webdriver.Ie, IEService, options)
             
         elif browser_type == "opera":
-            # Opera setup is different as it uses Remote WebDriver
-            from selenium.webdriver.chrome import service as chrome_service_module
-            
-            opera_service = chrome_service_module.Service(OperaDriverManager().install())
-            opera_service.start()
-            
+            # Opera setup is different as it always uses Remote WebDriver on a shared service
             options = webdriver.ChromeOptions()
             options.add_experimental_option('w3c', True)
+            apply_launch_profile(options, browser_type, profile)
             
             # If Opera is installed in non-standard location, uncomment and set the path:
             # options.binary_location = "path/to/opera.exe"
             
-            driver = webdriver.Remote(
-                opera_service.service_url, 
-                options=options
+            driver = driver_service_manager.create_session(
+                "opera",
+                ChromeService,
+                driver_resolver.resolve("opera"),
+                options
             )
             
         else:
             raise ValueError(f"Unsupported browser type: {browser_type}")
         
         # Common setup for all browsers
-        if browser_type != "opera":  # Opera Remote WebDriver handles window differently
+        if profile.get("window_size"):
+            # Chromium and Firefox receive the size as a launch argument
+            if browser_type == "ie":
+                driver.set_window_size(*profile["window_size"])
+        elif browser_type != "opera":  # Opera Remote WebDriver handles window differently
             driver.maximize_window()
-        return driver
\ No newline at end of file
+        return driver
+
+    @staticmethod
+    def _create_driver(browser_type, driver_class, service_class, options):
+        """
+        Start a session with its own driver process, or on a shared driver
+        service when the service manager is enabled.
+        """
+        driver_path = driver_resolver.resolve(browser_type)
+        if driver_service_manager.enabled:
+            return driver_service_manager.create_session(browser_type, service_class, driver_path, options)
+        return driver_class(service=service_class(driver_path), options=options)
+
+    @staticmethod
+    def get_prewarmer(browser_type="chrome", headless=False, depth=1, launch_profile=None):
+        """
+        Get a prewarmer that launches sessions of the given browser in the background.
+        
+        Args:
+            browser_type (str): Type of browser, as for get_browser()
+            headless (bool): Whether to run the browser in headless mode
+            depth (int): Number of warm sessions to keep ready
+            launch_profile (str, optional): Named launch profile, as for get_browser()
+            
+        Returns:
+            BrowserPrewarmer: Started prewarmer; call take() for a session and close() when done
+        """
+        return BrowserPrewarmer(
+            lambda: BrowserFactory.get_browser(browser_type, headless, launch_profile),
+            depth
+        ).start()
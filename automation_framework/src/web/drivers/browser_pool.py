@@ -0,0 +1,223 @@
+# automation_framework/src/web/drivers/browser_pool.py
+import logging
+import threading
+import time
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+from .browser_factory import BrowserFactory
+from ..actions.browser_actions import BrowsingContext, origin_of
+
+logger = logging.getLogger(__name__)
+
+class BrowserPool:
+    """
+    Keeps live WebDriver sessions alive across tests within one worker.
+    Sessions are reset to a blank state between tests instead of being
+    relaunched, which removes the browser startup cost from every test.
+    """
+
+    BLANK_URL = "about:blank"
+
+    # Storage types cleared for the other origins a session opened, through CDP
+    CLEARED_STORAGE = "local_storage,indexeddb,websql,cache_storage,service_workers"
+
+    def __init__(self, browser_type="chrome", headless=False, size=1, prewarm=0, launch_profile=None):
+        """
+        Initialize the browser pool
+
+        Args:
+            browser_type (str): Type of browser passed to BrowserFactory
+            headless (bool): Whether to run the browsers in headless mode
+            size (int): Maximum number of idle sessions kept alive. 0 disables reuse.
+            prewarm (int): Number of sessions launched ahead of time in the background. 0 disables prewarming.
+            launch_profile (str, optional): Named launch profile passed to BrowserFactory
+        """
+        self.browser_type = browser_type
+        self.headless = headless
+        self.launch_profile = launch_profile
+        self.size = max(0, int(size))
+        self._idle = []
+        self._in_use = set()
+        self._held = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            "launched": 0,
+            "reused": 0,
+            "recycled": 0,
+            "reset_failures": 0,
+            "origin_recycles": 0,
+            "launch_seconds": 0.0
+        }
+        self._prewarmer = None
+        if prewarm > 0:
+            self._prewarmer = BrowserFactory.get_prewarmer(browser_type, headless, prewarm, launch_profile)
+
+    def acquire(self, fresh=False, held_for=None):
+        """
+        Get a browser session for a test
+
+        Args:
+            fresh (bool): Always launch a new session instead of reusing an idle one
+            held_for (str, optional): Take the session kept by release() for this key, if any
+
+        Returns:
+            WebDriver: Browser session ready for use
+        """
+        with self._lock:
+            driver = self._held.pop(held_for, None) if held_for is not None else None
+            if driver is None and not fresh and self._idle:
+                driver = self._idle.pop()
+            if driver is not None:
+                self.stats["reused"] += 1
+
+        if driver is None:
+            driver = self._launch()
+
+        with self._lock:
+            self._in_use.add(driver)
+        return driver
+
+    def release(self, driver, discard=False, hold_for=None):
+        """
+        Return a browser session to the pool after a test
+
+        Args:
+            driver (WebDriver): Session previously returned by acquire()
+            discard (bool): Quit the session instead of keeping it for reuse
+            hold_for (str, optional): Keep the session, reset, for the next acquire() with this
+                                      key (e.g. the rerun of the same test), even if discarded
+        """
+        with self._lock:
+            self._in_use.discard(driver)
+            keep = not discard and len(self._idle) < self.size
+
+        if (hold_for is not None or keep) and self.reset(driver):
+            with self._lock:
+                if hold_for is not None:
+                    self._held[hold_for] = driver
+                else:
+                    self._idle.append(driver)
+            return
+
+        with self._lock:
+            self.stats["recycled"] += 1
+        self._quit(driver)
+
+    def reset(self, driver):
+        """
+        Reset a session to a clean state: single window, top-level frame,
+        no cookies or web storage, parked on about:blank.
+
+        WebDriver only clears cookies and storage of the current origin. On Chromium
+        browsers the cookies of every domain, and the storage of every origin opened
+        through BasePage.open(), are cleared with CDP. Other browsers cannot reach the
+        other origins, so a session that opened more than one origin is recycled instead.
+        Origins reached only by following links or inside cross-origin frames are not
+        tracked: outside Chromium, their storage and third-party cookies can survive.
+
+        Args:
+            driver (WebDriver): Session to reset
+
+        Returns:
+            bool: True if the session is clean and can be reused
+        """
+        context = BrowsingContext.of(driver)
+        origins = set(context.origins)
+        try:
+            try:
+                driver.switch_to.alert.dismiss()
+            except NoAlertPresentException:
+                pass
+
+            # Close any windows opened by the test, keep the first one
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            if len(handles) > 1 or context.window not in (None, handles[0]):
+                driver.switch_to.window(handles[0])
+                context.reset(window=handles[0])
+            # Only sends a switch if a page object left the driver inside a frame
+            context.switch_to_default_content()
+
+            # Storage is per origin, so clear it before leaving the page
+            current = origin_of(driver.current_url)
+            driver.execute_script(
+                "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+            )
+            driver.delete_all_cookies()
+            others = origins - {current}
+            if hasattr(driver, "execute_cdp_cmd"):
+                # Chromium browsers can drop cookies for every domain at once, and storage of any origin
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+                for origin in sorted(others):
+                    driver.execute_cdp_cmd("Storage.clearDataForOrigin",
+                                           {"origin": origin, "storageTypes": self.CLEARED_STORAGE})
+            elif others:
+                logger.debug(f"Recycling browser session that opened {len(others) + 1} origins")
+                with self._lock:
+                    self.stats["origin_recycles"] += 1
+                return False
+
+            driver.get(self.BLANK_URL)
+            # Navigation lands in the top-level document, even after switches outside the tracker
+            context.reset(window=handles[0])
+            return True
+
+        except WebDriverException as e:
+            logger.warning(f"Browser session could not be reset, recycling it: {e.msg}")
+            with self._lock:
+                self.stats["reset_failures"] += 1
+            return False
+
+    def close(self):
+        """Quit every session owned by the pool"""
+        with self._lock:
+            drivers = self._idle + list(self._in_use) + list(self._held.values())
+            self._idle = []
+            self._in_use.clear()
+            self._held = {}
+
+        for driver in drivers:
+            self._quit(driver)
+
+        if self._prewarmer is not None:
+            self._prewarmer.close()
+
+        logger.info(f"Browser pool closed: {self.summary()}")
+
+    def summary(self):
+        """
+        Build a one-line summary of pool usage
+
+        Returns:
+            str: Launch and reuse counts
+        """
+        total = self.stats["launched"] + self.stats["reused"]
+        summary = (f"{total} sessions served, {self.stats['launched']} launched, "
+                   f"{self.stats['reused']} reused, {self.stats['recycled']} recycled")
+        if self.stats["origin_recycles"]:
+            summary += f" ({self.stats['origin_recycles']} after opening several origins)"
+        if self._prewarmer is not None:
+            return f"{summary}; prewarm: {self._prewarmer.summary()}"
+        return f"{summary}; launch time {self.stats['launch_seconds']:.1f}s exposed"
+
+    def _launch(self):
+        """Launch a new browser session, taking a warm one from the prewarmer if enabled"""
+        start = time.perf_counter()
+        if self._prewarmer is not None:
+            driver = self._prewarmer.take()
+        else:
+            driver = BrowserFactory.get_browser(self.browser_type, self.headless, self.launch_profile)
+        with self._lock:
+            self.stats["launch_seconds"] += time.perf_counter() - start
+            self.stats["launched"] += 1
+            launched = self.stats["launched"]
+        logger.debug(f"Launched new {self.browser_type} session ({launched} total)")
+        return driver
+
+    def _quit(self, driver):
+        """Quit a session, ignoring errors from sessions that are already gone"""
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"Error quitting browser session: {e}")
@@ -0,0 +1,132 @@
+# automation_framework/src/web/drivers/browser_prewarmer.py
+import logging
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+class BrowserPrewarmer:
+    """
+    Launches browser sessions on a background thread so the next one is
+    already running when a test asks for it.
+    """
+
+    def __init__(self, launch, depth=1):
+        """
+        Initialize the prewarmer
+
+        Args:
+            launch (callable): Function that launches and returns a new WebDriver
+            depth (int): Number of warm sessions to keep ready
+        """
+        self.launch = launch
+        self.depth = max(1, int(depth))
+        self._ready = deque()  # (driver, launch_duration)
+        self._launching = 0
+        self._stopped = False
+        self._cond = threading.Condition()
+        self._thread = None
+        self.stats = {
+            "warm_hits": 0,
+            "cold_launches": 0,
+            "discarded": 0,
+            "hidden_seconds": 0.0,
+            "exposed_seconds": 0.0
+        }
+
+    def start(self):
+        """Start the background launch thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="browser-prewarmer", daemon=True)
+            self._thread.start()
+        return self
+
+    def take(self):
+        """
+        Hand over a warm session, launching one synchronously if none is available
+
+        Returns:
+            WebDriver: Running browser session
+        """
+        wait_start = time.perf_counter()
+        with self._cond:
+            # A launch already in flight is cheaper to wait for than starting another
+            while not self._ready and self._launching and not self._stopped:
+                self._cond.wait()
+
+            if self._ready:
+                driver, launch_duration = self._ready.popleft()
+                waited = time.perf_counter() - wait_start
+                self.stats["warm_hits"] += 1
+                self.stats["exposed_seconds"] += waited
+                self.stats["hidden_seconds"] += max(0.0, launch_duration - waited)
+                self._cond.notify_all()
+                return driver
+
+        # Nothing warm: launch in the foreground, fully exposed to the test
+        start = time.perf_counter()
+        driver = self.launch()
+        self.stats["cold_launches"] += 1
+        self.stats["exposed_seconds"] += time.perf_counter() - start
+        return driver
+
+    def close(self):
+        """Stop the background thread and quit any unused warm sessions"""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+
+        if self._thread is not None:
+            self._thread.join(timeout=60)
+
+        with self._cond:
+            leftovers = list(self._ready)
+            self._ready.clear()
+
+        for driver, _ in leftovers:
+            self.stats["discarded"] += 1
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.debug(f"Error quitting warm browser session: {e}")
+
+    def summary(self):
+        """
+        Build a one-line summary of prewarm effectiveness
+
+        Returns:
+            str: Warm hits and launch time hidden versus exposed
+        """
+        return (f"{self.stats['warm_hits']} warm handovers, {self.stats['cold_launches']} cold launches, "
+                f"launch time {self.stats['hidden_seconds']:.1f}s hidden / "
+                f"{self.stats['exposed_seconds']:.1f}s exposed, "
+                f"{self.stats['discarded']} unused warm sessions discarded")
+
+    def _run(self):
+        """Background loop keeping the warm queue filled up to depth"""
+        while True:
+            with self._cond:
+                while not self._stopped and len(self._ready) + self._launching >= self.depth:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                self._launching += 1
+
+            start = time.perf_counter()
+            try:
+                driver = self.launch()
+            except Exception as e:
+                logger.warning(f"Background browser launch failed, prewarming disabled: {e}")
+                with self._cond:
+                    self._launching -= 1
+                    self._stopped = True
+                    self._cond.notify_all()
+                return
+            duration = time.perf_counter() - start
+
+            with self._cond:
+                self._launching -= 1
+                self._ready.append((driver, duration))
+                self._cond.notify_all()
+            logger.debug(f"Warm browser session ready after {duration:.2f}s")
@@ -0,0 +1,114 @@
+# automation_framework/src/web/drivers/capabilities.py
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Named launch profiles. Each knob is translated to browser-specific options below.
+LAUNCH_PROFILES = {
+    # Browser defaults, maximized window
+    "default": {},
+    # Closest to a real user: full page loads and every resource, fixed desktop viewport
+    "fidelity": {
+        "page_load_strategy": "normal",
+        "window_size": (1920, 1080)
+    },
+    # Fastest headless CI runs: return after DOMContentLoaded and skip heavy resources
+    "fast-ci": {
+        "page_load_strategy": "eager",
+        "block_images": True,
+        "block_media": True,
+        "block_fonts": True,
+        "disable_extensions": True,
+        "disable_background_throttling": True,
+        "disable_gpu": True,
+        "window_size": (1366, 768)
+    }
+}
+
+CHROMIUM_BROWSERS = ("chrome", "chromium", "brave", "edge", "opera")
+
+def get_launch_profile(name=None):
+    """
+    Get the settings of a named launch profile
+
+    Args:
+        name (str, optional): Profile name. None selects 'default'
+
+    Returns:
+        dict: Profile settings
+
+    Raises:
+        ValueError: If the profile is not defined
+    """
+    name = (name or "default").lower()
+    if name not in LAUNCH_PROFILES:
+        raise ValueError(f"Unsupported launch profile: {name}. "
+                         f"Supported profiles: {list(LAUNCH_PROFILES.keys())}")
+    return LAUNCH_PROFILES[name]
+
+def apply_launch_profile(options, browser_type, profile):
+    """
+    Apply launch profile settings to browser options
+
+    Args:
+        options: Selenium options object for the browser
+        browser_type (str): Browser type as passed to BrowserFactory
+        profile (dict): Profile settings from get_launch_profile()
+    """
+    if profile.get("page_load_strategy"):
+        options.page_load_strategy = profile["page_load_strategy"]
+
+    if browser_type in CHROMIUM_BROWSERS:
+        _apply_chromium(options, profile)
+    elif browser_type == "firefox":
+        _apply_firefox(options, profile)
+    else:
+        logger.debug(f"Launch profile only sets page load strategy for {browser_type}")
+
+def _apply_chromium(options, profile):
+    """Translate profile settings to Chrome/Chromium command-line switches and prefs"""
+    prefs = {}
+    if profile.get("block_images"):
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        prefs["profile.managed_default_content_settings.images"] = 2
+    if profile.get("block_media"):
+        options.add_argument("--autoplay-policy=user-gesture-required")
+        options.add_argument("--mute-audio")
+        prefs["profile.managed_default_content_settings.media_stream"] = 2
+    if profile.get("block_fonts"):
+        options.add_argument("--disable-remote-fonts")
+    if profile.get("disable_extensions"):
+        options.add_argument("--disable-extensions")
+    if profile.get("disable_background_throttling"):
+        options.add_argument("--disable-background-timer-throttling")
+        options.add_argument("--disable-backgrounding-occluded-windows")
+        options.add_argument("--disable-renderer-backgrounding")
+    if profile.get("disable_gpu"):
+        options.add_argument("--disable-gpu")
+    if profile.get("window_size"):
+        width, height = profile["window_size"]
+        options.add_argument(f"--window-size={width},{height}")
+    if prefs:
+        options.add_experimental_option("prefs", prefs)
+
+def _apply_firefox(options, profile):
+    """Translate profile settings to Firefox preferences and arguments"""
+    if profile.get("block_images"):
+        options.set_preference("permissions.default.image", 2)
+    if profile.get("block_media"):
+        options.set_preference("media.autoplay.default", 5)
+        options.set_preference("media.volume_scale", "0.0")
+    if profile.get("block_fonts"):
+        options.set_preference("gfx.downloadable_fonts.enabled", False)
+    if profile.get("disable_extensions"):
+        options.set_preference("extensions.enabledScopes", 0)
+        options.set_preference("extensions.autoDisableScopes", 15)
+    if profile.get("disable_background_throttling"):
+        options.set_preference("dom.timeout.enable_budget_timer_throttling", False)
+        options.set_preference("dom.min_background_timeout_value", 0)
+    if profile.get("disable_gpu"):
+        options.set_preference("layers.acceleration.disabled", True)
+    if profile.get("window_size"):
+        width, height = profile["window_size"]
+        options.add_argument(f"--width={width}")
+        options.add_argument(f"--height={height}")
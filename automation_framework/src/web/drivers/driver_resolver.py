@@ -0,0 +1,189 @@
+# automation_framework/src/web/drivers/driver_resolver.py
+from pathlib import Path
+from datetime import datetime
+import json
+import logging
+import os
+import threading
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.firefox import GeckoDriverManager
+from webdriver_manager.microsoft import EdgeChromiumDriverManager, IEDriverManager
+from webdriver_manager.opera import OperaDriverManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+
+logger = logging.getLogger(__name__)
+
+class DriverResolver:
+    """
+    Resolves driver binary paths with an in-process memo and an on-disk manifest
+    so webdriver-manager is only consulted once per browser version.
+    """
+
+    MANIFEST_VERSION = 1
+
+    # Driver managers per browser type
+    MANAGERS = {
+        "chrome": lambda: ChromeDriverManager(),
+        "chromium": lambda: ChromeDriverManager(chrome_type=ChromeType.CHROMIUM),
+        "brave": lambda: ChromeDriverManager(chrome_type=ChromeType.BRAVE),
+        "firefox": lambda: GeckoDriverManager(),
+        "edge": lambda: EdgeChromiumDriverManager(),
+        "ie": lambda: IEDriverManager(),
+        "opera": lambda: OperaDriverManager()
+    }
+
+    # Browser names understood by OperationSystemManager for version detection
+    VERSION_PROBES = {
+        "chrome": ChromeType.GOOGLE,
+        "chromium": ChromeType.CHROMIUM,
+        "brave": ChromeType.BRAVE,
+        "firefox": "firefox",
+        "edge": ChromeType.MSEDGE
+    }
+
+    def __init__(self, manifest_path=None, offline=None):
+        """
+        Initialize the driver resolver
+
+        Args:
+            manifest_path (str, optional): Path of the on-disk manifest.
+                                           Defaults to ASALTECH_DRIVER_MANIFEST or ~/.wdm/asaltech_drivers.json
+            offline (bool, optional): Never call webdriver-manager, only use the manifest.
+                                      Defaults to the ASALTECH_DRIVER_OFFLINE environment variable
+        """
+        if manifest_path is None:
+            manifest_path = os.getenv(
+                'ASALTECH_DRIVER_MANIFEST',
+                str(Path.home() / ".wdm" / "asaltech_drivers.json")
+            )
+        if offline is None:
+            offline = os.getenv('ASALTECH_DRIVER_OFFLINE', '').lower() in ('1', 'true', 'yes')
+
+        self.manifest_path = Path(manifest_path)
+        self.offline = offline
+        self._memo = {}
+        self._lock = threading.Lock()
+        self.stats = {"memo_hits": 0, "manifest_hits": 0, "installs": 0}
+
+    def resolve(self, browser_type):
+        """
+        Get the driver binary path for a browser type
+
+        Args:
+            browser_type (str): Browser type ('chrome', 'firefox', 'edge', 'ie', 'opera', 'chromium', 'brave')
+
+        Returns:
+            str: Path to the driver binary
+
+        Raises:
+            ValueError: If browser_type is not supported
+            RuntimeError: If running offline and no cached driver is available
+        """
+        browser_type = browser_type.lower()
+
+        # Fast path: already resolved in this process
+        path = self._memo.get(browser_type)
+        if path is not None:
+            self.stats["memo_hits"] += 1
+            return path
+
+        if browser_type not in self.MANAGERS:
+            raise ValueError(f"Unsupported browser type: {browser_type}")
+
+        with self._lock:
+            if browser_type in self._memo:
+                self.stats["memo_hits"] += 1
+                return self._memo[browser_type]
+
+            browser_version = self.detect_browser_version(browser_type)
+            path = self._lookup_manifest(browser_type, browser_version)
+
+            if path is not None:
+                self.stats["manifest_hits"] += 1
+                logger.debug(f"Driver for {browser_type} {browser_version} found in manifest: {path}")
+            elif self.offline:
+                raise RuntimeError(
+                    f"No cached driver for {browser_type} (browser version {browser_version}) "
+                    f"in {self.manifest_path} and offline mode is enabled"
+                )
+            else:
+                path = self.MANAGERS[browser_type]().install()
+                self.stats["installs"] += 1
+                self._store_manifest(browser_type, browser_version, path)
+                logger.info(f"Resolved driver for {browser_type} {browser_version}: {path}")
+
+            self._memo[browser_type] = path
+            return path
+
+    def detect_browser_version(self, browser_type):
+        """
+        Detect the installed browser version from the OS
+
+        Args:
+            browser_type (str): Browser type
+
+        Returns:
+            str: Browser version, or None if it cannot be detected
+        """
+        probe = self.VERSION_PROBES.get(browser_type)
+        if probe is None:
+            return None
+        try:
+            return OperationSystemManager().get_browser_version_from_os(probe)
+        except Exception as e:
+            logger.debug(f"Could not detect {browser_type} version: {e}")
+            return None
+
+    def clear(self):
+        """Forget in-process resolutions; the on-disk manifest is kept"""
+        with self._lock:
+            self._memo.clear()
+
+    def _manifest_key(self, browser_type, browser_version):
+        return f"{browser_type}:{browser_version or 'unknown'}"
+
+    def _read_manifest(self):
+        """Load the manifest, returning an empty one if missing or unreadable"""
+        try:
+            with open(self.manifest_path, encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get("version") == self.MANIFEST_VERSION:
+                return manifest
+        except (OSError, ValueError):
+            pass
+        return {"version": self.MANIFEST_VERSION, "drivers": {}}
+
+    def _lookup_manifest(self, browser_type, browser_version):
+        """Find a cached driver path whose binary still exists"""
+        drivers = self._read_manifest()["drivers"]
+        entry = drivers.get(self._manifest_key(browser_type, browser_version))
+
+        if entry is None and browser_version is None and self.offline:
+            # Version unknown (e.g. IE/Opera): fall back to the most recent entry for this browser
+            candidates = [e for k, e in drivers.items() if k.startswith(f"{browser_type}:")]
+            if candidates:
+                entry = max(candidates, key=lambda e: e.get("resolved_at", ""))
+
+        if entry and Path(entry["path"]).exists():
+            return entry["path"]
+        return None
+
+    def _store_manifest(self, browser_type, browser_version, path):
+        """Record a resolved driver path; written atomically so parallel workers can share it"""
+        manifest = self._read_manifest()
+        manifest["drivers"][self._manifest_key(browser_type, browser_version)] = {
+            "path": path,
+            "browser_version": browser_version,
+            "resolved_at": datetime.now().isoformat()
+        }
+        try:
+            self.manifest_path.parent.mkdir(exist_ok=True, parents=True)
+            tmp_path = self.manifest_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(tmp_path, self.manifest_path)
+        except OSError as e:
+            logger.warning(f"Could not write driver manifest {self.manifest_path}: {e}")
+
+# Create default resolver instance
+driver_resolver = DriverResolver()
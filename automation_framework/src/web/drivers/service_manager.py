@@ -0,0 +1,185 @@
+# automation_framework/src/web/drivers/service_manager.py
+import atexit
+import logging
+import os
+import threading
+from selenium import webdriver
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.chromium.webdriver import ChromiumDriver
+
+logger = logging.getLogger(__name__)
+
+# Browser types whose driver speaks the Chromium extension commands: browser name and vendor prefix
+CHROMIUM_BROWSERS = {
+    "chrome": ("chrome", "goog"),
+    "chromium": ("chrome", "goog"),
+    "brave": ("chrome", "goog"),
+    "edge": ("MicrosoftEdge", "ms")
+}
+
+class ServiceRemote(webdriver.Remote):
+    """
+    Remote WebDriver session opened against a shared, long-lived driver service.
+    Quitting the session hands the service back to the manager instead of stopping it.
+    """
+
+    def __init__(self, service_manager, service, options, command_executor=None):
+        self._service_manager = service_manager
+        self._service = service
+        # Not super(): ChromiumDriver.__init__ would start a driver process of its own
+        webdriver.Remote.__init__(self, command_executor=command_executor or service.service_url, options=options)
+
+    def quit(self):
+        try:
+            # Not super(): ChromiumDriver.quit() would stop the shared service
+            webdriver.Remote.quit(self)
+        finally:
+            self._service_manager.release(self._service)
+
+class ChromiumServiceRemote(ServiceRemote, ChromiumDriver):
+    """
+    Chrome or Edge session on a shared driver service. Keeps the Chromium-only
+    commands of webdriver.Chrome/webdriver.Edge, e.g. execute_cdp_cmd(), which
+    BrowserPool uses to clear the cookies of every domain between tests.
+    """
+
+    def __init__(self, service_manager, service, options, browser_name, vendor_prefix):
+        executor = ChromiumRemoteConnection(
+            remote_server_addr=service.service_url,
+            browser_name=browser_name,
+            vendor_prefix=vendor_prefix,
+            keep_alive=True,
+            ignore_proxy=options._ignore_local_proxy
+        )
+        super().__init__(service_manager, service, options, command_executor=executor)
+        # The driver process is local, as with webdriver.Chrome
+        self._is_remote = False
+
+class DriverServiceManager:
+    """
+    Keeps driver service processes (chromedriver, geckodriver, msedgedriver)
+    running for the lifetime of the worker and opens new sessions against them
+    over HTTP, avoiding a process spawn and a new port for every session.
+    """
+
+    # Concurrent sessions a single driver process can host (None means unlimited)
+    MAX_SESSIONS = {
+        "firefox": 1  # geckodriver only supports one session at a time
+    }
+
+    def __init__(self, enabled=None):
+        """
+        Initialize the service manager
+
+        Args:
+            enabled (bool, optional): Route sessions through shared services.
+                                      Defaults to the ASALTECH_REUSE_DRIVER_SERVICE environment variable
+        """
+        if enabled is None:
+            enabled = os.getenv('ASALTECH_REUSE_DRIVER_SERVICE', '').lower() in ('1', 'true', 'yes')
+
+        self.enabled = enabled
+        self._services = {}  # browser_type -> list of [service, active_sessions]
+        self._lock = threading.Lock()
+        self.stats = {"services_started": 0, "sessions_opened": 0}
+        atexit.register(self.stop_all)
+
+    def create_session(self, browser_type, service_class, driver_path, options):
+        """
+        Open a new browser session on a shared driver service
+
+        Args:
+            browser_type (str): Browser type, used to group services
+            service_class: Selenium Service class for the driver
+            driver_path (str): Path to the driver binary
+            options: Selenium options object for the browser
+
+        Returns:
+            ServiceRemote: WebDriver session; a ChromiumServiceRemote for Chromium browsers
+        """
+        service = self.acquire(browser_type, service_class, driver_path)
+        try:
+            if browser_type in CHROMIUM_BROWSERS:
+                driver = ChromiumServiceRemote(self, service, options, *CHROMIUM_BROWSERS[browser_type])
+            else:
+                driver = ServiceRemote(self, service, options)
+        except Exception:
+            self.release(service)
+            raise
+        self.stats["sessions_opened"] += 1
+        return driver
+
+    def acquire(self, browser_type, service_class, driver_path):
+        """
+        Get a running service with spare session capacity, starting one if needed
+
+        Returns:
+            Service: Started driver service
+        """
+        max_sessions = self.MAX_SESSIONS.get(browser_type)
+
+        with self._lock:
+            entries = self._services.setdefault(browser_type, [])
+
+            # Drop services whose process has died
+            for entry in list(entries):
+                if not self._is_alive(entry[0]):
+                    logger.warning(f"{browser_type} driver service at {entry[0].service_url} died, replacing it")
+                    entries.remove(entry)
+
+            for entry in entries:
+                if max_sessions is None or entry[1] < max_sessions:
+                    entry[1] += 1
+                    return entry[0]
+
+            service = service_class(driver_path)
+            service.start()
+            entries.append([service, 1])
+            self.stats["services_started"] += 1
+            logger.info(f"Started shared {browser_type} driver service at {service.service_url}")
+            return service
+
+    def release(self, service):
+        """Mark a session on the service as finished"""
+        with self._lock:
+            for entries in self._services.values():
+                for entry in entries:
+                    if entry[0] is service:
+                        entry[1] = max(0, entry[1] - 1)
+                        return
+
+    def stop_all(self):
+        """Stop every driver service process"""
+        with self._lock:
+            services = [entry[0] for entries in self._services.values() for entry in entries]
+            self._services.clear()
+
+        for service in services:
+            try:
+                service.stop()
+            except Exception as e:
+                logger.debug(f"Error stopping driver service: {e}")
+
+        if services:
+            logger.info(f"Stopped {len(services)} driver services after "
+                        f"{self.stats['sessions_opened']} sessions")
+
+    def summary(self):
+        """
+        Build a one-line summary of service reuse
+
+        Returns:
+            str: Services started versus sessions opened
+        """
+        return (f"{self.stats['sessions_opened']} sessions on "
+                f"{self.stats['services_started']} driver service processes")
+
+    def _is_alive(self, service):
+        try:
+            service.assert_process_still_running()
+            return True
+        except Exception:
+            return False
+
+# Create default service manager instance
+driver_service_manager = DriverServiceManager()
@@ -1,27 +1,272 @@
-from selenium.webdriver.support.ui import WebDriverWait
+import functools
+from contextlib import contextmanager
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException
+)
 from selenium.webdriver.support import expected_conditions as EC
+from ..actions.wait_actions import WaitActions, dom_step
+from ..actions.dom_scripts import BATCH_READ_SCRIPT
+from ..actions.browser_actions import BrowsingContext
+
+def in_frame(*frame_locators):
+    """Decorator running a page object method inside the given frame path.
+    
+    With no locators the method runs in the top-level document. The driver is
+    left in the frame afterwards and only switched back to the caller's frame
+    by the next page object call outside it, so consecutive calls in the same
+    frame send no switch at all.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.frame_context(*frame_locators):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
 
 class BasePage:
-    def __init__(self, driver):
+    # 'poll' checks conditions from the client; 'dom' waits inside the page with a
+    # MutationObserver in a single round-trip. Page objects can override this.
+    WAIT_MODE = "poll"
+    
+    # Element cache hit/miss counters aggregated per page class
+    cache_stats_by_page = {}
+    
+    def __init__(self, driver, cache_elements=False):
+        """
+        Args:
+            driver (WebDriver): Browser session
+            cache_elements (bool): Reuse located elements across method calls until they
+                                   go stale, the page navigates or the frame changes
+        """
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.wait = WaitActions(driver, 10)
+        self.context = BrowsingContext.of(driver)
+        self.cache_elements = cache_elements
+        self.cache_stats = {"hits": 0, "misses": 0, "stale": 0}
+        self._element_cache = {}
+        # Cached elements must surface staleness instead of having it polled away
+        self._element_wait = WaitActions(driver, 10, ignored_exceptions=(NoSuchElementException,))
+    
+    def open(self, url):
+        """Navigate to a URL, dropping cached elements of the previous page"""
+        self.invalidate_cache()
+        self.driver.get(url)
+        self.context.navigated(url)
+    
+    def invalidate_cache(self):
+        """Forget all cached elements"""
+        self._element_cache.clear()
+    
+    def switch_to_frame(self, locator):
+        """Switch into the frame located by locator, relative to the current frame"""
+        self.switch_to_frame_path(*(self.context.frame_path + (locator,)))
+    
+    def switch_to_frame_path(self, *frame_locators):
+        """Switch to a frame path given from the top-level document down, unless already there.
+        
+        Frames shared with the current path are not re-entered; no locators means the top level.
+        Later page object calls run in this frame path.
+        """
+        self._switch_frames(frame_locators)
+        self.context.scope = tuple(frame_locators)
+    
+    def switch_to_default_content(self):
+        """Switch back to the top-level document, unless already there"""
+        self.context.switch_to_default_content()
+        self.context.scope = ()
+    
+    def switch_to_window(self, handle):
+        """Switch to a window, unless already in it"""
+        self.context.switch_to_window(handle)
+        self.context.scope = ()
+    
+    def restore_frame(self):
+        """Switch back to the frame path of the caller if an @in_frame method left the driver elsewhere.
+        
+        Page object methods do this themselves; call it before using self.driver directly.
+        """
+        if self.context.frame_path != self.context.scope:
+            self._switch_frames(self.context.scope)
+    
+    def _switch_frames(self, frame_locators):
+        try:
+            self.context.switch_to_frame_path(frame_locators, self._locate)
+        except StaleElementReferenceException:
+            # A cached frame element went stale: locate the frames again
+            self.invalidate_cache()
+            self.context.switch_to_frame_path(frame_locators, self._locate)
+    
+    @contextmanager
+    def frame_context(self, *frame_locators):
+        """Make sure the driver is in the given frame path (top-level if empty) for the block.
+        
+        Only switches when the target differs from the tracked current context. The
+        driver stays in the frame afterwards: the previous frame path is restored as
+        the scope, and the next page object call outside the frame switches back.
+        """
+        previous = self.context.scope
+        self.switch_to_frame_path(*frame_locators)
+        try:
+            yield
+        finally:
+            self.context.scope = previous
+    
+    @contextmanager
+    def window_context(self, handle):
+        """Make sure the driver is in the given window for the block, switching back afterwards"""
+        previous, scope = self.context.window, self.context.scope
+        self.switch_to_window(handle)
+        try:
+            yield
+        finally:
+            if previous is not None:
+                self.context.switch_to_window(previous)
+            self.context.scope = scope
     
     def find_element(self, locator):
-        return self.wait.until(EC.presence_of_element_located(locator))
+        self.restore_frame()
+        return self._locate(locator)
+    
+    def _locate(self, locator):
+        """Locate an element in the current frame, through the element cache if enabled"""
+        if not self.cache_elements:
+            return self.wait.present(locator)
+        
+        # Elements are only valid in the window and frame they were found in
+        key = self._cache_key(locator)
+        element = self._element_cache.get(key)
+        if element is not None:
+            self._count("hits")
+            return element
+        
+        self._count("misses")
+        element = self.wait.present(locator)
+        self._element_cache[key] = element
+        return element
     
     def click(self, locator):
-        self.wait.until(EC.element_to_be_clickable(locator)).click()
+        if not self.cache_elements:
+            self.restore_frame()
+            self.wait.clickable(locator).click()
+            return
+        self._on_element(locator, lambda element: self._element_wait.until(
+            EC.element_to_be_clickable(element),
+            description=f"clickability of {locator}"
+        ).click())
     
     def enter_text(self, locator, text):
-        element = self.find_element(locator)
-        element.clear()
-        element.send_keys(text)
+        def _enter(element):
+            element.clear()
+            element.send_keys(text)
+        self._on_element(locator, _enter)
+    
+    def send_keys(self, locator, *keys):
+        self._on_element(locator, lambda element: element.send_keys(*keys))
+    
+    def clear(self, locator):
+        self._on_element(locator, lambda element: element.clear())
     
     def get_text(self, locator):
-        return self.find_element(locator).text
+        return self._on_element(locator, lambda element: element.text)
+    
+    def read_fields(self, locators, attributes=()):
+        """Read several elements in a single round-trip.
+        
+        Does not wait: call it once the page is loaded (e.g. after wait_for()).
+        
+        Args:
+            locators (dict): Field name -> locator
+            attributes (tuple): Attribute/property names to read from every element
+            
+        Returns:
+            dict: Field name -> {"found", "text", "visible", "enabled", "attributes"}
+        """
+        self.restore_frame()
+        fields = {name: list(locator) for name, locator in locators.items()}
+        return self.driver.execute_script(BATCH_READ_SCRIPT, fields, list(attributes))
+    
+    def is_element_visible(self, locator, timeout=None):
+        self.restore_frame()
+        try:
+            return self.wait.visible(locator, timeout)
+        except TimeoutException:
+            return False
+    
+    def is_element_not_visible(self, locator, timeout=None):
+        # Returns as soon as the element is hidden or absent instead of waiting out the timeout
+        self.restore_frame()
+        try:
+            return self.wait.invisible(locator, timeout)
+        except TimeoutException:
+            return False
+    
+    def wait_for_any(self, locators, timeout=None):
+        """Wait until one of several elements is visible.
+        
+        Args:
+            locators (dict): Name -> locator
+            timeout (float, optional): Maximum wait time in seconds
+            
+        Returns:
+            str: Name of the first visible element, or None if none became visible
+        """
+        self.restore_frame()
+        conditions = {name: EC.visibility_of_element_located(locator)
+                      for name, locator in locators.items()}
+        try:
+            name, _ = self.wait.until_any(conditions, timeout=timeout)
+            return name
+        except TimeoutException:
+            return None
+    
+    def wait_for(self, condition, locator, text=None, timeout=None):
+        """Wait for a single condition on an element, using the page's wait mode.
+        
+        Args:
+            condition (str): 'present', 'visible', 'invisible' or 'text'
+            locator (tuple): Element locator
+            text (str, optional): Expected substring for the 'text' condition
+            timeout (float, optional): Maximum wait time in seconds
+        """
+        self.wait_for_sequence([dom_step(condition, locator, text)], timeout)
     
-    def is_element_visible(self, locator):
+    def wait_for_sequence(self, steps, timeout=None):
+        """Wait for several conditions to be met one after another.
+        
+        In 'dom' mode the whole sequence is resolved inside the page in one round-trip;
+        in 'poll' mode each step is polled in turn against a shared deadline.
+        
+        Args:
+            steps (list): Steps built with wait_actions.dom_step()
+            timeout (float, optional): Maximum total wait time in seconds
+        """
+        self.restore_frame()
+        if self.WAIT_MODE == "dom":
+            self.wait.until_dom(steps, timeout=timeout)
+        else:
+            self.wait.until_steps(steps, timeout=timeout)
+    
+    def _on_element(self, locator, action):
+        """Run action(element), re-locating the element once if the cached one went stale"""
+        element = self.find_element(locator)
         try:
-            return self.wait.until(EC.visibility_of_element_located(locator))
-        except:
-            return False
\ No newline at end of file
+            return action(element)
+        except StaleElementReferenceException:
+            if not self.cache_elements:
+                raise
+            self._count("stale")
+            self._element_cache.pop(self._cache_key(locator), None)
+            return action(self.find_element(locator))
+    
+    def _cache_key(self, locator):
+        return (self.context.window, self.context.frame_path, locator)
+    
+    def _count(self, stat):
+        self.cache_stats[stat] += 1
+        page_stats = BasePage.cache_stats_by_page.setdefault(
+            type(self).__name__, {"hits": 0, "misses": 0, "stale": 0}
+        )
+        page_stats[stat] += 1
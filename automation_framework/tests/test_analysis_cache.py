@@ -0,0 +1,110 @@
+import json
+import threading
+from types import SimpleNamespace
+import pytest
+from automation_framework.src.ai_module.analyzers import analysis_cache
+from automation_framework.src.ai_module.analyzers.analysis_cache import (
+    AnalysisCache, failure_signature, normalize_message, top_frames
+)
+
+TRACE = '''Traceback (most recent call last):
+  File "/ci/build-17/tests/test_login.py", line 12, in test_valid_login
+    login_page.login("tomsmith", "secret")
+  File "/ci/build-17/pages/login_page.py", line 16, in login
+    self.click(self.LOGIN_BUTTON)
+'''
+
+@pytest.fixture
+def now(monkeypatch):
+    """Wall clock of the cache module, advanced by setting now.value"""
+    now = SimpleNamespace(value=1_700_000_000.0)
+    monkeypatch.setattr(analysis_cache, "time", SimpleNamespace(time=lambda: now.value))
+    return now
+
+def test_normalize_message_removes_volatile_tokens():
+    """Test that session IDs, ports, timestamps and timings do not change the message"""
+    first = normalize_message("session 5f2a9c0d4e6b7a8f9c0d1e2f3a4b5c6d at localhost:51234 "
+                              "2024-03-11T11:27:25.123Z after 3.52s, 17 polls\nStacktrace:\n#0 0x55d1")
+    second = normalize_message("session 0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d at localhost:40001 "
+                               "2025-01-02T08:00:00Z after 9.1s, 4 polls")
+    assert first == second
+    assert "Stacktrace" not in first
+
+def test_signature_ignores_line_numbers_but_not_model():
+    """Test that the same failure in another build shares its signature with the same model only"""
+    failure = {"error_type": "TimeoutException", "error_message": "timed out after 10.0s", "stack_trace": TRACE}
+    moved = dict(failure, stack_trace=TRACE.replace("line 16", "line 18").replace("build-17", "build-18"))
+
+    assert top_frames(TRACE) == ["test_login.py:test_valid_login", "login_page.py:login"]
+    assert failure_signature(failure, "gpt", 1) == failure_signature(moved, "gpt", 1)
+    assert failure_signature(failure, "gpt", 1) != failure_signature(failure, "other", 1)
+    assert failure_signature(failure, "gpt", 1) != failure_signature(failure, "gpt", 2)
+
+def test_entries_expire_after_the_ttl(tmp_path, now):
+    """Test that an analysis is served until its time to live has passed"""
+    cache = AnalysisCache(tmp_path / "cache.json", ttl_hours=1)
+    cache.put("key", {"category": "Timing"})
+
+    now.value += 3599
+    assert cache.get("key") == {"category": "Timing"}
+    now.value += 1
+    assert cache.get("key") is None
+    assert cache.stats == {"hits": 1, "misses": 1}
+
+def test_errors_are_not_cached(tmp_path, now):
+    """Test that failed analyses are requested again"""
+    cache = AnalysisCache(tmp_path / "cache.json")
+    cache.put("key", {"error": "rate limited"})
+    assert cache.get("key") is None
+
+def test_save_evicts_least_recently_used_and_expired_entries(tmp_path, now):
+    """Test that the saved cache keeps only the most recently used fresh entries"""
+    path = tmp_path / "cache.json"
+    cache = AnalysisCache(path, ttl_hours=1, max_entries=2)
+    cache.put("expired", {"n": 0})
+    now.value += 1800
+    for n, key in enumerate(["a", "b", "c"], start=1):
+        now.value += 1
+        cache.put(key, {"n": n})
+    now.value += 1
+    cache.get("a")
+    now.value += 1800
+    cache.save()
+
+    assert sorted(json.loads(path.read_text())) == ["a", "c"]
+    reloaded = AnalysisCache(path, ttl_hours=1, max_entries=2)
+    assert reloaded.get("a") == {"n": 1}
+    assert reloaded.get("b") is None
+
+def test_get_or_compute_calls_the_model_once_per_key(tmp_path):
+    """Test that concurrent lookups of the same failure wait for the first request"""
+    cache = AnalysisCache(tmp_path / "cache.json")
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"category": "Timing"}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute("key", compute)))
+               for _ in range(4)]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert sorted(hit for _, hit in results) == [False, True, True, True]
+    assert all(analysis == {"category": "Timing"} for analysis, _ in results)
+
+def test_unreadable_cache_file_is_ignored(tmp_path):
+    """Test that a corrupt cache file starts an empty cache"""
+    path = tmp_path / "cache.json"
+    path.write_text("{truncated")
+    assert AnalysisCache(path).get("key") is None
@@ -0,0 +1,65 @@
+from unittest.mock import MagicMock, call
+import pytest
+from automation_framework.src.web.actions.browser_actions import BrowsingContext, origin_of
+from automation_framework.src.web.drivers.browser_pool import BrowserPool
+
+def _driver(cdp, current_url="https://app.example.com/cart"):
+    driver = MagicMock(name="driver")
+    driver.window_handles = ["main"]
+    driver.current_url = current_url
+    if not cdp:
+        del driver.execute_cdp_cmd
+    return driver
+
+def test_origin_of_keeps_scheme_host_and_port():
+    """Test that origins are compared without path, credentials or case"""
+    assert origin_of("https://user:pw@App.Example.com:8443/a?b#c") == "https://app.example.com:8443"
+    assert origin_of("about:blank") is None
+    assert origin_of(None) is None
+
+def test_single_origin_session_is_reset_and_kept():
+    """Test that a session that stayed on one origin is cleaned up and reused"""
+    pool, driver = BrowserPool(size=1), _driver(cdp=False)
+    BrowsingContext.of(driver).navigated("https://app.example.com/login")
+    pool.release(driver)
+
+    assert pool._idle == [driver]
+    driver.delete_all_cookies.assert_called_once()
+    driver.get.assert_called_once_with(BrowserPool.BLANK_URL)
+    assert BrowsingContext.of(driver).origins == set()
+
+def test_session_with_several_origins_is_recycled_without_cdp():
+    """Test that storage of origins WebDriver cannot reach is not leaked into the next test"""
+    pool, driver = BrowserPool(size=1), _driver(cdp=False)
+    BrowsingContext.of(driver).navigated("https://sso.example.com/login")
+    BrowsingContext.of(driver).navigated("https://app.example.com/cart")
+    pool.release(driver)
+
+    assert pool._idle == []
+    driver.quit.assert_called_once()
+    assert pool.stats["origin_recycles"] == 1
+    assert pool.stats["recycled"] == 1
+    assert "after opening several origins" in pool.summary()
+
+def test_cdp_clears_every_origin_the_session_opened():
+    """Test that Chromium sessions clear all cookies and the storage of other origins"""
+    pool, driver = BrowserPool(size=1), _driver(cdp=True)
+    BrowsingContext.of(driver).navigated("https://sso.example.com/login")
+    BrowsingContext.of(driver).navigated("https://app.example.com/cart")
+    pool.release(driver)
+
+    assert pool._idle == [driver]
+    assert driver.execute_cdp_cmd.call_args_list == [
+        call("Network.clearBrowserCookies", {}),
+        call("Storage.clearDataForOrigin",
+             {"origin": "https://sso.example.com", "storageTypes": BrowserPool.CLEARED_STORAGE})
+    ]
+
+@pytest.mark.parametrize("discard", [False, True])
+def test_held_session_is_reset_once(discard):
+    """Test that a session kept for a rerun is reset a single time, even when discarded"""
+    pool, driver = BrowserPool(size=1), _driver(cdp=False)
+    pool.release(driver, discard=discard, hold_for="test_a")
+
+    assert pool._held == {"test_a": driver}
+    assert driver.delete_all_cookies.call_count == 1
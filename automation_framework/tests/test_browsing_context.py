@@ -0,0 +1,121 @@
+from unittest.mock import MagicMock
+import pytest
+from selenium.common.exceptions import NoSuchFrameException, StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+from automation_framework.src.web.actions.browser_actions import BrowsingContext
+from automation_framework.src.web.pages.base_page import BasePage, in_frame
+
+class EditorPage(BasePage):
+    """Page object shaped like the example IFramePage"""
+
+    IFRAME = (By.ID, "mce_0_ifr")
+    EDITOR_BODY = (By.ID, "tinymce")
+    HEADING = (By.TAG_NAME, "h3")
+
+    @in_frame(IFRAME)
+    def get_editor_text(self):
+        return self.get_text(self.EDITOR_BODY)
+
+    @in_frame(IFRAME)
+    def clear_editor(self):
+        self.clear(self.EDITOR_BODY)
+
+    @in_frame(IFRAME)
+    def type_text(self, text):
+        self.send_keys(self.EDITOR_BODY, text)
+
+    def get_heading(self):
+        return self.get_text(self.HEADING)
+
+def _switches(driver):
+    return {
+        "frame": driver.switch_to.frame.call_count,
+        "default_content": driver.switch_to.default_content.call_count,
+        "parent_frame": driver.switch_to.parent_frame.call_count
+    }
+
+@pytest.fixture
+def driver():
+    driver = MagicMock(name="driver")
+    driver.find_element.return_value.text = "Your content goes here."
+    return driver
+
+def test_consecutive_editor_calls_switch_into_the_frame_once(driver):
+    """Test that @in_frame methods in the same frame share a single switch"""
+    page = EditorPage(driver)
+    page.clear_editor()
+    page.type_text("Hello")
+    assert page.get_editor_text() == "Your content goes here."
+
+    assert _switches(driver) == {"frame": 1, "default_content": 0, "parent_frame": 0}
+    assert page.context.frame_path == (EditorPage.IFRAME,)
+    assert page.context.scope == ()
+
+def test_next_call_outside_the_frame_switches_back_lazily(driver):
+    """Test that leaving the frame costs one switch, sent by the next top-level call"""
+    page = EditorPage(driver)
+    page.type_text("Hello")
+    page.get_heading()
+    page.get_heading()
+    page.type_text("again")
+
+    assert _switches(driver) == {"frame": 2, "default_content": 0, "parent_frame": 1}
+
+def test_other_page_objects_see_the_callers_frame(driver):
+    """Test that a page object sharing the driver is switched back before it acts"""
+    editor, other = EditorPage(driver), EditorPage(driver)
+    editor.type_text("Hello")
+    other.get_heading()
+
+    assert other.context is editor.context
+    assert other.context.frame_path == ()
+    assert _switches(driver)["parent_frame"] == 1
+
+def test_explicit_switch_becomes_the_scope(driver):
+    """Test that page object calls after switch_to_frame_path() stay in that frame"""
+    page = EditorPage(driver)
+    page.switch_to_frame_path(EditorPage.IFRAME)
+    page.get_heading()
+    page.get_editor_text()
+    page.restore_frame()
+
+    assert _switches(driver) == {"frame": 1, "default_content": 0, "parent_frame": 0}
+
+def test_navigation_and_reset_forget_the_frame(driver):
+    """Test that the tracked frame is dropped when the driver is known to be top-level"""
+    page = EditorPage(driver)
+    page.type_text("Hello")
+    page.open("https://example.com/")
+    page.get_heading()
+    page.type_text("Hello")
+    BrowsingContext.of(driver).reset(window="main")
+    page.get_heading()
+
+    assert _switches(driver) == {"frame": 2, "default_content": 0, "parent_frame": 0}
+
+def test_stale_frame_element_is_located_again(driver):
+    """Test that a cached frame that went stale is located again once"""
+    page = EditorPage(driver, cache_elements=True)
+    driver.switch_to.frame.side_effect = [StaleElementReferenceException("stale"), None]
+    page.get_editor_text()
+
+    assert driver.switch_to.frame.call_count == 2
+    assert page.context.frame_path == (EditorPage.IFRAME,)
+
+def test_missing_frame_fails_without_a_second_wait():
+    """Test that a frame locator timing out is not retried from the top-level document"""
+    find = MagicMock(side_effect=TimeoutException("no such iframe"))
+    context = BrowsingContext(MagicMock(name="driver"))
+    with pytest.raises(TimeoutException):
+        context.switch_to_frame_path([EditorPage.IFRAME], find)
+    assert find.call_count == 1
+
+def test_vanished_frame_is_entered_again_from_the_top():
+    """Test that a frame that went away mid-walk is retried from the top-level document"""
+    driver = MagicMock(name="driver")
+    driver.switch_to.frame.side_effect = [None, NoSuchFrameException("gone"), None, None]
+    context = BrowsingContext(driver)
+    context.switch_to_frame_path([EditorPage.IFRAME, EditorPage.HEADING], MagicMock())
+
+    assert driver.switch_to.default_content.call_count == 1
+    assert context.frame_path == (EditorPage.IFRAME, EditorPage.HEADING)
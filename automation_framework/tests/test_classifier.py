@@ -0,0 +1,81 @@
+import json
+import pytest
+from automation_framework.src.ai_module.models.classifier import SOURCE, FailureClassifier, load_verdicts
+
+def _timeout(n):
+    return {"error_type": "TimeoutException",
+            "error_message": f"Timed out after 10s waiting for visibility of #spinner-{n}", "stack_trace": ""}
+
+def _assertion(n):
+    return {"error_type": "AssertionError",
+            "error_message": f"Expected total 4{n}.00 in the cart but got 0.00", "stack_trace": ""}
+
+@pytest.fixture
+def training_data():
+    failures, verdicts = [], []
+    for n in range(8):
+        failures += [_timeout(n), _assertion(n)]
+        verdicts += [{"probability_true_bug": 0.1, "category": "Timing"},
+                     {"probability_true_bug": 0.9, "category": "assertion  error"}]
+    return failures, verdicts
+
+def test_fit_learns_true_bugs_and_categories(training_data):
+    """Test that the classifier separates timing flakes from assertion failures"""
+    classifier = FailureClassifier(num_features=2 ** 12).fit(*training_data)
+
+    timeout, assertion = classifier.predict(_timeout(99)), classifier.predict(_assertion(99))
+    assert classifier.categories == ["Assertion Error", "Timing"]
+    assert timeout["category"] == "Timing" and timeout["probability_true_bug"] < 0.5
+    assert assertion["category"] == "Assertion Error" and assertion["probability_true_bug"] > 0.5
+    assert 0.0 < timeout["coverage"] <= 1.0
+
+def test_unfamiliar_failures_get_low_confidence(training_data):
+    """Test that failures with unseen features are escalated rather than trusted"""
+    classifier = FailureClassifier(num_features=2 ** 12).fit(*training_data)
+    unfamiliar = {"error_type": "KeyError", "error_message": "quux", "stack_trace": ""}
+    assert classifier.predict(unfamiliar)["confidence"] < classifier.predict(_timeout(99))["confidence"]
+
+def test_training_is_deterministic(training_data):
+    """Test that two fits on the same verdicts give the same model"""
+    first = FailureClassifier(num_features=2 ** 12).fit(*training_data)
+    second = FailureClassifier(num_features=2 ** 12).fit(*training_data)
+    assert first.predict(_assertion(3)) == second.predict(_assertion(3))
+
+def test_save_load_round_trip(tmp_path, training_data):
+    """Test that a reloaded model makes the same predictions as the saved one"""
+    classifier = FailureClassifier(num_features=2 ** 12).fit(*training_data)
+    path = tmp_path / "models" / "classifier.json"
+    classifier.save(path)
+    loaded = FailureClassifier.load(path)
+
+    assert not path.with_suffix(".tmp").exists()
+    assert loaded.trained_on == 16
+    assert loaded.trained_at == classifier.trained_at
+    assert loaded.categories == classifier.categories
+    for failure in [_timeout(99), _assertion(99), {"error_type": "KeyError", "error_message": "x"}]:
+        expected, actual = classifier.predict(failure), loaded.predict(failure)
+        assert actual["category"] == expected["category"]
+        for key in ("probability_true_bug", "confidence", "coverage"):
+            assert actual[key] == pytest.approx(expected[key], abs=1e-3)
+
+def test_untrained_classifier_refuses_to_predict():
+    """Test that predicting or fitting without verdicts raises"""
+    with pytest.raises(ValueError):
+        FailureClassifier().predict(_timeout(1))
+    with pytest.raises(ValueError):
+        FailureClassifier().fit([], [])
+
+def test_load_verdicts_skips_errors_and_own_verdicts(tmp_path):
+    """Test that only LLM verdicts with a numeric probability become training data"""
+    path = tmp_path / "analysis.json"
+    path.write_text(json.dumps({"results": [
+        {"failure_data": _timeout(1), "analysis": {"probability_true_bug": 0.1, "category": "Timing"}},
+        {"failure_data": _timeout(2), "analysis": {"error": "rate limited"}},
+        {"failure_data": _timeout(3), "analysis": {"probability_true_bug": 0.2, "source": SOURCE}},
+        {"failure_data": _timeout(4), "analysis": {"probability_true_bug": "low"}}
+    ]}))
+    (tmp_path / "broken.json").write_text("{truncated")
+
+    failures, verdicts = load_verdicts([path, tmp_path / "broken.json", tmp_path / "missing.json"])
+    assert failures == [_timeout(1)]
+    assert verdicts[0]["category"] == "Timing"
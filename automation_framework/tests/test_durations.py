@@ -0,0 +1,67 @@
+import json
+import pytest
+from automation_framework.src.execution.durations import DurationHistory, balance, parse_shard
+
+def test_parse_shard_is_zero_based():
+    """Test that 'i/N' is parsed into a 0-based index and the shard count"""
+    assert parse_shard("1/1") == (0, 1)
+    assert parse_shard("2/4") == (1, 4)
+    assert parse_shard("4/4") == (3, 4)
+
+@pytest.mark.parametrize("value", ["", "2", "2/", "a/4", "1/2/3", "0/4", "5/4", "1/0", "-1/4"])
+def test_parse_shard_rejects_invalid_values(value):
+    """Test that malformed or out of range shards are usage errors"""
+    with pytest.raises(pytest.UsageError):
+        parse_shard(value)
+
+def test_balance_evens_out_durations():
+    """Test that longest-first assignment gives bins of similar total duration"""
+    durations = {"a": 5.0, "b": 4.0, "c": 3.0, "d": 3.0, "e": 2.0, "f": 1.0}
+    assignments = balance(list(durations), 2, durations.get)
+
+    totals = [sum(durations[nodeid] for nodeid in assignment) for assignment in assignments]
+    assert totals == [9.0, 9.0]
+    assert sorted(nodeid for assignment in assignments for nodeid in assignment) == sorted(durations)
+    for assignment in assignments:
+        assert assignment == sorted(assignment, key=lambda nodeid: -durations[nodeid])
+
+def test_balance_is_deterministic():
+    """Test that every node computes the same split, whatever the collection order"""
+    nodeids = [f"test_{n}" for n in range(20)]
+    estimate = lambda nodeid: 1.0
+    assert balance(nodeids, 3, estimate) == balance(list(reversed(nodeids)), 3, estimate)
+
+def test_balance_with_more_bins_than_tests():
+    """Test that surplus bins stay empty"""
+    assignments = balance(["a", "b"], 4, lambda nodeid: 1.0)
+    assert sorted(len(assignment) for assignment in assignments) == [0, 0, 1, 1]
+
+def test_duration_history_estimates_new_tests_as_the_median(tmp_path):
+    """Test that tests without history count as a typical test"""
+    path = tmp_path / "durations.json"
+    path.write_text(json.dumps({"a": 1.0, "b": 3.0, "c": 10.0}))
+    history = DurationHistory(path)
+
+    assert history.estimate("c") == 10.0
+    assert history.estimate("new") == 3.0
+    assert history.known(["a", "new"]) == 1
+
+def test_duration_history_smooths_and_saves(tmp_path):
+    """Test that phases are summed per test and merged into the history on save"""
+    path = tmp_path / "durations.json"
+    path.write_text(json.dumps({"a": 1.0}))
+    history = DurationHistory(path)
+    history.add("a", 1.5)
+    history.add("a", 0.5)
+    history.add("b", 4.0)
+    history.save()
+
+    saved = json.loads(path.read_text())
+    assert saved == {"a": round(1.0 + DurationHistory.SMOOTHING * (2.0 - 1.0), 3), "b": 4.0}
+    assert not list(tmp_path.glob("*.tmp"))
+
+def test_duration_history_ignores_unreadable_file(tmp_path):
+    """Test that a corrupt history falls back to the default duration"""
+    path = tmp_path / "durations.json"
+    path.write_text("{not json")
+    assert DurationHistory(path).estimate("a") == DurationHistory.DEFAULT_DURATION
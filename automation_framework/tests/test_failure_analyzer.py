@@ -0,0 +1,135 @@
+import json
+import re
+from types import SimpleNamespace
+import pytest
+from automation_framework.src.ai_module.analyzers.analysis_cache import AnalysisCache
+from automation_framework.src.ai_module.analyzers.failure_analyzer import FailureAnalyzer
+
+def _verdict(failure_id=None, **overrides):
+    verdict = {
+        "probability_true_bug": 0.2,
+        "category": "Timing",
+        "subcategory": "Explicit wait timeout",
+        "confidence": 0.8,
+        "reasoning": "Element did not appear in time",
+        "suggested_fix": "Wait for the spinner first"
+    }
+    if failure_id is not None:
+        verdict["failure_id"] = failure_id
+    verdict.update(overrides)
+    return verdict
+
+def _failure(n):
+    return {"test_name": f"test_{n}", "error_type": "TimeoutException",
+            "error_message": f"Timed out waiting for element number {n}", "stack_trace": ""}
+
+def _response(content):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=None)
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    """Analyzer whose model calls are answered locally; batch responses skip the second failure"""
+    analyzer = FailureAnalyzer({"provider": "unit-test", "api_key": "test", "model": "test-model"},
+                               batch_token_budget=4000)
+    analyzer.requests = []
+
+    def complete(messages):
+        prompt = messages[-1]["content"]
+        if messages[0]["content"] == FailureAnalyzer.BATCH_SYSTEM_PROMPT:
+            ids = re.findall(r"### Failure (F\d+)", prompt)
+            analyzer.requests.append(len(ids))
+            return _response(json.dumps({"verdicts": [_verdict(failure_id) for failure_id in ids if failure_id != "F2"]}))
+        analyzer.requests.append(1)
+        return _response(json.dumps(_verdict()))
+
+    monkeypatch.setattr(analyzer, "_complete", complete)
+    return analyzer
+
+@pytest.mark.parametrize("content", [
+    None,
+    "",
+    "not json",
+    '{"verdicts": "F1 is a timing issue"}',
+    '{"answer": []}',
+    "42",
+    '["F1"]'
+])
+def test_parse_verdicts_rejects_malformed_responses(content):
+    """Test that unusable batch responses give no verdict instead of raising"""
+    assert FailureAnalyzer._parse_verdicts(content, 2) == [None, None]
+
+def test_parse_verdicts_maps_failure_ids_to_positions():
+    """Test that verdicts are placed by failure ID, whatever their order"""
+    content = json.dumps({"verdicts": [_verdict("F2", category="Data"), _verdict("f1")]})
+    verdicts = FailureAnalyzer._parse_verdicts(content, 2)
+
+    assert [verdict["category"] for verdict in verdicts] == ["Timing", "Data"]
+    assert all("failure_id" not in verdict for verdict in verdicts)
+
+def test_parse_verdicts_accepts_a_bare_list():
+    """Test that a top-level list of verdicts is accepted"""
+    assert FailureAnalyzer._parse_verdicts(json.dumps([_verdict("F1")]), 1)[0]["category"] == "Timing"
+
+@pytest.mark.parametrize("verdict", [
+    _verdict("F3"),
+    _verdict("F0"),
+    _verdict("X1"),
+    _verdict("F"),
+    _verdict(),
+    _verdict("F1", probability_true_bug=1.5),
+    _verdict("F1", probability_true_bug="high"),
+    _verdict("F1", confidence=-0.1),
+    _verdict("F1", category=None),
+    {"failure_id": "F1", "probability_true_bug": 0.5, "confidence": 0.5}
+])
+def test_parse_verdicts_drops_invalid_verdicts(verdict):
+    """Test that out of range IDs, scores and missing fields leave the failure without a verdict"""
+    content = json.dumps({"verdicts": ["F1", verdict]})
+    assert FailureAnalyzer._parse_verdicts(content, 2) == [None, None]
+
+def test_parse_verdicts_keeps_the_first_verdict_per_failure():
+    """Test that a duplicated failure ID does not overwrite the first verdict"""
+    content = json.dumps({"verdicts": [_verdict("F1"), _verdict("F1", category="Data")]})
+    assert FailureAnalyzer._parse_verdicts(content, 1)[0]["category"] == "Timing"
+
+def test_pack_batches_respects_the_batch_size(analyzer):
+    """Test that batches keep the input order and hold at most MAX_BATCH_SIZE failures"""
+    analyzer.batch_token_budget = 10 ** 6
+    batches = analyzer._pack_batches([_failure(n) for n in range(25)])
+
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert [index for batch in batches for index in batch] == list(range(25))
+
+def test_pack_batches_respects_the_token_budget(analyzer):
+    """Test that a small budget splits failures into more batches"""
+    failures = [_failure(n) for n in range(6)]
+    analyzer.batch_token_budget = 10 ** 6
+    assert len(analyzer._pack_batches(failures)) == 1
+    analyzer.batch_token_budget = 1
+    assert len(analyzer._pack_batches(failures)) == 6
+
+def test_missing_batch_verdicts_are_analyzed_individually(analyzer):
+    """Test that a failure without a valid batch verdict gets its own request"""
+    results = analyzer.analyze_failures([_failure(n) for n in range(3)])
+
+    assert analyzer.requests == [3, 1]
+    assert [result["test_name"] for result in results["results"]] == ["test_0", "test_1", "test_2"]
+    assert all("error" not in result["analysis"] for result in results["results"])
+    assert results["metadata"]["batches"][0]["fallbacks"] == 1
+
+def test_metadata_counts_each_call_separately(analyzer):
+    """Test that a second analyze_failures() call does not report the batches of the first"""
+    analyzer.analyze_failures([_failure(n) for n in range(3)])
+    results = analyzer.analyze_failures([_failure(n) for n in range(3, 6)])
+    assert len(results["metadata"]["batches"]) == 1
+
+def test_metadata_counts_model_analyses(analyzer, tmp_path):
+    """Test that cached and prefetched analyses are not reported as analyzed by the model"""
+    analyzer.cache = AnalysisCache(tmp_path / "cache.json")
+    analyzer.batch_token_budget = None
+    analyzer.analyze_failures([_failure(0)])
+    analyzer.prefetched = {analyzer.analysis_key(_failure(1)): _verdict()}
+
+    results = analyzer.analyze_failures([_failure(n) for n in range(3)])
+    assert analyzer.requests == [1, 1]
+    assert results["metadata"]["model_analyses"] == 1
@@ -0,0 +1,110 @@
+import json
+from types import SimpleNamespace
+import pytest
+from automation_framework.src.execution.flakiness import FlakinessTracker, QuarantineLane
+
+def _run(tracker, outcomes, verdicts=None):
+    """Record one run: node ID -> 'passed', 'failed', 'skipped' or 'rerun' (passed on a rerun)"""
+    for nodeid, outcome in outcomes.items():
+        tracker.pytest_runtest_logreport(SimpleNamespace(
+            nodeid=nodeid, failed=outcome == "failed", skipped=outcome == "skipped",
+            reruns=1 if outcome == "rerun" else 0))
+    if verdicts:
+        tracker.record_analysis({"results": [{"test_name": nodeid, "analysis": {"probability_true_bug": p}}
+                                             for nodeid, p in verdicts.items()]})
+    tracker.save()
+
+def test_first_run_sets_the_failure_rate_without_a_flip(tmp_path):
+    """Test that a first failure counts fully towards the failure rate but is no flip"""
+    tracker = FlakinessTracker(tmp_path / "flakiness.json")
+    _run(tracker, {"t": "failed"})
+
+    entry = tracker.tests["t"]
+    assert entry["failure_rate"] == 1.0
+    assert entry["flip_rate"] == 0.0
+    assert tracker.score("t") == 0.0
+
+def test_flip_rate_is_smoothed_over_alternating_outcomes(tmp_path):
+    """Test that each change of outcome moves the flip rate by the smoothing weight"""
+    tracker = FlakinessTracker(tmp_path / "flakiness.json")
+    for outcome in ["failed", "passed", "failed"]:
+        _run(tracker, {"flaky": outcome, "stable": "passed"})
+
+    assert tracker.tests["flaky"]["flip_rate"] == pytest.approx(0.36)
+    assert tracker.tests["flaky"]["failure_rate"] == pytest.approx(0.84)
+    assert tracker.score("flaky") == pytest.approx(0.36)
+    assert tracker.score("stable") == 0.0
+
+def test_passing_on_a_rerun_is_a_flip(tmp_path):
+    """Test that a test which only passed on a rerun counts as flipping within the run"""
+    tracker = FlakinessTracker(tmp_path / "flakiness.json")
+    _run(tracker, {"t": "rerun"})
+    assert tracker.tests["t"]["flip_rate"] == pytest.approx(0.2)
+    assert tracker.tests["t"]["last_outcome"] == "passed"
+
+def test_true_bug_verdicts_discount_the_score(tmp_path):
+    """Test that a likely product bug is not scored as flaky"""
+    tracker = FlakinessTracker(tmp_path / "flakiness.json")
+    for outcome in ["failed", "passed", "failed"]:
+        _run(tracker, {"bug": outcome, "flake": outcome},
+             verdicts={"bug": 0.75, "flake": 0.0} if outcome == "failed" else None)
+
+    assert tracker.tests["bug"]["probability_true_bug"] == 0.75
+    assert tracker.score("bug") == pytest.approx(0.36 * 0.25)
+    assert tracker.score("flake") == pytest.approx(0.36)
+
+def test_skipped_tests_are_not_scored(tmp_path):
+    """Test that skipping neither creates an entry nor counts as a run"""
+    tracker = FlakinessTracker(tmp_path / "flakiness.json")
+    _run(tracker, {"t": "skipped"})
+    assert "t" not in tracker.tests
+
+def test_save_keeps_tests_recorded_by_other_runs(tmp_path):
+    """Test that scores are merged with the file, which is written atomically"""
+    path = tmp_path / "flakiness.json"
+    first, second = FlakinessTracker(path), FlakinessTracker(path)
+    _run(first, {"a": "failed"})
+    _run(second, {"b": "passed"})
+
+    assert sorted(json.loads(path.read_text())["tests"]) == ["a", "b"]
+    assert not path.with_suffix(".tmp").exists()
+    assert FlakinessTracker(path).tests["a"]["runs"] == 1
+
+def test_quarantine_needs_enough_runs(tmp_path):
+    """Test that only tests with MIN_RUNS runs and a high enough score are quarantined"""
+    tracker = FlakinessTracker(tmp_path / "flakiness.json")
+    _run(tracker, {"new": "failed", "flaky": "failed"})
+    _run(tracker, {"new": "passed", "flaky": "passed"})
+    assert tracker.quarantined(["new", "flaky"], threshold=0.1) == {}
+
+    _run(tracker, {"flaky": "failed"})
+    assert tracker.quarantined(["new", "flaky", "unknown"], threshold=0.1) == {"flaky": pytest.approx(0.36)}
+    assert tracker.quarantined(["flaky"], threshold=0.5) == {}
+
+def test_quarantine_lane_moves_flaky_tests_last(tmp_path):
+    """Test that quarantined tests run after the others, keeping the order of both lanes"""
+    tracker = FlakinessTracker(tmp_path / "flakiness.json")
+    for outcome in ["failed", "passed", "failed"]:
+        _run(tracker, {"b": outcome, "d": outcome, "a": "passed", "c": "passed"})
+    items = [SimpleNamespace(nodeid=nodeid) for nodeid in ["a", "b", "c", "d"]]
+
+    lane = QuarantineLane(tracker, threshold=0.3)
+    lane.select(items)
+    assert [item.nodeid for item in items] == ["a", "c", "b", "d"]
+    assert sorted(lane.quarantined) == ["b", "d"]
+
+def test_unreadable_scores_start_from_the_run_history(tmp_path):
+    """Test that a corrupt file is ignored and the scores are seeded from past runs"""
+    path = tmp_path / "flakiness.json"
+    path.write_text("{truncated")
+    history = SimpleNamespace(test_stats=lambda last_runs: {
+        "t": {"runs": 5, "flakiness_rate": 0.5, "failure_rate": 0.4, "failures": 2,
+              "last_outcome": "failed", "last_verdict": {"probability_true_bug": 0.2}},
+        "skipped": {"runs": 5, "flakiness_rate": 0.0, "failure_rate": 0.0, "failures": 0,
+                    "last_outcome": "skipped", "last_verdict": None}
+    })
+    tracker = FlakinessTracker(path, run_history=history)
+
+    assert list(tracker.tests) == ["t"]
+    assert tracker.score("t") == pytest.approx(0.4)
+    assert tracker.tests["t"]["last_outcome"] == "failed"
@@ -0,0 +1,58 @@
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+import httpx
+import pytest
+from automation_framework.src.ai_module.analyzers import http_transport
+from automation_framework.src.ai_module.analyzers.http_transport import DEFAULTS, RetryingTransport
+
+@pytest.fixture
+def transport(monkeypatch):
+    """Transport whose attempts are answered from a list and whose waits are recorded"""
+    throttles, sleeps, responses = [], [], []
+    transport = RetryingTransport(dict(DEFAULTS), on_throttle=throttles.append)
+    transport.throttles, transport.sleeps, transport.responses = throttles, sleeps, responses
+    monkeypatch.setattr(transport, "_send", lambda request: (responses.pop(0), False))
+    monkeypatch.setattr(http_transport, "time", SimpleNamespace(sleep=sleeps.append, perf_counter=time.perf_counter))
+    yield transport
+    transport.client.close()
+
+def _response(status, **headers):
+    return httpx.Response(status, headers=headers, request=httpx.Request("POST", "https://llm.example.com/v1"))
+
+@pytest.mark.parametrize("value, expected", [
+    ("7", 7.0),
+    ("1.5", 1.5),
+    ("3600", 30.0),
+    ("-5", 0.0),
+    ("soon", None),
+    ("Mon, 32 Foo 2026 25:00:00 GMT", None)
+])
+def test_retry_after_seconds_are_capped(transport, value, expected):
+    """Test that delta-seconds are honoured up to backoff_max"""
+    assert transport._retry_after(_response(429, **{"retry-after": value})) == expected
+
+def test_retry_after_without_header(transport):
+    """Test that a response without Retry-After leaves the wait to the backoff"""
+    assert transport._retry_after(_response(503)) is None
+
+def test_retry_after_http_date(transport):
+    """Test that an HTTP date is turned into the time left until then"""
+    soon = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=20), usegmt=True)
+    later = format_datetime(datetime.now(timezone.utc) + timedelta(hours=1), usegmt=True)
+    past = format_datetime(datetime.now(timezone.utc) - timedelta(hours=1), usegmt=True)
+
+    assert transport._retry_after(_response(429, **{"retry-after": soon})) == pytest.approx(20, abs=2)
+    assert transport._retry_after(_response(429, **{"retry-after": later})) == 30.0
+    assert transport._retry_after(_response(429, **{"retry-after": past})) == 0.0
+
+def test_long_retry_after_does_not_stall_other_threads(transport):
+    """Test that a 429 asking for an hour pauses the provider for backoff_max only"""
+    transport.responses += [_response(429, **{"retry-after": "3600"}), _response(200)]
+    response = transport.client.post("https://llm.example.com/v1")
+
+    assert response.status_code == 200
+    assert transport.throttles == [30.0]
+    assert transport.sleeps == [30.0]
+    assert transport.stats["retries"] == 1
@@ -0,0 +1,118 @@
+import subprocess
+from pathlib import Path
+from types import SimpleNamespace
+import pytest
+from automation_framework.src.execution.impact import ImpactIndex, changed_files_since, select_affected
+
+FILES = {
+    "app/__init__.py": "",
+    "app/pages/__init__.py": "",
+    "app/pages/base_page.py": "class BasePage:\n    pass\n",
+    "app/pages/login_page.py": "from .base_page import BasePage\n\nclass LoginPage(BasePage):\n    pass\n",
+    "app/pages/cart_page.py": "from app.pages.base_page import BasePage\n\nclass CartPage(BasePage):\n    pass\n",
+    "app/fixtures.py": "import pytest\n\n@pytest.fixture(name='user')\ndef make_user():\n    return 'tomsmith'\n",
+    "app/settings.yaml": "base_url: https://example.com\n",
+    "tests/test_login.py": "from app.pages.login_page import LoginPage\n\ndef test_login(user):\n    LoginPage()\n",
+    "tests/test_plain.py": "def test_plain():\n    assert True\n",
+    "tests/cart/conftest.py": ("import pytest\nfrom app.pages import cart_page\n\n"
+                               "@pytest.fixture\ndef cart():\n    return cart_page.CartPage()\n"),
+    "tests/cart/test_cart.py": "def test_cart(cart):\n    assert cart\n",
+    "README.md": "# Project\n"
+}
+
+TESTS = ["tests/test_login.py", "tests/test_plain.py", "tests/cart/test_cart.py"]
+
+@pytest.fixture
+def project(tmp_path):
+    for name, content in FILES.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return tmp_path.resolve()
+
+def _affected(project, *changed):
+    index = ImpactIndex(project)
+    index.update([project / name for name in TESTS + ["tests/cart/conftest.py", "app/fixtures.py"]])
+    affected, run_all = index.affected([project / name for name in changed], [project / name for name in TESTS])
+    return sorted(path.relative_to(project).as_posix() for path in affected), run_all
+
+def test_page_object_change_selects_its_tests(project):
+    """Test that a page object change selects the tests importing it, and no others"""
+    assert _affected(project, "app/pages/login_page.py") == (["tests/test_login.py"], None)
+
+def test_base_class_change_selects_every_page_user(project):
+    """Test that a base class change reaches tests through imports and conftest fixtures"""
+    assert _affected(project, "app/pages/base_page.py") == (["tests/cart/test_cart.py", "tests/test_login.py"], None)
+
+def test_fixture_change_selects_the_requesting_tests(project):
+    """Test that a plugin fixture change selects the tests requesting the fixture by name"""
+    assert _affected(project, "app/fixtures.py") == (["tests/test_login.py"], None)
+
+def test_conftest_change_selects_its_directory(project):
+    """Test that a conftest file applies to the tests below its directory"""
+    assert _affected(project, "tests/cart/conftest.py") == (["tests/cart/test_cart.py"], None)
+
+def test_non_python_change_runs_everything(project):
+    """Test that configuration files, read at runtime, select every test"""
+    affected, run_all = _affected(project, "app/settings.yaml")
+    assert affected == sorted(TESTS)
+    assert run_all == "non-Python file changed: app/settings.yaml"
+
+def test_documentation_and_outside_files_select_nothing(project, tmp_path_factory):
+    """Test that documentation and files outside the project are ignored"""
+    outside = tmp_path_factory.mktemp("elsewhere") / "module.py"
+    assert _affected(project, "README.md", outside) == ([], None)
+
+def test_deleted_module_runs_everything(project):
+    """Test that a deleted module selects every test, as its importers now fail"""
+    affected, run_all = _affected(project, "app/pages/gone_page.py")
+    assert affected == sorted(TESTS)
+    assert run_all == "Python file deleted: app/pages/gone_page.py"
+
+def test_index_reparses_only_edited_files(project):
+    """Test that cached entries are reused until a file's content changes"""
+    roots = [project / name for name in TESTS]
+    entries = ImpactIndex(project).update(roots)
+    assert "app/pages/base_page.py" in entries
+
+    index = ImpactIndex(project, entries)
+    index.update(roots)
+    assert index.stats["parsed"] == 0
+
+    (project / "app/pages/login_page.py").write_text(FILES["app/pages/login_page.py"] + "\nTITLE = 'Login'\n")
+    index.update(roots)
+    assert index.stats["parsed"] == 1
+
+def test_changed_files_since_includes_uncommitted_and_untracked(project):
+    """Test the changed file list of a git work tree"""
+    def git(*args):
+        subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                       cwd=project, check=True, capture_output=True)
+    git("init", "-q")
+    git("add", "-A")
+    git("commit", "-q", "-m", "initial")
+    (project / "app/pages/cart_page.py").write_text("# edited\n")
+    (project / "app/pages/new_page.py").write_text("")
+
+    changed = changed_files_since("HEAD", project / "tests")
+    assert sorted(Path(path).resolve().relative_to(project).as_posix() for path in changed) == [
+        "app/pages/cart_page.py", "app/pages/new_page.py"]
+
+def test_select_affected_deselects_unaffected_items(project):
+    """Test the collection hook helper on a pytest-like config"""
+    cache, deselected = {}, []
+    config = SimpleNamespace(
+        cache=SimpleNamespace(get=lambda key, default: cache.get(key, default), set=cache.__setitem__),
+        invocation_params=SimpleNamespace(dir=project),
+        rootpath=project,
+        pluginmanager=SimpleNamespace(get_plugins=lambda: [SimpleNamespace(__file__=str(project / name))
+                                                           for name in ("app/fixtures.py", "tests/cart/conftest.py")]),
+        hook=SimpleNamespace(pytest_deselected=lambda items: deselected.extend(items))
+    )
+    items = [SimpleNamespace(path=project / name, nodeid=name) for name in TESTS]
+
+    summary = select_affected(config, items, [project / "app/pages/cart_page.py"])
+    assert [item.nodeid for item in items] == ["tests/cart/test_cart.py"]
+    assert len(deselected) == 2
+    assert "1 of 3 tests selected" in summary
+    assert cache
@@ -0,0 +1,67 @@
+import pytest
+from automation_framework.src.ai_module.analyzers.pattern_detector import PatternDetector
+
+TRACE = '''Traceback (most recent call last):
+  File "/repo/tests/test_checkout.py", line 20, in test_checkout
+    page.pay()
+  File "/repo/pages/checkout_page.py", line 31, in pay
+    self.click(self.PAY_BUTTON)
+'''
+
+def _failure(message, error_type="TimeoutException", trace=TRACE):
+    return {"error_type": error_type, "error_message": message, "stack_trace": trace}
+
+UNREACHABLE = ("Message: unknown error: net::ERR_CONNECTION_REFUSED (Session info: chrome=122.0) "
+               "while loading https://staging.example.com/checkout for test user")
+
+def test_identical_failures_with_volatile_tokens_share_a_cluster():
+    """Test that failures differing only in session IDs and ports are grouped exactly"""
+    failures = [
+        _failure("session 5f2a9c0d4e6b7a8f9c0d1e2f3a4b5c6d timed out at localhost:51234"),
+        _failure("session 0a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d timed out at localhost:40001"),
+        _failure("element #pay is not clickable", error_type="ElementClickInterceptedException")
+    ]
+    clusters = PatternDetector().detect(failures)
+
+    assert [cluster["members"] for cluster in clusters] == [[0, 1], [2]]
+    assert [cluster["representative"] for cluster in clusters] == [0, 2]
+    assert [cluster["cluster_id"] for cluster in clusters] == ["cluster-1", "cluster-2"]
+
+def test_near_duplicate_messages_are_clustered():
+    """Test that a one-word difference in a long message still clusters"""
+    failures = [_failure(UNREACHABLE), _failure(UNREACHABLE.replace("test user", "admin user"))]
+    assert len(PatternDetector(threshold=0.7).detect(failures)) == 1
+
+def test_different_error_types_are_never_clustered():
+    """Test that the same message with another exception type is a separate cluster"""
+    failures = [_failure(UNREACHABLE), _failure(UNREACHABLE, error_type="WebDriverException")]
+    assert len(PatternDetector(threshold=0.0).detect(failures)) == 2
+
+def test_unrelated_messages_stay_apart():
+    """Test that dissimilar failures are not merged"""
+    failures = [
+        _failure("Timed out after 10s waiting for visibility of #finish"),
+        _failure("Expected 'Welcome' in the flash message but got 'Invalid password'")
+    ]
+    assert len(PatternDetector().detect(failures)) == 2
+
+def test_similar_matches_detect_for_single_pairs():
+    """Test the pairwise check used for failures arriving one at a time"""
+    detector = PatternDetector(threshold=0.7)
+    assert detector.similar(_failure(UNREACHABLE), _failure(UNREACHABLE.replace("test user", "admin user")))
+    assert not detector.similar(_failure(UNREACHABLE), _failure(UNREACHABLE, error_type="WebDriverException"))
+
+def test_minhash_is_deterministic_and_estimates_similarity():
+    """Test that signatures are reproducible and agree with the exact similarity"""
+    detector = PatternDetector(num_perm=128, bands=16)
+    first = detector.shingles(_failure(UNREACHABLE))
+    second = detector.shingles(_failure(UNREACHABLE.replace("checkout for", "cart for")))
+
+    assert detector.minhash(first) == PatternDetector(num_perm=128, bands=16).minhash(first)
+    agreement = sum(a == b for a, b in zip(detector.minhash(first), detector.minhash(second))) / 128
+    assert agreement == pytest.approx(detector.jaccard(first, second), abs=0.15)
+
+def test_bands_must_divide_permutations():
+    """Test that an invalid LSH layout is rejected"""
+    with pytest.raises(ValueError):
+        PatternDetector(num_perm=32, bands=5)
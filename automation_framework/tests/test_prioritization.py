@@ -0,0 +1,78 @@
+import json
+from types import SimpleNamespace
+from automation_framework.src.execution.prioritization import FailureHistory, TrueBugBudget, prioritize
+
+def _history(tmp_path, run, tests):
+    path = tmp_path / "failure_history.json"
+    path.write_text(json.dumps({"run": run, "tests": tests}))
+    return FailureHistory(path)
+
+def _failed_call(nodeid):
+    crash = SimpleNamespace(message="AssertionError: boom\nmore detail")
+    return SimpleNamespace(nodeid=nodeid, when="call", failed=True, longrepr=SimpleNamespace(reprcrash=crash))
+
+def test_priority_decays_with_age_and_grows_with_true_bug_probability(tmp_path):
+    """Test that recent failures and likely true bugs score highest"""
+    history = _history(tmp_path, 5, {
+        "recent_bug": {"failures": 1, "last_failed_run": 5, "probability_true_bug": 0.9},
+        "recent_flake": {"failures": 3, "last_failed_run": 5, "probability_true_bug": 0.1},
+        "old_bug": {"failures": 1, "last_failed_run": 3, "probability_true_bug": 0.9}
+    })
+
+    assert history.priority("recent_bug")[0] == 1.9
+    assert history.priority("recent_flake")[0] == 1.1
+    assert history.priority("old_bug")[0] == 1.9 * FailureHistory.DECAY ** 2
+    assert history.priority("never_failed") == (0.0, None)
+
+def test_prioritize_moves_failing_tests_first_and_keeps_the_rest_in_order(tmp_path):
+    """Test that the sort is stable for tests without recent failures"""
+    history = _history(tmp_path, 2, {
+        "b": {"failures": 1, "last_failed_run": 1},
+        "d": {"failures": 1, "last_failed_run": 2, "probability_true_bug": 0.8}
+    })
+    items = [SimpleNamespace(nodeid=nodeid) for nodeid in "abcde"]
+
+    promoted = prioritize(items, history)
+
+    assert [item.nodeid for item in items] == ["d", "b", "a", "c", "e"]
+    assert [nodeid for nodeid, _, _ in promoted] == ["d", "b"]
+
+def test_save_records_failures_and_forgets_old_ones(tmp_path):
+    """Test that a run is added to the history and entries older than MAX_AGE are dropped"""
+    history = _history(tmp_path, FailureHistory.MAX_AGE, {
+        "stale": {"failures": 1, "last_failed_run": 1}
+    })
+    history.pytest_runtest_logreport(_failed_call("new"))
+    history.record_analysis({"results": [{"test_name": "new", "analysis": {"probability_true_bug": 0.7}}]})
+    history.save()
+
+    saved = json.loads((tmp_path / "failure_history.json").read_text())
+    assert saved["run"] == FailureHistory.MAX_AGE + 1
+    assert list(saved["tests"]) == ["new"]
+    assert saved["tests"]["new"]["last_error"] == "AssertionError: boom"
+    assert saved["tests"]["new"]["probability_true_bug"] == 0.7
+
+def test_first_use_is_seeded_from_analysis(tmp_path):
+    """Test that an existing analysis.json seeds an empty history"""
+    (tmp_path / "analysis.json").write_text(json.dumps({"results": [
+        {"test_name": "t", "failure_data": {"error_message": "boom"}, "analysis": {"probability_true_bug": 0.6}}
+    ]}))
+    history = FailureHistory(tmp_path / "failure_history.json")
+
+    assert history.is_true_bug("t")
+    assert history.priority("t")[0] == 1.6
+
+def test_true_bug_budget_stops_the_session(tmp_path):
+    """Test that only failures of confirmed true bugs count against the budget"""
+    history = _history(tmp_path, 1, {
+        "bug": {"failures": 1, "last_failed_run": 1, "probability_true_bug": 0.9},
+        "flake": {"failures": 1, "last_failed_run": 1, "probability_true_bug": 0.2}
+    })
+    budget = TrueBugBudget(history, 1)
+    session = SimpleNamespace(shouldstop=False)
+    budget.pytest_sessionstart(session)
+
+    budget.pytest_runtest_logreport(_failed_call("flake"))
+    assert not session.shouldstop
+    budget.pytest_runtest_logreport(_failed_call("bug"))
+    assert session.shouldstop
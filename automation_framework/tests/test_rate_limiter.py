@@ -0,0 +1,80 @@
+from types import SimpleNamespace
+import pytest
+from automation_framework.src.ai_module.analyzers import rate_limiter
+from automation_framework.src.ai_module.analyzers.rate_limiter import RateLimiter, get_rate_limiter
+
+class FakeClock:
+    """Monotonic clock advanced by sleep() instead of waiting"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", SimpleNamespace(monotonic=clock.monotonic, sleep=clock.sleep))
+    return clock
+
+def test_unlimited_limiter_never_waits(clock):
+    """Test that a limiter without budgets hands out requests immediately"""
+    limiter = RateLimiter()
+    for _ in range(100):
+        limiter.acquire(tokens=10000)
+    assert clock.slept == []
+
+def test_request_budget_allows_a_burst_then_waits_for_refill(clock):
+    """Test that requests beyond the per-minute budget wait for the bucket to refill"""
+    limiter = RateLimiter(requests_per_minute=60)
+    for _ in range(60):
+        limiter.acquire()
+    assert clock.slept == []
+
+    limiter.acquire()
+    assert sum(clock.slept) == pytest.approx(1.0)
+    assert limiter.stats["waits"] == 1
+
+def test_token_budget_waits_for_the_missing_tokens(clock):
+    """Test that a request waits until its estimated tokens fit the budget"""
+    limiter = RateLimiter(tokens_per_minute=6000)
+    limiter.acquire(tokens=6000)
+    limiter.acquire(tokens=1000)
+    assert sum(clock.slept) == pytest.approx(10.0)
+
+def test_request_larger_than_the_budget_waits_for_a_full_bucket(clock):
+    """Test that an oversized request does not wait forever"""
+    limiter = RateLimiter(tokens_per_minute=1000)
+    limiter.acquire(tokens=500)
+    limiter.acquire(tokens=5000)
+    assert sum(clock.slept) == pytest.approx(30.0)
+
+def test_adjust_charges_the_actual_usage(clock):
+    """Test that underestimated requests reduce the remaining token budget"""
+    limiter = RateLimiter(tokens_per_minute=6000)
+    limiter.acquire(tokens=1000)
+    limiter.adjust(estimated=1000, actual=6000)
+    limiter.acquire(tokens=600)
+    assert sum(clock.slept) == pytest.approx(6.0)
+
+def test_pause_holds_back_every_caller(clock):
+    """Test that a 429 pause delays the next request even with budget left"""
+    limiter = RateLimiter(requests_per_minute=600)
+    limiter.pause(5.0)
+    limiter.acquire()
+    assert sum(clock.slept) == pytest.approx(5.0)
+    assert limiter.stats["throttled"] == 1
+
+def test_limiters_are_shared_per_provider(monkeypatch):
+    """Test that analyzers of the same provider share one limiter"""
+    monkeypatch.setattr(rate_limiter, "_limiters", {})
+    first = get_rate_limiter("openai", 60, 1000)
+    assert get_rate_limiter("openai") is first
+    assert get_rate_limiter("deepseek") is not first
+    assert first.requests_per_minute == 60
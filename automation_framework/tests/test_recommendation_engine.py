@@ -0,0 +1,109 @@
+import json
+import pytest
+from automation_framework.src.ai_module.analyzers.recommendation_engine import SOURCE, RecommendationEngine
+
+TRACE = '''Traceback (most recent call last):
+  File "/repo/tests/test_checkout.py", line 20, in test_checkout
+    page.pay()
+  File "/repo/pages/checkout_page.py", line 31, in pay
+    self.click(self.PAY_BUTTON)
+'''
+
+MESSAGE = ("Message: element click intercepted: Element <button id=pay> is not clickable at point (120, 340). "
+           "Other element would receive the click: <div class=overlay-spinner>")
+
+def _failure(message=MESSAGE, test_name="test_checkout", timestamp="2026-10-01T10:00:00"):
+    return {"test_name": test_name, "error_type": "ElementClickInterceptedException",
+            "error_message": message, "stack_trace": TRACE, "timestamp": timestamp}
+
+ANALYSIS = {"probability_true_bug": 0.1, "category": "Timing", "confidence": 0.9,
+            "reasoning": "Spinner overlay", "suggested_fix": "Wait for the spinner to disappear"}
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "failure_index.jsonl"
+
+def test_add_merges_failures_with_the_same_fingerprint(path):
+    """Test that repeats of a failure share one entry with their tests and fixes"""
+    engine = RecommendationEngine(path)
+    engine.add(_failure(test_name="test_a"), ANALYSIS)
+    entry = engine.add(_failure(test_name="test_b", timestamp="2026-10-02T10:00:00"),
+                       dict(ANALYSIS, suggested_fix="Close the overlay"))
+
+    assert len(engine.entries) == 1
+    assert entry["occurrences"] == 2
+    assert entry["tests"] == ["test_b", "test_a"]
+    assert entry["fixes"] == ["Close the overlay", "Wait for the spinner to disappear"]
+    assert entry["last_seen"] == "2026-10-02T10:00:00"
+
+def test_errors_and_reused_verdicts_are_not_recorded(path):
+    """Test that only fresh model verdicts become the analysis of an entry"""
+    engine = RecommendationEngine(path)
+    assert engine.add(_failure(), {"error": "rate limited"})["analysis"] is None
+    assert engine.add(_failure(), dict(ANALYSIS, source=SOURCE))["analysis"] is None
+
+def test_similar_finds_near_duplicates_only(path):
+    """Test that a reworded failure matches and an unrelated one does not"""
+    engine = RecommendationEngine(path)
+    engine.add(_failure(), ANALYSIS)
+
+    matches = engine.similar(_failure(MESSAGE.replace("(120, 340)", "(98, 512)").replace("pay", "pay-now"),
+                                      test_name="test_other"))
+    assert len(matches) == 1
+    assert matches[0]["test_name"] == "test_checkout"
+    assert matches[0]["suggested_fixes"] == ["Wait for the spinner to disappear"]
+    assert 0.5 <= matches[0]["similarity"] < 1.0
+    assert engine.similar(_failure("Expected 'Welcome' in the flash message but got 'Invalid password'")) == []
+
+def test_known_analysis_reuses_the_past_verdict(path):
+    """Test that a similar enough past failure provides a marked copy of its verdict"""
+    engine = RecommendationEngine(path)
+    engine.add(_failure(), ANALYSIS)
+
+    reused = engine.known_analysis(_failure(test_name="test_again"), min_similarity=0.9)
+    assert reused["category"] == "Timing"
+    assert reused["source"] == SOURCE
+    assert reused["similar_failure"] == "test_checkout"
+    assert reused["similarity"] == 1.0
+    assert engine.known_analysis(_failure("A completely different failure of the login form"), 0.9) is None
+
+def test_save_appends_then_compacts(path):
+    """Test that saves append changed entries until superseded lines dominate the file"""
+    engine = RecommendationEngine(path)
+    engine.add(_failure(), ANALYSIS)
+    engine.save()
+    engine.add(_failure(), ANALYSIS)
+    engine.save()
+    assert len(path.read_text().splitlines()) == 2
+
+    engine._lines = 2000
+    engine.add(_failure(), ANALYSIS)
+    engine.save()
+    lines = path.read_text().splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["occurrences"] == 3
+    assert RecommendationEngine(path).entries[engine.entry_id(_failure())]["occurrences"] == 3
+
+def test_load_skips_a_truncated_last_line(path):
+    """Test that a run interrupted while appending does not lose the earlier entries"""
+    engine = RecommendationEngine(path)
+    engine.add(_failure(), ANALYSIS)
+    engine.save()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"id": "0123456789abcdef", "error_type": "Timeo')
+
+    reloaded = RecommendationEngine(path)
+    assert list(reloaded.entries) == [engine.entry_id(_failure())]
+    assert reloaded.similar(_failure())[0]["similarity"] == 1.0
+
+def test_index_is_loaded_on_first_use(path, monkeypatch):
+    """Test that creating the engine and saving nothing do not read the index"""
+    loads = []
+    monkeypatch.setattr(RecommendationEngine, "_load", lambda self: loads.append(1))
+
+    engine = RecommendationEngine(path)
+    engine.save()
+    assert loads == []
+    engine.similar(_failure())
+    engine.similar(_failure())
+    assert loads == [1]
@@ -0,0 +1,151 @@
+import json
+from types import SimpleNamespace
+import pytest
+from automation_framework.src.execution.run_history import RunHistory
+
+def _report(nodeid, when="call", outcome="passed", duration=0.1, message=None):
+    crash = SimpleNamespace(message=message) if message else None
+    return SimpleNamespace(nodeid=nodeid, when=when, duration=duration, failed=outcome == "failed",
+                           skipped=outcome == "skipped", longrepr=SimpleNamespace(reprcrash=crash))
+
+def _run_test(history, nodeid, outcome="passed", when="call", duration=0.1):
+    """Report the setup, call and teardown of one test, failing or skipping in the given phase"""
+    for phase in ("setup", "call", "teardown"):
+        history.add_report(_report(nodeid, phase, outcome if phase == when else "passed", duration,
+                                   f"AssertionError: {nodeid} broke\nmore" if phase == when else None))
+
+def _record_run(history, outcomes):
+    history.start("staging", ["-q"])
+    for nodeid, outcome in outcomes.items():
+        _run_test(history, nodeid, outcome)
+    history.finish(0)
+
+def _analysis(*verdicts):
+    return {"metadata": {"model": "test-model"},
+            "results": [{"test_name": nodeid, "timestamp": "2026-10-01T10:00:00",
+                         "analysis": {"probability_true_bug": p, "category": "Timing"}} for nodeid, p in verdicts]}
+
+@pytest.fixture
+def history(tmp_path):
+    history = RunHistory(tmp_path / "history" / "run_history.db")
+    yield history
+    history.close()
+
+def _outcomes(history):
+    return {row["nodeid"]: dict(row) for row in history._connection.execute("SELECT * FROM outcomes")}
+
+def test_reports_are_combined_per_test(history):
+    """Test that phase reports give one outcome, duration and first failure line per test"""
+    history.start()
+    _run_test(history, "t_pass", duration=0.5)
+    _run_test(history, "t_fail", "failed")
+    _run_test(history, "t_error", "failed", when="setup")
+    _run_test(history, "t_skip", "skipped", when="setup")
+    history.finish(1)
+
+    outcomes = _outcomes(history)
+    assert {nodeid: row["outcome"] for nodeid, row in outcomes.items()} == {
+        "t_pass": "passed", "t_fail": "failed", "t_error": "error", "t_skip": "skipped"}
+    assert outcomes["t_pass"]["duration"] == pytest.approx(1.5)
+    assert outcomes["t_fail"]["message"] == "AssertionError: t_fail broke"
+    assert history.runs()[0]["failed"] == 2
+
+def test_outcomes_are_written_in_batches(history):
+    """Test that completed tests are buffered and written once a batch is full"""
+    history.BATCH_SIZE = 2
+    history.start()
+    _run_test(history, "a")
+    history.add_report(_report("b", "setup"))
+    assert _outcomes(history) == {}
+
+    history.add_report(_report("b", "teardown"))
+    assert sorted(_outcomes(history)) == ["a", "b"]
+
+def test_finish_keeps_tests_without_a_teardown(history):
+    """Test that tests of a crashed worker are still recorded"""
+    history.start()
+    history.add_report(_report("crashed", "call", "failed", message="worker 'gw0' crashed"))
+    history.finish(1)
+    assert _outcomes(history)["crashed"]["outcome"] == "failed"
+
+def test_stats_over_the_most_recent_runs(history):
+    """Test the failure and flakiness rates per test, skipping skips and older runs"""
+    for outcome in ["failed", "failed", "passed", "failed", "skipped", "passed"]:
+        _record_run(history, {"flaky": outcome, "stable": "passed"})
+
+    stats = history.test_stats()
+    assert stats["flaky"]["runs"] == 6
+    assert stats["flaky"]["failures"] == 3
+    assert stats["flaky"]["failure_rate"] == pytest.approx(3 / 5)
+    assert stats["flaky"]["flakiness_rate"] == pytest.approx(3 / 4)
+    assert stats["flaky"]["last_outcome"] == "passed"
+    assert stats["stable"]["flakiness_rate"] == 0.0
+    assert stats["stable"]["mean_duration"] == pytest.approx(0.3)
+
+    recent = history.test_stats(["flaky"], last_runs=3)
+    assert list(recent) == ["flaky"]
+    assert recent["flaky"]["runs"] == 3
+    assert recent["flaky"]["flakiness_rate"] == pytest.approx(1.0)
+    assert history.flakiness_rate("unknown") == 0.0
+    assert history.mean_duration("unknown") is None
+
+def test_stats_of_many_tests_are_queried_in_chunks(history):
+    """Test that node ID lists beyond SQLite's parameter limit are split"""
+    _record_run(history, {f"t{n}": "passed" for n in range(1200)})
+    assert len(history.test_stats([f"t{n}" for n in range(1200)])) == 1200
+
+def test_last_verdicts_take_the_latest_run_with_a_probability(history):
+    """Test that each test's verdict comes from its most recent analyzed run"""
+    _record_run(history, {"a": "failed", "b": "failed"})
+    history.record_analysis(_analysis(("a", 0.9), ("b", 0.2)))
+    _record_run(history, {"a": "failed", "b": "failed"})
+    history.record_analysis(_analysis(("a", 0.1), ("b", "n/a")))
+
+    verdicts = history.last_verdicts()
+    assert verdicts["a"]["probability_true_bug"] == 0.1
+    assert verdicts["a"]["run_id"] == history.run_id
+    assert verdicts["b"]["probability_true_bug"] == 0.2
+    assert history.test_stats(["b"])["b"]["last_verdict"]["probability_true_bug"] == 0.2
+    assert history.last_verdict("c") is None
+
+def test_record_analysis_replaces_the_runs_earlier_verdicts(history):
+    """Test that a second analysis in the same run, e.g. of late failures, replaces the first"""
+    _record_run(history, {"a": "failed", "b": "failed"})
+    history.record_analysis(_analysis(("a", 0.9), ("b", 0.8)))
+    history.record_analysis(_analysis(("b", 0.3)))
+
+    analysis = history.analysis()
+    assert [result["test_name"] for result in analysis["results"]] == ["b"]
+    assert analysis["metadata"] == {"model": "test-model"}
+    assert history.last_verdict("a") is None
+
+def test_exports_round_trip_failures_and_analysis(history, tmp_path):
+    """Test that failures.json and analysis.json are written back as recorded"""
+    failures = [{"test_name": "a", "error_type": "AssertionError", "error_message": "ünïcode",
+                 "timestamp": "2026-10-01T10:00:00"},
+                {"test_name": "b", "error_type": "TimeoutException", "error_message": "timed out",
+                 "timestamp": "2026-10-01T10:00:01"}]
+    history.start()
+    assert not history.export_analysis(tmp_path / "analysis.json")
+    for failure in failures:
+        history.add_failure(failure)
+    results = _analysis(("a", 0.9), ("b", 0.1))
+    history.record_analysis(results)
+
+    assert history.export_failures(tmp_path / "failures.json") == 2
+    lines = (tmp_path / "failures.json").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == failures
+    assert history.export_analysis(tmp_path / "analysis.json")
+    assert json.loads((tmp_path / "analysis.json").read_text()) == results
+    assert not (tmp_path / "analysis.tmp").exists()
+
+def test_history_survives_reopening(history, tmp_path):
+    """Test that runs recorded by one session are read by the next"""
+    _record_run(history, {"a": "failed"})
+    history.close()
+
+    reopened = RunHistory(tmp_path / "history" / "run_history.db")
+    _record_run(reopened, {"a": "passed"})
+    assert [run["failed"] for run in reopened.runs()] == [0, 1]
+    assert reopened.flakiness_rate("a") == 1.0
+    reopened.close()
@@ -0,0 +1,44 @@
+from types import SimpleNamespace
+import pytest
+from selenium import webdriver
+from automation_framework.src.web.drivers.service_manager import (
+    ChromiumServiceRemote, DriverServiceManager, ServiceRemote
+)
+
+@pytest.fixture
+def manager(monkeypatch):
+    """Service manager whose sessions are recorded instead of opened over HTTP"""
+    calls = []
+    monkeypatch.setattr(webdriver.Remote, "__init__",
+                        lambda self, command_executor=None, options=None: calls.append(command_executor))
+    monkeypatch.setattr(webdriver.Remote, "quit", lambda self: calls.append("quit"))
+    service = SimpleNamespace(service_url="http://localhost:9515", stop=lambda: calls.append("stop"))
+    manager = DriverServiceManager(enabled=True)
+    manager.calls = calls
+    monkeypatch.setattr(manager, "acquire", lambda *args: service)
+    monkeypatch.setattr(manager, "release", lambda released: calls.append("release"))
+    return manager
+
+@pytest.mark.parametrize("browser_type, options", [
+    ("chrome", webdriver.ChromeOptions()),
+    ("edge", webdriver.EdgeOptions())
+])
+def test_chromium_sessions_keep_cdp_commands(manager, browser_type, options):
+    """Test that Chromium sessions on a shared service can still send CDP commands"""
+    driver = manager.create_session(browser_type, None, None, options)
+
+    assert isinstance(driver, ChromiumServiceRemote)
+    assert hasattr(driver, "execute_cdp_cmd")
+    assert "/cdp/execute" in manager.calls[0]._commands["executeCdpCommand"][1]
+
+def test_quit_releases_the_shared_service(manager):
+    """Test that quitting a Chromium session returns the service instead of stopping it"""
+    manager.create_session("chrome", None, None, webdriver.ChromeOptions()).quit()
+    assert manager.calls[1:] == ["quit", "release"]
+
+def test_other_browsers_use_a_plain_remote_session(manager):
+    """Test that Firefox sessions are plain remote sessions on the service URL"""
+    driver = manager.create_session("firefox", None, None, webdriver.FirefoxOptions())
+
+    assert type(driver) is ServiceRemote
+    assert manager.calls == ["http://localhost:9515"]
@@ -0,0 +1,144 @@
+import threading
+import pytest
+from automation_framework.src.ai_module.analyzers.streaming_analyzer import StreamingAnalyzer
+
+class StubAnalyzer:
+    """Analyzer whose requests are answered locally and can be held until released"""
+
+    model = "test-model"
+    provider = "unit-test"
+
+    def __init__(self, batch_token_budget=None, max_concurrency=1, fail=False, detector=None):
+        self.batch_token_budget = batch_token_budget
+        self.max_concurrency = max_concurrency
+        self.pattern_detector = detector
+        self.fail = fail
+        self.known = {}
+        self.requests = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def analysis_key(self, failure_data):
+        return failure_data["error_message"]
+
+    def known_verdict(self, failure_data):
+        return self.known.get(failure_data["error_message"])
+
+    def local_verdict(self, failure_data):
+        return None
+
+    def _request(self, failures):
+        self.requests.append([failure["test_name"] for failure in failures])
+        self.started.set()
+        self.release.wait(5)
+        if self.fail:
+            raise RuntimeError("provider unavailable")
+
+    def analyze_failure(self, failure_data):
+        self._request([failure_data])
+        return {"category": "Timing", "test_name": failure_data["test_name"]}
+
+    def _pack_batches(self, failures):
+        return [failures[index:index + 10] for index in range(0, len(failures), 10)]
+
+    def _analyze_batched(self, failures):
+        self._request(failures)
+        return [{"analysis": {"category": "Timing", "test_name": failure["test_name"]}} for failure in failures]
+
+class PrefixDetector:
+    def similar(self, failure, other):
+        return failure["error_message"].split(":")[0] == other["error_message"].split(":")[0]
+
+def _failure(name, message=None):
+    return {"test_name": name, "error_message": message or f"{name} failed"}
+
+@pytest.fixture
+def held():
+    """Stub analyzer whose requests wait until the test releases them"""
+    analyzer = StubAnalyzer(batch_token_budget=4000)
+    analyzer.release.clear()
+    yield analyzer
+    analyzer.release.set()
+
+def test_submit_skips_duplicate_and_similar_failures():
+    """Test that a failure equal or similar to a submitted one is not analyzed again"""
+    analyzer = StubAnalyzer(detector=PrefixDetector())
+    streaming = StreamingAnalyzer(analyzer)
+    streaming.submit(_failure("test_a", "Timeout: #login"))
+    streaming.submit(_failure("test_b", "Timeout: #login"))
+    streaming.submit(_failure("test_c", "Timeout: #logout"))
+    streaming.submit(_failure("test_d", "AssertionError: total"))
+    assert streaming.wait(5) == 0
+    assert analyzer.requests == [["test_a"], ["test_d"]]
+    assert set(streaming.results()) == {"Timeout: #login", "AssertionError: total"}
+    assert streaming.stats["submitted"] == 4
+    assert streaming.stats["skipped"] == 2
+    assert streaming.stats["analyzed"] == 2
+    streaming.shutdown()
+
+def test_submit_skips_failures_with_known_verdicts():
+    """Test that a failure with a reusable verdict is left to the final analysis"""
+    analyzer = StubAnalyzer()
+    analyzer.known["test_a failed"] = {"category": "Timing"}
+    streaming = StreamingAnalyzer(analyzer)
+    streaming.submit(_failure("test_a"))
+    assert streaming.wait(5) == 0
+    assert analyzer.requests == []
+    assert streaming.results() == {}
+    assert streaming.stats["local"] == 1
+    streaming.shutdown()
+
+def test_drain_batches_failures_queued_while_busy(held):
+    """Test that failures recorded while the thread is busy are sent together"""
+    streaming = StreamingAnalyzer(held)
+    streaming.submit(_failure("test_a"))
+    assert held.started.wait(5)
+    for name in ("test_b", "test_c", "test_d"):
+        streaming.submit(_failure(name))
+    held.release.set()
+    assert streaming.wait(5) == 0
+    assert held.requests == [["test_a"], ["test_b", "test_c", "test_d"]]
+    assert streaming.results()["test_c failed"] == {"category": "Timing", "test_name": "test_c"}
+    assert streaming.stats["analyzed"] == 4
+    assert streaming.stats["batches"] == 1
+    streaming.shutdown()
+
+def test_wait_returns_the_unfinished_count_at_the_deadline(held):
+    """Test that wait() gives up at the timeout and reports the analyses still pending"""
+    streaming = StreamingAnalyzer(held)
+    streaming.submit(_failure("test_a"))
+    assert held.started.wait(5)
+    streaming.submit(_failure("test_b"))
+    assert streaming.wait(0.05) == 2
+    assert streaming.pending_keys == {"test_a failed", "test_b failed"}
+    assert streaming.results() == {}
+    held.release.set()
+    assert streaming.wait(5) == 0
+    assert streaming.pending_keys == set()
+    streaming.shutdown()
+
+def test_results_turns_failed_batches_into_error_analyses():
+    """Test that a request that raised gives an error analysis instead of raising from results()"""
+    analyzer = StubAnalyzer(batch_token_budget=4000, fail=True)
+    streaming = StreamingAnalyzer(analyzer)
+    streaming.submit(_failure("test_a"))
+    assert streaming.wait(5) == 0
+    results = streaming.results()
+    assert results["test_a failed"]["error"] == "Analysis failed: provider unavailable"
+    assert results["test_a failed"]["provider"] == "unit-test"
+    assert streaming.stats["errors"] == 1
+    assert streaming.stats["analyzed"] == 0
+    streaming.shutdown()
+
+def test_shutdown_cancels_queued_failures(held):
+    """Test that shutdown() drops the queued failures and results() leaves them out"""
+    streaming = StreamingAnalyzer(held)
+    streaming.submit(_failure("test_a"))
+    assert held.started.wait(5)
+    streaming.submit(_failure("test_b"))
+    streaming.shutdown()
+    held.release.set()
+    assert streaming.wait(5) == 0
+    assert set(streaming.results()) == {"test_a failed"}
+    assert held.requests == [["test_a"]]
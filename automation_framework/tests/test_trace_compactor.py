@@ -0,0 +1,91 @@
+from automation_framework.src.ai_module.analyzers.trace_compactor import (
+    compact_trace, estimate_tokens, fit_to_tokens, truncate_middle
+)
+
+SELENIUM_TRACE = '''Traceback (most recent call last):
+  File "/repo/venv/lib/python3.11/site-packages/_pytest/runner.py", line 341, in from_call
+    result: Optional[TResult] = func()
+  File "/repo/venv/lib/python3.11/site-packages/pluggy/_callers.py", line 102, in _multicall
+    res = hook_impl.function(*args)
+  File "/repo/examples/web_the_internet/tests/test_login.py", line 15, in test_valid_login
+    login_page.login("tomsmith", "SuperSecretPassword!")
+  File "/repo/examples/web_the_internet/pages/login_page.py", line 18, in login
+    self.click(self.LOGIN_BUTTON)
+  File "/repo/venv/lib/python3.11/site-packages/selenium/webdriver/support/wait.py", line 95, in until
+    value = method(self._driver)
+  File "/repo/venv/lib/python3.11/site-packages/selenium/webdriver/remote/webdriver.py", line 347, in execute
+    self.error_handler.check_response(response)
+  File "/repo/venv/lib/python3.11/site-packages/selenium/webdriver/remote/errorhandler.py", line 229, in check_response
+    raise exception_class(message, screen, stacktrace)
+selenium.common.exceptions.TimeoutException: Message: timed out
+Stacktrace:
+#0 0x55d0c5c2f8a3 <unknown>
+#1 0x55d0c5a5b8c6 <unknown>
+#2 0x55d0c5a9e2b1 <unknown>
+'''
+
+def test_compact_trace_keeps_project_frames_and_collapses_internal_ones():
+    """Test that test and page object frames stay while library frames collapse"""
+    compact = compact_trace(SELENIUM_TRACE)
+
+    assert "test_login.py\", line 15, in test_valid_login" in compact
+    assert "login_page.py\", line 18, in login" in compact
+    assert "... 2 pytest, pluggy frames hidden ..." in compact
+    assert "... 2 selenium frames hidden ..." in compact
+    assert "_pytest/runner.py" not in compact
+    assert len(compact) < len(SELENIUM_TRACE)
+
+def test_compact_trace_keeps_the_raising_frame():
+    """Test that the innermost frame is shown even inside a library"""
+    compact = compact_trace(SELENIUM_TRACE)
+    assert "errorhandler.py\", line 229, in check_response" in compact
+    assert compact.rstrip().endswith("[3 driver frames omitted]")
+
+def test_compact_trace_deduplicates_recursion():
+    """Test that repeated identical frames are reported once with a count"""
+    frame = '  File "/repo/pages/menu_page.py", line 7, in open_menu\n    return self.open_menu()\n'
+    trace = "Traceback (most recent call last):\n" + frame * 50 + "RecursionError: maximum recursion depth exceeded\n"
+    compact = compact_trace(trace)
+
+    assert compact.count("menu_page.py") == 1
+    assert "[Previous frame repeated 49 more times]" in compact
+    assert compact.rstrip().endswith("RecursionError: maximum recursion depth exceeded")
+
+def test_compact_trace_of_nothing_is_empty():
+    """Test that failures without a trace compact to an empty string"""
+    assert compact_trace(None) == ""
+    assert compact_trace("") == ""
+
+def test_truncate_middle_keeps_start_and_end():
+    """Test that lines are dropped from the middle, keeping the exception at the end"""
+    text = "\n".join(f"line {n}" for n in range(200)) + "\nValueError: the actual error"
+    truncated = truncate_middle(text, 300)
+
+    assert len(truncated) <= 300
+    assert truncated.startswith("line 0")
+    assert truncated.endswith("ValueError: the actual error")
+    assert "lines omitted" in truncated
+    assert truncate_middle("short", 300) == "short"
+
+def test_truncate_middle_cuts_a_single_long_line():
+    """Test that one line longer than the budget is cut rather than dropped"""
+    truncated = truncate_middle("x" * 1000, 200)
+    assert len(truncated) <= 200
+    assert truncated.startswith("x")
+
+def test_estimate_tokens_counts_words_digits_and_punctuation():
+    """Test the token estimate on the kinds of text in a stack trace"""
+    assert estimate_tokens("") == 0
+    assert estimate_tokens(None) == 0
+    assert estimate_tokens("word") == 1
+    assert estimate_tokens("selenium") == 2
+    assert estimate_tokens("123456") == 2
+    assert estimate_tokens("a.b") == 3
+    assert estimate_tokens("a b") == 2
+    assert estimate_tokens("a\n    b") == 3
+
+def test_fit_to_tokens_shortens_to_the_budget():
+    """Test that a long trace is cut until it fits the token budget"""
+    text = "\n".join(f'  File "/repo/tests/test_{n}.py", line {n}, in test_{n}' for n in range(300))
+    assert estimate_tokens(fit_to_tokens(text, 200)) <= 200
+    assert fit_to_tokens("short text", 200) == "short text"
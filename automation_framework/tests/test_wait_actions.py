@@ -0,0 +1,51 @@
+from unittest.mock import MagicMock
+import pytest
+from selenium.common.exceptions import JavascriptException, NoSuchWindowException, TimeoutException
+from selenium.webdriver.common.by import By
+from automation_framework.src.web.actions.wait_actions import WaitActions, WaitRecorder, dom_step
+
+STEPS = [dom_step("present", (By.ID, "finish"))]
+
+@pytest.fixture
+def driver():
+    driver = MagicMock(name="driver")
+    driver.timeouts.script = 30
+    driver.execute_async_script.return_value = {"ok": True}
+    return driver
+
+@pytest.fixture
+def wait(driver):
+    return WaitActions(driver, 10, recorder=WaitRecorder())
+
+def test_dom_wait_leaves_a_long_enough_script_timeout_alone(wait, driver):
+    """Test that no timeout is changed when the session's script timeout outlasts the wait"""
+    assert wait.until_dom(STEPS, timeout=10)
+    driver.set_script_timeout.assert_not_called()
+
+def test_dom_wait_raises_a_lowered_script_timeout_and_restores_it(wait, driver):
+    """Test that a session script timeout set below the wait is raised for it, then restored"""
+    driver.timeouts.script = 3
+    wait.until_dom(STEPS, timeout=10)
+    assert [c.args for c in driver.set_script_timeout.call_args_list] == [(15,), (3,)]
+
+def test_script_timeout_is_reported_without_polling(wait, driver):
+    """Test that an in-page wait that hit the script timeout fails instead of polling with no time left"""
+    driver.execute_async_script.side_effect = TimeoutException("script timeout")
+    with pytest.raises(TimeoutException, match="script timeout"):
+        wait.until_dom(STEPS, timeout=10)
+
+    driver.find_element.assert_not_called()
+    assert wait.recorder.totals["timeouts"] == 1
+
+def test_script_errors_fall_back_to_polling(wait, driver):
+    """Test that a page where the script cannot run is polled instead"""
+    driver.execute_async_script.side_effect = JavascriptException("document unloaded while waiting for result")
+    assert wait.until_dom(STEPS, timeout=10)
+    driver.find_element.assert_called_with(By.ID, "finish")
+
+def test_other_driver_errors_are_raised(wait, driver):
+    """Test that errors unrelated to the script, e.g. a closed window, are not polled away"""
+    driver.execute_async_script.side_effect = NoSuchWindowException("window closed")
+    with pytest.raises(NoSuchWindowException):
+        wait.until_dom(STEPS, timeout=10)
+    driver.find_element.assert_not_called()
@@ -2,8 +2,12 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from automation_framework.src.web.pages.base_page import BasePage
+from automation_framework.src.web.actions.wait_actions import dom_step
 
 class DynamicLoadingPage(BasePage):
+    # Resolve the loading sequence inside the page instead of polling it
+    WAIT_MODE = "dom"
+    
     # Locators
     START_BUTTON = (By.CSS_SELECTOR, "#start button")
     LOADING_INDICATOR = (By.ID, "loading")
@@ -15,7 +19,7 @@ class DynamicLoadingPage(BasePage):
         Args:
             example_number (int): Example number (1 or 2)
         """
-        self.driver.get(f"https://the-internet.herokuapp.com/dynamic_loading/{example_number}")
+        self.open(f"https://the-internet.herokuapp.com/dynamic_loading/{example_number}")
     
     def click_start(self):
         """Click the start button to trigger the loading."""
@@ -27,24 +31,14 @@ class DynamicLoadingPage(BasePage):
         Args:
             timeout (int): Maximum wait time in seconds
         """
-        try:
-            # Wait for loading indicator to appear first (to ensure we don't miss it)
-            WebDriverWait(self.driver, 2).until(
-                EC.visibility_of_element_located(self.LOADING_INDICATOR)
-            )
-        except:
-            # In case we missed the loading indicator, continue
-            pass
-        
-        # Then wait for it to disappear
-        WebDriverWait(self.driver, timeout).until(
-            EC.invisibility_of_element_located(self.LOADING_INDICATOR)
-        )
-        
-        # Finally, wait for the finish element to be visible
-        WebDriverWait(self.driver, timeout).until(
-            EC.visibility_of_element_located(self.FINISH_TEXT)
-        )
+        self.wait_for_sequence([
+            # Wait for loading indicator to appear first (skipped if we missed it)
+            dom_step("visible", self.LOADING_INDICATOR, timeout=2, optional=True),
+            # Then wait for it to disappear
+            dom_step("invisible", self.LOADING_INDICATOR),
+            # Finally, wait for the finish element to be visible
+            dom_step("visible", self.FINISH_TEXT)
+        ], timeout)
     
     def get_finish_text(self):
         """Get the text from the finish element.
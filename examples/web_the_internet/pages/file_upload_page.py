@@ -10,7 +10,7 @@ class FileUploadPage(BasePage):
     
     def navigate(self):
         """Navigate to the file upload page"""
-        self.driver.get("https://the-internet.herokuapp.com/upload")
+        self.open("https://the-internet.herokuapp.com/upload")
     
     def upload_file(self, file_path):
         """Upload a file
@@ -19,7 +19,7 @@ class FileUploadPage(BasePage):
             file_path (str): Absolute path to the file to upload
         """
         # Set the file path in the file input
-        self.find_element(self.FILE_UPLOAD_INPUT).send_keys(file_path)
+        self.send_keys(self.FILE_UPLOAD_INPUT, file_path)
         
         # Click the upload button
         self.click(self.UPLOAD_BUTTON)
@@ -12,7 +12,7 @@ class JavaScriptAlertsPage(BasePage):
     
     def navigate(self):
         """Navigate to the JavaScript Alerts page"""
-        self.driver.get("https://the-internet.herokuapp.com/javascript_alerts")
+        self.open("https://the-internet.herokuapp.com/javascript_alerts")
     
     def click_js_alert_button(self):
         """Click the button that triggers a JavaScript alert"""
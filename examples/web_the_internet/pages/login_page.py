@@ -10,7 +10,7 @@ class LoginPage(BasePage):
     ERROR_MESSAGE = (By.CSS_SELECTOR, ".flash.error")
     
     def navigate(self):
-        self.driver.get("https://the-internet.herokuapp.com/login")
+        self.open("https://the-internet.herokuapp.com/login")
     
     def login(self, username, password):
         self.enter_text(self.USERNAME_INPUT, username)
@@ -18,8 +18,12 @@ class LoginPage(BasePage):
         self.click(self.LOGIN_BUTTON)
     
     def is_login_successful(self):
-        # Return True/False instead of the WebElement
-        return self.is_element_visible(self.SUCCESS_MESSAGE) is not False
+        # Either flash message ends the wait, so a failed login returns without waiting out the timeout
+        outcome = self.wait_for_any({
+            "success": self.SUCCESS_MESSAGE,
+            "error": self.ERROR_MESSAGE
+        })
+        return outcome == "success"
     
     def get_error_message(self):
         return self.get_text(self.ERROR_MESSAGE)
\ No newline at end of file
@@ -52,4 +52,26 @@ class TestIFrame(WebTestBase):
         assert test_text in current_text, f"Text should remain after formatting. Expected '{test_text}' but got '{current_text}'"
         
         # Note: Verifying that text is actually bold would require checking HTML elements
-        # This would be a more advanced test case
\ No newline at end of file
+        # This would be a more advanced test case
+    
+    def test_iframe_editor_element_cache(self, browser):
+        """Test that cached editor elements are reused and re-located once stale"""
+        iframe_page = IFramePage(browser, cache_elements=True)
+        iframe_page.navigate()
+        
+        # The first read locates the iframe and the editor, the second reuses them
+        default_text = iframe_page.get_editor_text()
+        misses = iframe_page.cache_stats["misses"]
+        assert iframe_page.get_editor_text() == default_text
+        assert iframe_page.cache_stats["hits"] > 0, "Cached elements were not reused"
+        assert iframe_page.cache_stats["misses"] == misses, "Elements were located again"
+        
+        # Replace the editor body with a copy, so the cached element goes stale
+        with iframe_page.frame_context(IFramePage.IFRAME):
+            browser.execute_script(
+                "document.documentElement.replaceChild(document.body.cloneNode(true), document.body);"
+            )
+        
+        # The stale element is re-located and the read still succeeds
+        assert iframe_page.get_editor_text() == default_text
+        assert iframe_page.cache_stats["stale"] == 1, "Stale element was not re-located"
@@ -0,0 +1,99 @@
+# scripts/bench_batched_reads.py
+"""
+Micro-benchmark: BasePage.read_fields() (one execute_script call) versus
+per-locator reads (get_text + is_displayed + is_enabled + get_attribute per field)
+against a local static page.
+
+Usage:
+    python scripts/bench_batched_reads.py --browser chrome --fields 10 --iterations 20
+"""
+import argparse
+import functools
+import http.server
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Run as a plain script from any directory: make the repository root importable
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from selenium.webdriver.common.by import By
+from automation_framework.src.web.drivers.browser_factory import BrowserFactory
+from automation_framework.src.web.pages.base_page import BasePage
+
+def _write_page(directory, field_count):
+    """Write a static form page with field_count labelled inputs"""
+    rows = "\n".join(
+        f'<div><label id="label-{i}">Field {i}</label>'
+        f'<input id="field-{i}" name="field-{i}" value="value {i}"{" disabled" if i % 3 == 0 else ""}></div>'
+        for i in range(field_count)
+    )
+    page = Path(directory) / "fields.html"
+    page.write_text(f"<!DOCTYPE html><html><body><form>{rows}</form></body></html>", encoding="utf-8")
+    return page.name
+
+def _serve(directory):
+    """Serve a directory on a free localhost port in a background thread"""
+    handler = functools.partial(http.server.SimpleHTTPRequestHandler, directory=directory)
+    handler.log_message = lambda *args: None
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def _read_individually(page, locators):
+    results = {}
+    for name, locator in locators.items():
+        element = page.find_element(locator)
+        results[name] = {
+            "text": element.text,
+            "visible": element.is_displayed(),
+            "enabled": element.is_enabled(),
+            "attributes": {"value": element.get_attribute("value")}
+        }
+    return results
+
+def _read_batched(page, locators):
+    return page.read_fields(locators, attributes=("value",))
+
+def _measure(func, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark batched versus per-locator element reads')
+    parser.add_argument('--browser', default="chrome", help='Browser type')
+    parser.add_argument('--fields', type=int, default=10, help='Number of fields read per iteration')
+    parser.add_argument('--iterations', type=int, default=20, help='Iterations per measurement')
+    parser.add_argument('--headed', action='store_true', help='Run with a visible browser window')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        page_name = _write_page(tmp, args.fields)
+        server = _serve(tmp)
+        driver = BrowserFactory.get_browser(args.browser, headless=not args.headed)
+        try:
+            driver.get(f"http://127.0.0.1:{server.server_port}/{page_name}")
+            page = BasePage(driver)
+            locators = {f"field_{i}": (By.ID, f"field-{i}") for i in range(args.fields)}
+
+            # Warm up both paths once
+            _read_individually(page, locators)
+            _read_batched(page, locators)
+
+            individual = _measure(lambda: _read_individually(page, locators), args.iterations)
+            batched = _measure(lambda: _read_batched(page, locators), args.iterations)
+        finally:
+            driver.quit()
+            server.shutdown()
+
+    print(f"Reading {args.fields} fields ({args.browser}, {args.iterations} iterations)")
+    print(f"  per-locator reads : {individual * 1e3:8.2f} ms per page read")
+    print(f"  read_fields()     : {batched * 1e3:8.2f} ms per page read")
+    print(f"  speedup           : {individual / batched:8.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# scripts/bench_classifier.py
+"""
+Benchmark: training and prediction time of the local failure classifier, and its
+agreement with LLM verdicts on held-out failures (stored analysis.json files, or a
+synthetic corpus of typical Selenium failures when none are given).
+
+Usage:
+    python scripts/bench_classifier.py --analysis-files examples/*/test_results/analysis.json
+    python scripts/bench_classifier.py --synthetic 3000 --thresholds 0.5 0.8 0.9
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Run as a plain script from any directory: make the repository root importable
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from automation_framework.src.ai_module.models.classifier import FailureClassifier, load_verdicts
+from automation_framework.src.ai_module.train_classifier import format_report
+
+# (error type, message template, frames, category, probability_true_bug)
+TEMPLATES = [
+    ("TimeoutException", "Message: timed out after {n}s waiting for visibility of element located by "
+     "('id', '{field}')", ["wait.py:until", "base_page.py:wait_for_visible"], "Timing", 0.15),
+    ("NoSuchElementException", "Message: no such element: Unable to locate element: "
+     "{{\"method\":\"css selector\",\"selector\":\"#{field}\"}}", ["base_page.py:find"], "Locator", 0.35),
+    ("StaleElementReferenceException", "Message: stale element reference: element is not attached "
+     "to the page document", ["base_page.py:click"], "Synchronization", 0.1),
+    ("AssertionError", "assert '{field} total' == 'expected {field} total' where the cart shows {n} items",
+     ["test_cart.py:test_{field}"], "Functional Bug", 0.9),
+    ("AssertionError", "Expected status 200 but got 500 from /api/{field}", ["test_api.py:test_{field}"],
+     "Server Error", 0.85),
+    ("WebDriverException", "Message: unknown error: net::ERR_CONNECTION_REFUSED at localhost:{n}",
+     ["webdriver.py:get", "base_page.py:open"], "Environment", 0.05),
+    ("SessionNotCreatedException", "Message: session not created: This version of ChromeDriver only "
+     "supports Chrome version {n}", ["browser_factory.py:create_driver"], "Environment", 0.05),
+]
+FIELDS = ["username", "password", "checkout", "search", "price", "quantity", "login", "banner", "menu"]
+
+def _synthetic(count, noise, seed=7):
+    """Failures drawn from TEMPLATES, with a share of verdicts flipped to another template's"""
+    rng = random.Random(seed)
+    failures, verdicts = [], []
+    for i in range(count):
+        error_type, message, frames, category, probability = rng.choice(TEMPLATES)
+        field, n = rng.choice(FIELDS), rng.randrange(2, 120)
+        trace = "".join(f'  File "/src/{frame.split(":")[0]}", line {rng.randrange(1, 300)}, '
+                        f'in {frame.split(":")[1].format(field=field)}\n' for frame in frames)
+        failures.append({
+            "test_name": f"tests/test_{field}.py::test_case_{i}",
+            "error_type": error_type,
+            "error_message": message.format(field=field, n=n),
+            "stack_trace": f"Traceback (most recent call last):\n{trace}{error_type}: ..."
+        })
+        if rng.random() < noise:
+            _, _, _, category, probability = rng.choice(TEMPLATES)
+        verdicts.append({"probability_true_bug": min(1.0, max(0.0, probability + rng.uniform(-0.1, 0.1))),
+                         "category": category})
+    return failures, verdicts
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the local failure classifier')
+    parser.add_argument('--analysis-files', nargs='+', help='Stored analysis.json files with LLM verdicts')
+    parser.add_argument('--synthetic', type=int, default=2000,
+                        help='Synthetic failures used when no analysis files are given')
+    parser.add_argument('--noise', type=float, default=0.05, help='Share of inconsistent synthetic verdicts')
+    parser.add_argument('--holdout', type=float, default=0.2, help='Share of verdicts held back for evaluation')
+    parser.add_argument('--thresholds', type=float, nargs='+', default=[0.5, 0.8, 0.9],
+                        help='Escalation thresholds to report')
+    args = parser.parse_args()
+
+    if args.analysis_files:
+        failures, verdicts = load_verdicts(args.analysis_files)
+        print(f"{len(failures)} LLM verdicts from {len(args.analysis_files)} analysis files")
+    else:
+        failures, verdicts = _synthetic(args.synthetic, args.noise)
+        print(f"{len(failures)} synthetic failures, {args.noise:.0%} inconsistent verdicts")
+
+    order = list(range(len(failures)))
+    random.Random(1).shuffle(order)
+    held_out = max(1, int(len(order) * args.holdout))
+    test, train = order[:held_out], order[held_out:]
+
+    start = time.perf_counter()
+    classifier = FailureClassifier().fit([failures[i] for i in train], [verdicts[i] for i in train])
+    print(f"Trained on {len(train)} verdicts in {time.perf_counter() - start:.2f}s, "
+          f"{len(classifier.categories)} categories, {len(classifier.weights)} features")
+
+    for threshold in args.thresholds:
+        report = classifier.evaluate([failures[i] for i in test], [verdicts[i] for i in test], threshold)
+        print()
+        for line in format_report(report):
+            print(f"  {line}")
+
+if __name__ == "__main__":
+    main()
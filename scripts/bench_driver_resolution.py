@@ -0,0 +1,66 @@
+# scripts/bench_driver_resolution.py
+"""
+Benchmark driver binary resolution: webdriver-manager on every call versus
+DriverResolver (cold install, on-disk manifest hit, in-process memo hit).
+
+Usage:
+    python scripts/bench_driver_resolution.py --browser chrome --iterations 1000
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Run as a plain script from any directory: make the repository root importable
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from automation_framework.src.web.drivers.driver_resolver import DriverResolver
+
+def _timed(func, iterations=1):
+    """Return the mean duration of func() in seconds"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations
+
+def _format(seconds):
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.2f} us"
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark driver binary resolution')
+    parser.add_argument('--browser', default="chrome", help='Browser type to resolve')
+    parser.add_argument('--iterations', type=int, default=1000, help='Iterations for the memo hit measurement')
+    parser.add_argument('--manager-iterations', type=int, default=5,
+                        help='Iterations for the uncached webdriver-manager measurement')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manifest = Path(tmp) / "drivers.json"
+
+        manager = DriverResolver.MANAGERS[args.browser]
+        uncached = _timed(lambda: manager().install(), args.manager_iterations)
+
+        resolver = DriverResolver(manifest_path=manifest)
+        cold = _timed(lambda: resolver.resolve(args.browser))
+        memo = _timed(lambda: resolver.resolve(args.browser), args.iterations)
+
+        # A new process only has the manifest, not the memo
+        manifest_hit = _timed(
+            lambda: DriverResolver(manifest_path=manifest, offline=True).resolve(args.browser),
+            args.manager_iterations
+        )
+
+    print(f"Driver resolution for {args.browser}")
+    print(f"  webdriver-manager install() per call : {_format(uncached)}")
+    print(f"  DriverResolver cold (first call)     : {_format(cold)}")
+    print(f"  DriverResolver manifest hit (offline): {_format(manifest_hit)}")
+    print(f"  DriverResolver memo hit              : {_format(memo)}")
+    print(f"  Speedup memo vs install()            : {uncached / memo:,.0f}x")
+
+if __name__ == "__main__":
+    main()
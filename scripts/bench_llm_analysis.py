@@ -0,0 +1,147 @@
+# scripts/bench_llm_analysis.py
+"""
+Benchmark: FailureAnalyzer.analyze_failures() at several concurrency levels against
+a local fake OpenAI-compatible server with fixed latency and optional 429 responses.
+
+Usage:
+    python scripts/bench_llm_analysis.py --failures 40 --latency 0.5 --concurrency 1 2 4 8 16
+    python scripts/bench_llm_analysis.py --rate-limit-every 7   # answer every 7th request with a 429
+    python scripts/bench_llm_analysis.py --batch-tokens 4000    # pack failures into batched requests
+"""
+import argparse
+import http.server
+import json
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Run as a plain script from any directory: make the repository root importable
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from automation_framework.src.ai_module.analyzers import rate_limiter
+from automation_framework.src.ai_module.analyzers.failure_analyzer import FailureAnalyzer
+
+ANALYSIS = {
+    "probability_true_bug": 0.2,
+    "category": "Timing",
+    "subcategory": "Explicit wait timeout",
+    "confidence": 0.8,
+    "reasoning": "Element did not appear within the wait timeout",
+    "suggested_fix": "Wait for the loading indicator to disappear first"
+}
+
+def _make_handler(latency, rate_limit_every):
+    counter = {"requests": 0}
+    lock = threading.Lock()
+
+    class FakeOpenAIHandler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length))
+            with lock:
+                counter["requests"] += 1
+                throttled = rate_limit_every and counter["requests"] % rate_limit_every == 0
+
+            if throttled:
+                body = json.dumps({"error": {"message": "Rate limit reached", "type": "requests"}}).encode()
+                self.send_response(429)
+                self.send_header("Retry-After", "0.2")
+            else:
+                time.sleep(latency)
+                # Batch requests list their failures as '### Failure F<n>'
+                failure_ids = re.findall(r"### Failure (F\d+)", request["messages"][-1]["content"])
+                if failure_ids:
+                    content = json.dumps({"verdicts": [dict(ANALYSIS, failure_id=failure_id)
+                                                       for failure_id in failure_ids]})
+                else:
+                    content = json.dumps(ANALYSIS)
+                body = json.dumps({
+                    "id": "chatcmpl-bench",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": request["model"],
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop"
+                    }],
+                    "usage": {"prompt_tokens": 400, "completion_tokens": 80, "total_tokens": 480}
+                }).encode()
+                self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return FakeOpenAIHandler, counter
+
+def _failures(count):
+    return [{
+        "test_name": f"examples/web_the_internet/tests/test_dynamic_loading.py::test_case_{i}",
+        "error_type": "TimeoutException",
+        "error_message": f"Timed out after 10s waiting for visibility of ('id', 'finish') [{i}]",
+        "stack_trace": "Traceback (most recent call last):\n  ...",
+        "environment": "bench",
+        "test_duration": 10.2
+    } for i in range(count)]
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark concurrent LLM failure analysis')
+    parser.add_argument('--failures', type=int, default=40, help='Number of failures analyzed')
+    parser.add_argument('--latency', type=float, default=0.5, help='Fake server latency per request in seconds')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 2, 4, 8, 16],
+                        help='Concurrency levels to measure')
+    parser.add_argument('--rate-limit-every', type=int, default=0,
+                        help='Answer every Nth request with a 429 (0 disables)')
+    parser.add_argument('--rpm', type=int, help='Requests-per-minute limit of the analyzer')
+    parser.add_argument('--tpm', type=int, help='Tokens-per-minute limit of the analyzer')
+    parser.add_argument('--batch-tokens', type=int, help='Token budget of batched requests (default: no batching)')
+    args = parser.parse_args()
+
+    handler, counter = _make_handler(args.latency, args.rate_limit_every)
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    failures = _failures(args.failures)
+    print(f"Analyzing {args.failures} failures, {args.latency * 1e3:.0f} ms per request"
+          + (f", 429 on every {args.rate_limit_every}th request" if args.rate_limit_every else ""))
+
+    baseline = None
+    try:
+        for concurrency in args.concurrency:
+            config = {
+                "provider": f"bench-{concurrency}",
+                "api_key": "bench",
+                "model": "bench-model",
+                "base_url": f"http://127.0.0.1:{server.server_port}/v1",
+                "requests_per_minute": args.rpm,
+                "tokens_per_minute": args.tpm,
+                "backoff_initial": 0.1
+            }
+            analyzer = FailureAnalyzer(config, max_concurrency=concurrency, batch_token_budget=args.batch_tokens)
+
+            counter["requests"] = 0
+            start = time.perf_counter()
+            results = analyzer.analyze_failures(failures)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+
+            errors = sum(1 for r in results["results"] if "error" in r["analysis"])
+            in_order = [r["test_name"] for r in results["results"]] == [f["test_name"] for f in failures]
+            limiter = rate_limiter.get_rate_limiter(config["provider"])
+            print(f"  concurrency {concurrency:3d}: {elapsed:7.2f}s  speedup {baseline / elapsed:5.1f}x  "
+                  f"requests {counter['requests']:4d}  throttled {limiter.stats['throttled']:3d}  "
+                  f"errors {errors}  order kept: {in_order}")
+            print(f"    transport: {analyzer.transport.summary()}")
+    finally:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
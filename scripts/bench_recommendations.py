@@ -0,0 +1,100 @@
+# scripts/bench_recommendations.py
+"""
+Benchmark: RecommendationEngine indexing, persistence and lookup latency at a given
+index size, with the recall of near-duplicate lookups (one word of an indexed message
+changed) and the share of novel failures wrongly reported as seen before.
+
+Usage:
+    python scripts/bench_recommendations.py --records 100000 --queries 1000
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Run as a plain script from any directory: make the repository root importable
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from automation_framework.src.ai_module.analyzers.recommendation_engine import RecommendationEngine
+
+ERROR_TYPES = ["TimeoutException", "NoSuchElementException", "AssertionError",
+               "StaleElementReferenceException", "WebDriverException", "ElementClickInterceptedException"]
+
+def _failure(rng, vocabulary, index):
+    words = rng.sample(vocabulary, rng.randrange(8, 16))
+    frames = "".join(f'  File "/src/pages/{rng.choice(vocabulary)}_page.py", line {rng.randrange(1, 400)}, '
+                     f'in {rng.choice(vocabulary)}\n' for _ in range(3))
+    return {
+        "test_name": f"tests/test_{words[0]}.py::test_{index}",
+        "error_type": rng.choice(ERROR_TYPES),
+        "error_message": " ".join(words),
+        "stack_trace": f"Traceback (most recent call last):\n{frames}"
+    }
+
+def _near_duplicate(rng, vocabulary, failure):
+    words = failure["error_message"].split()
+    words[rng.randrange(len(words))] = rng.choice(vocabulary)
+    return dict(failure, error_message=" ".join(words), test_name=failure["test_name"] + "_rerun")
+
+def _percentile(values, share):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * share))]
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the failure similarity index')
+    parser.add_argument('--records', type=int, default=100000, help='Distinct failures indexed')
+    parser.add_argument('--queries', type=int, default=1000, help='Lookups measured')
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    vocabulary = [f"w{i}" for i in range(5000)]
+    failures = [_failure(rng, vocabulary, i) for i in range(args.records)]
+    analysis = {"probability_true_bug": 0.2, "category": "Timing", "suggested_fix": "Wait for the overlay"}
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "failure_index.jsonl"
+        engine = RecommendationEngine(path)
+        start = time.perf_counter()
+        for failure in failures:
+            engine.add(failure, analysis)
+        print(f"Indexed {args.records} failures in {time.perf_counter() - start:.1f}s")
+
+        start = time.perf_counter()
+        engine.save()
+        print(f"Saved in {time.perf_counter() - start:.2f}s ({path.stat().st_size / 1e6:.1f} MB)")
+
+        start = time.perf_counter()
+        engine = RecommendationEngine(path)
+        # The index is loaded on first access
+        entries = len(engine.entries)
+        print(f"Loaded {entries} entries in {time.perf_counter() - start:.2f}s")
+
+        # Incremental save of one run
+        for failure in rng.sample(failures, 50):
+            engine.add(failure, analysis)
+        start = time.perf_counter()
+        engine.save()
+        print(f"Incremental save of 50 failures in {(time.perf_counter() - start) * 1e3:.1f} ms")
+
+        latencies, found, false_matches = [], 0, 0
+        for i in range(args.queries):
+            original = rng.choice(failures)
+            near = i % 2 == 0
+            query = _near_duplicate(rng, vocabulary, original) if near else _failure(rng, vocabulary, -i)
+            start = time.perf_counter()
+            matches = engine.similar(query, limit=5, min_similarity=0.5)
+            latencies.append((time.perf_counter() - start) * 1e3)
+            if near:
+                found += any(match["id"] == engine.entry_id(original) for match in matches)
+            else:
+                false_matches += bool(matches)
+
+    half = args.queries / 2
+    print(f"Lookup latency: p50 {_percentile(latencies, 0.5):.2f} ms, p95 {_percentile(latencies, 0.95):.2f} ms, "
+          f"max {max(latencies):.2f} ms")
+    print(f"Near-duplicate recall: {found / half:.1%}, novel failures matched: {false_matches / half:.1%}")
+
+if __name__ == "__main__":
+    main()